@@ -0,0 +1,261 @@
+"""
+Snapshot backups for iOS Spec-Driven Toolkit
+
+Every backup is a complete copy of the config directory, but files that are
+unchanged since the previous backup are hardlinks to it (like rsync
+--link-dest), so a backup costs the time and space of what changed rather
+than of the whole tree (specs/ included).
+"""
+
+import os
+import re
+import shutil
+import stat
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+# Backups kept per target and IDE when the caller does not say
+DEFAULT_KEEP_BACKUPS = 5
+
+BACKUP_TIME_FORMAT = '%Y%m%d_%H%M%S'
+
+# Timestamp, plus a counter when two backups are taken in the same second
+_BACKUP_SUFFIX = re.compile(r'(\d{8}_\d{6})(?:_(\d+))?')
+
+
+class Backup(NamedTuple):
+    """A backup directory and when it was taken"""
+    path: Path
+    created: datetime
+
+
+class SnapshotStats(NamedTuple):
+    """How a backup was built"""
+    linked: int  # hardlinked to the previous backup
+    copied: int
+
+
+def backup_prefix(ide: str) -> str:
+    """Name prefix of backup directories, e.g. '.claude.backup.'"""
+    return f'.{ide}.backup.'
+
+
+def _backups(target_dir: Path, ide: str) -> List[Tuple[datetime, int, Path]]:
+    """(timestamp, counter, path) of every backup, oldest first"""
+    prefix = backup_prefix(ide)
+    backups = []
+    try:
+        entries = list(os.scandir(target_dir))
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.name.startswith(prefix) or not entry.is_dir(follow_symlinks=False):
+            continue
+        match = _BACKUP_SUFFIX.fullmatch(entry.name[len(prefix):])
+        if match is None:
+            continue
+        try:
+            created = datetime.strptime(match.group(1), BACKUP_TIME_FORMAT)
+        except ValueError:
+            continue
+        backups.append((created, int(match.group(2) or 0), Path(entry.path)))
+    backups.sort()
+    return backups
+
+
+def list_backups(target_dir: Path, ide: str) -> List[Backup]:
+    """Return the backups of one IDE config directory, oldest first
+    
+    Directories whose name is not a backup timestamp (such as a backup
+    still being written) are skipped.
+    """
+    return [Backup(path, created) for created, _, path in _backups(target_dir, ide)]
+
+
+def _unchanged(st: os.stat_result, previous: os.stat_result) -> bool:
+    return st.st_size == previous.st_size and st.st_mtime_ns == previous.st_mtime_ns
+
+
+def _raise(error: OSError):
+    raise error
+
+
+def _special_files(directory: str, names: List[str]) -> List[str]:
+    """copytree ignore callback: names that are not files, symlinks or dirs
+    
+    Sockets, FIFOs and devices (e.g. a daemon's socket) cannot be copied.
+    """
+    ignored = []
+    for name in names:
+        mode = os.lstat(os.path.join(directory, name)).st_mode
+        if not (stat.S_ISREG(mode) or stat.S_ISLNK(mode) or stat.S_ISDIR(mode)):
+            ignored.append(name)
+    return ignored
+
+
+def snapshot(source: Path, backup_dir: Path, previous: Optional[Path] = None) -> SnapshotStats:
+    """Copy source to backup_dir, hardlinking files unchanged since previous
+    
+    A file counts as unchanged when its size and mtime match the previous
+    backup's copy; copies keep their mtime so the next backup can compare
+    against them. Live files are never linked: installs and editors write
+    them in place, which would change the backup too.
+    
+    Symlinks (to files or directories) are copied as symlinks and never
+    followed. Sockets, FIFOs and devices are left out.
+    
+    The tree is built under a temporary name and renamed into place, so an
+    interrupted backup never becomes the base of the next one.
+    
+    Args:
+        source: Directory to back up
+        backup_dir: New backup directory (must not exist)
+        previous: Earlier backup of the same directory to link against
+    
+    Returns:
+        SnapshotStats
+    
+    Raises:
+        FileExistsError: If backup_dir exists
+    """
+    if backup_dir.exists():
+        raise FileExistsError(backup_dir)
+    
+    staging = backup_dir.with_name(f'{backup_dir.name}.partial-{os.getpid()}')
+    linked = copied = 0
+    try:
+        # An unreadable directory fails the backup rather than leaving it out
+        for directory, dirnames, filenames in os.walk(source, onerror=_raise):
+            relative = Path(directory).relative_to(source)
+            (staging / relative).mkdir(parents=True, exist_ok=True)
+            # os.walk lists symlinked directories with the directories; copy
+            # them as links instead of leaving them out
+            links = [name for name in dirnames if os.path.islink(os.path.join(directory, name))]
+            dirnames[:] = [name for name in dirnames if name not in links]
+            for name in filenames + links:
+                src = Path(directory) / name
+                dst = staging / relative / name
+                try:
+                    st = src.lstat()
+                except FileNotFoundError:
+                    continue  # removed since the directory was listed
+                if stat.S_ISLNK(st.st_mode):
+                    os.symlink(os.readlink(src), dst)
+                    copied += 1
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue  # socket, FIFO or device
+                if previous is not None:
+                    base = previous / relative / name
+                    try:
+                        base_st = base.lstat()
+                        if stat.S_ISREG(base_st.st_mode) and _unchanged(st, base_st):
+                            os.link(base, dst)
+                            linked += 1
+                            continue
+                    except OSError:
+                        pass  # no previous copy, or no hardlinks here: copy
+                shutil.copy2(src, dst)
+                copied += 1
+        staging.rename(backup_dir)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    return SnapshotStats(linked, copied)
+
+
+def new_backup_dir(target_dir: Path, ide: str, now: Optional[datetime] = None) -> Path:
+    """Return a new backup directory name for the current time
+    
+    Backups taken within the same second get a counter after the
+    timestamp that is above every existing one, so the name of a pruned
+    backup is never reused out of order.
+    """
+    stamp = (now or datetime.now()).strftime(BACKUP_TIME_FORMAT)
+    counters = [
+        counter for created, counter, _ in _backups(target_dir, ide)
+        if created.strftime(BACKUP_TIME_FORMAT) == stamp
+    ]
+    counter = max(counters) + 1 if counters else 0
+    while True:
+        name = f'{backup_prefix(ide)}{stamp}' + (f'_{counter}' if counter else '')
+        if not (target_dir / name).exists():
+            return target_dir / name
+        counter += 1
+
+
+def prune_backups(
+    target_dir: Path,
+    ide: str,
+    keep: Optional[int] = DEFAULT_KEEP_BACKUPS,
+    max_age: Optional[timedelta] = None,
+    now: Optional[datetime] = None,
+) -> List[Path]:
+    """Delete old backups, always keeping the newest one
+    
+    Removing a backup never affects the others: hardlinked files stay on
+    disk until their last link is gone.
+    
+    Args:
+        target_dir: Directory holding the backups
+        ide: IDE whose backups to prune
+        keep: Number of newest backups to keep (None: no limit)
+        max_age: Delete backups older than this (None: no limit)
+        now: Reference time for max_age (default: now)
+    
+    Returns:
+        Deleted backup directories
+    """
+    backups = list_backups(target_dir, ide)
+    if not backups:
+        return []
+    
+    now = now or datetime.now()
+    removed = []
+    for index, backup in enumerate(backups[:-1]):
+        too_many = keep is not None and len(backups) - index > keep
+        too_old = max_age is not None and now - backup.created > max_age
+        if too_many or too_old:
+            shutil.rmtree(backup.path)
+            removed.append(backup.path)
+    return removed
+
+
+def restore_snapshot(backup_dir: Path, target: Path):
+    """Replace target with a copy of backup_dir
+    
+    Files are copied, not linked, so editing restored files leaves the
+    backups alone; symlinks stay symlinks, and sockets, FIFOs and devices
+    are left out. The copy is built next to target and swapped in, so a
+    failed restore leaves target as it was.
+    
+    Args:
+        backup_dir: Backup to restore
+        target: Config directory to replace
+    
+    Raises:
+        FileNotFoundError: If backup_dir does not exist
+    """
+    if not backup_dir.is_dir():
+        raise FileNotFoundError(backup_dir)
+    
+    pid = os.getpid()
+    staging = target.with_name(f'{target.name}.restore-{pid}')
+    replaced = target.with_name(f'{target.name}.replaced-{pid}')
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        shutil.copytree(backup_dir, staging, symlinks=True, ignore=_special_files)
+        had_target = target.exists()
+        if had_target:
+            target.rename(replaced)
+        try:
+            staging.rename(target)
+        except OSError:
+            if had_target:
+                replaced.rename(target)
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(replaced, ignore_errors=True)
@@ -1,27 +1,115 @@
 #!/usr/bin/env python3
 """
 iOS Spec-Driven Toolkit CLI
+
+Startup matters: provisioning scripts run `status` across hundreds of
+repositories. rich and the package metadata lookup are only imported by
+the commands that use them, and --plain output never loads rich.
 """
 
+import re
+import sys
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from pathlib import Path
-from .installer import Installer
-import importlib.metadata
+from .backups import DEFAULT_KEEP_BACKUPS
+from .installer import DEFAULT_COPY_WORKERS, Installer, install_many, verify_many
+from .scanner import DEFAULT_SCAN_DEPTH, DEFAULT_SCAN_WORKERS
+
+# Set by --plain before any command prints
+_plain_output = False
 
-console = Console()
+# rich markup tags such as [bold cyan], [/dim] or [/]
+_MARKUP_PATTERN = re.compile(r'\[/?[a-z#@/][^\[\]]*\]')
 
-# Get version from package metadata
-try:
-    __version__ = importlib.metadata.version("ios-spec-driven-installer")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "unknown"
+def _version() -> str:
+    """Toolkit version, as recorded in install manifests
+    
+    Read from the package instead of importlib.metadata, whose import and
+    distribution scan cost more than the rest of `--version`.
+    """
+    from . import __version__
+    return __version__
+
+class _PlainTable:
+    """Stand-in for rich.table.Table printed as tab-separated lines"""
+    
+    def __init__(self, **kwargs):
+        self.columns = []
+        self.rows = []
+    
+    def add_column(self, header, **kwargs):
+        self.columns.append(header)
+    
+    def add_row(self, *cells):
+        self.rows.append(cells)
+    
+    def __str__(self):
+        lines = ['\t'.join(self.columns)]
+        lines += ['\t'.join(str(cell) for cell in row) for row in self.rows]
+        return '\n'.join(lines)
+
+class _PlainStatus:
+    """Stand-in for rich's status spinner: prints nothing"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def update(self, *args, **kwargs):
+        pass
+
+class _PlainConsole:
+    """Stand-in for rich.console.Console writing plain text (no rich import)"""
+    
+    def print(self, *objects, **kwargs):
+        text = ' '.join(str(obj) for obj in objects)
+        click.echo(_MARKUP_PATTERN.sub('', text))
+    
+    def status(self, *args, **kwargs):
+        return _PlainStatus()
+
+class _LazyConsole:
+    """Creates the console on first use: rich, or plain text with --plain"""
+    
+    _console = None
+    
+    def __getattr__(self, name):
+        if self._console is None:
+            if _plain_output:
+                self._console = _PlainConsole()
+            else:
+                from rich.console import Console
+                self._console = Console()
+        return getattr(self._console, name)
+
+console = _LazyConsole()
+
+def _table(**kwargs):
+    if _plain_output:
+        return _PlainTable(**kwargs)
+    from rich.table import Table
+    return Table(**kwargs)
+
+def _panel(text, **kwargs):
+    if _plain_output:
+        return text
+    from rich.panel import Panel
+    return Panel.fit(text, **kwargs)
+
+def _print_version(ctx, param, value):
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"{ctx.find_root().info_name}, version {_version()}")
+    ctx.exit()
 
 @click.group()
-@click.version_option(version=__version__)
-def main():
+@click.option('--version', is_flag=True, expose_value=False, is_eager=True,
+              callback=_print_version, help='Show the version and exit.')
+@click.option('--plain', is_flag=True, envvar='IOS_SPEC_DRIVEN_PLAIN',
+              help='Plain text output (no colors, tables as tab-separated lines)')
+def main(plain):
     """iOS Spec-Driven Development Toolkit Installer
     
     Install the complete toolkit for spec-driven iOS development.
@@ -29,17 +117,54 @@ def main():
     Examples:
         ios-spec-driven install
         ios-spec-driven install /path/to/project
+        ios-spec-driven install-many --from-file repos.txt
         ios-spec-driven status
+        ios-spec-driven --plain status ~/MyiOSApp
+        ios-spec-driven verify
+        ios-spec-driven scan ~/Developer
+        ios-spec-driven restore --list
         ios-spec-driven uninstall
     """
-    pass
+    global _plain_output
+    _plain_output = plain
+
+def _backup_age(days):
+    """--max-backup-age in days as a timedelta (None: no limit)"""
+    if days is None:
+        return None
+    from datetime import timedelta
+    return timedelta(days=days)
+
+def _backup_options(command):
+    """Retention options shared by install and install-many"""
+    command = click.option('--max-backup-age', type=click.IntRange(min=1), metavar='DAYS',
+                           help='Also delete backups older than DAYS')(command)
+    command = click.option('--keep-backups', type=click.IntRange(min=1), default=DEFAULT_KEEP_BACKUPS,
+                           show_default=True, help='Backups kept per target and IDE')(command)
+    return command
+
+def _read_targets(targets, targets_file):
+    """Targets from arguments plus --from-file (skipping blanks and # comments)"""
+    target_dirs = list(targets)
+    if targets_file:
+        for line in targets_file:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                target_dirs.append(line)
+    return target_dirs
 
 @main.command()
 @click.argument('target_dir', type=click.Path(), default='.')
 @click.option('--ide', type=click.Choice(['claude', 'opencode']), help='Target IDE (claude or opencode)')
 @click.option('--no-backup', is_flag=True, help='Skip backup of existing files')
 @click.option('--force', is_flag=True, help='Force overwrite without confirmation')
-def install(target_dir, ide, no_backup, force):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_COPY_WORKERS,
+              show_default=True, help='Files copied concurrently')
+@click.option('--no-cache', is_flag=True, help='Render templates instead of using the template cache')
+@click.option('--clean', is_flag=True,
+              help='Delete the config directory first, including specs/ and other user files')
+@_backup_options
+def install(target_dir, ide, no_backup, force, jobs, no_cache, clean, keep_backups, max_backup_age):
     """Install the toolkit to TARGET_DIR (default: current directory)
     
     This will install:
@@ -49,17 +174,26 @@ def install(target_dir, ide, no_backup, force):
     - Guides (component format, PBT, parallel execution)
     - Config (IDE-specific configuration)
     
+    Re-installing only rewrites files that changed and removes files the
+    toolkit no longer ships; specs/ and other user files are kept.
+    
+    The existing config directory is backed up first. Files unchanged
+    since the previous backup are hardlinked to it, and only the newest
+    --keep-backups backups are kept (see `restore`).
+    
     Examples:
         ios-spec-driven install
         ios-spec-driven install --ide claude
         ios-spec-driven install --ide opencode
         ios-spec-driven install ~/MyiOSApp
         ios-spec-driven install --no-backup
+        ios-spec-driven install --jobs 16 /mnt/nfs/MyiOSApp
+        ios-spec-driven install --clean --force
     """
     
-    console.print(Panel.fit(
+    console.print(_panel(
         "[bold blue]🚀 iOS Spec-Driven Toolkit Installer[/bold blue]\n"
-        f"[dim]Version {__version__}[/dim]",
+        f"[dim]Version {_version()}[/dim]",
         border_style="blue"
     ))
     
@@ -74,7 +208,10 @@ def install(target_dir, ide, no_backup, force):
         console.print(f"\n[green]✓[/green] Selected: {ide.title()}\n")
     
     target_path = Path(target_dir).resolve()
-    installer = Installer(target_path, ide=ide, backup=not no_backup)
+    installer = Installer(
+        target_path, ide=ide, backup=not no_backup, workers=jobs, use_cache=not no_cache,
+        keep_backups=keep_backups, max_backup_age=_backup_age(max_backup_age),
+    )
     
     try:
         # Check if already installed
@@ -96,8 +233,16 @@ def install(target_dir, ide, no_backup, force):
             
             # Copy files
             status.update("[bold green]📂 Copying files...")
-            installer.install()
-            console.print("[green]✓[/green] Files copied")
+            sync = installer.install(clean=clean)
+            console.print(
+                f"[green]✓[/green] Files copied ({len(sync.written)} written, "
+                f"{sync.unchanged} unchanged, {len(sync.removed)} removed)"
+            )
+            if sync.kept:
+                console.print(
+                    f"[yellow]⚠️  Kept {len(sync.kept)} locally edited file(s) "
+                    f"no longer shipped:[/yellow] {', '.join(sync.kept)}"
+                )
             
             # Validate
             status.update("[bold green]🔍 Validating installation...")
@@ -112,7 +257,7 @@ def install(target_dir, ide, no_backup, force):
         console.print("\n[bold green]✅ Installation complete![/bold green]\n")
         
         # Show what was installed
-        table = Table(show_header=True, header_style="bold cyan")
+        table = _table(show_header=True, header_style="bold cyan")
         table.add_column("Component", style="cyan")
         table.add_column("Status", justify="center")
         
@@ -135,6 +280,89 @@ def install(target_dir, ide, no_backup, force):
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
         raise click.Abort()
 
+@main.command('install-many')
+@click.argument('targets', nargs=-1, type=click.Path())
+@click.option('--from-file', 'targets_file', type=click.File('r'),
+              help='Read target directories from a file, one per line (- for stdin)')
+@click.option('--ide', 'ides', type=click.Choice(['claude', 'opencode']), multiple=True,
+              help='Target IDE; repeat to install both (default: claude)')
+@click.option('--no-backup', is_flag=True, help='Skip backup of existing files')
+@click.option('--force', is_flag=True, help='Overwrite existing installations instead of skipping them')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_COPY_WORKERS,
+              show_default=True, help='Files written concurrently across all targets')
+@click.option('--no-cache', is_flag=True, help='Render templates instead of using the template cache')
+@click.option('--clean', is_flag=True,
+              help='Delete each config directory first, including specs/ and other user files')
+@_backup_options
+def install_many_command(targets, targets_file, ides, no_backup, force, jobs, no_cache, clean,
+                         keep_backups, max_backup_age):
+    """Install the toolkit into many TARGETS at once
+    
+    Templates are rendered once per IDE and written to every target
+    concurrently. Exits with status 1 if any target fails.
+    
+    Examples:
+        ios-spec-driven install-many ~/AppA ~/AppB
+        ios-spec-driven install-many --from-file repos.txt --ide claude --ide opencode
+        find ~/src -maxdepth 1 -name '*iOS*' | ios-spec-driven install-many --from-file - --force
+    """
+    
+    target_dirs = _read_targets(targets, targets_file)
+    if not target_dirs:
+        raise click.UsageError('No targets given (pass TARGETS or --from-file)')
+    
+    ides = ides or ('claude',)
+    
+    console.print(_panel(
+        "[bold blue]🚀 iOS Spec-Driven Toolkit Installer[/bold blue]\n"
+        f"[dim]Version {_version()}[/dim]",
+        border_style="blue"
+    ))
+    
+    with console.status(f"[bold green]Installing into {len(target_dirs)} target(s)..."):
+        results = install_many(
+            [Path(t) for t in target_dirs],
+            ides=ides,
+            backup=not no_backup,
+            force=force,
+            workers=jobs,
+            use_cache=not no_cache,
+            clean=clean,
+            keep_backups=keep_backups,
+            max_backup_age=_backup_age(max_backup_age),
+        )
+    
+    table = _table(show_header=True, header_style="bold cyan")
+    table.add_column("Target", style="cyan")
+    table.add_column("IDE")
+    table.add_column("Status", justify="center")
+    table.add_column("Time", justify="right")
+    table.add_column("Details", style="dim")
+    
+    status_icons = {
+        'installed': "[green]✓ installed[/green]",
+        'skipped': "[yellow]- skipped[/yellow]",
+        'failed': "[red]✗ failed[/red]",
+    }
+    for result in results:
+        table.add_row(
+            str(result.target),
+            result.ide,
+            status_icons[result.status],
+            f"{result.seconds * 1000:.0f} ms",
+            result.detail,
+        )
+    
+    console.print(table)
+    
+    counts = {status: sum(r.status == status for r in results) for status in status_icons}
+    console.print(
+        f"\n{counts['installed']} installed, {counts['skipped']} skipped, "
+        f"{counts['failed']} failed\n"
+    )
+    if counts['failed']:
+        sys.exit(1)
+
 @main.command()
 @click.argument('target_dir', type=click.Path(), default='.')
 @click.option('--ide', type=click.Choice(['claude', 'opencode']), default='claude', help='Target IDE')
@@ -178,6 +406,73 @@ def uninstall(target_dir, ide, force):
         console.print(f"\n[bold red]❌ Uninstall failed:[/bold red] {e}")
         raise click.Abort()
 
+@main.command()
+@click.argument('target_dir', type=click.Path(), default='.')
+@click.option('--ide', type=click.Choice(['claude', 'opencode']), default='claude', help='Target IDE')
+@click.option('--backup', 'backup_name', metavar='NAME', help='Backup to restore (default: the latest)')
+@click.option('--list', 'list_only', is_flag=True, help='List backups and exit')
+@click.option('--no-backup', is_flag=True, help='Do not back up the current files first')
+@click.option('--force', is_flag=True, help='Restore without confirmation')
+def restore(target_dir, ide, backup_name, list_only, no_backup, force):
+    """Restore the config directory in TARGET_DIR from a backup
+    
+    Replaces .claude/ (or .opencode/) with a copy of the backup. The
+    current files are backed up first, so a restore can be undone by
+    restoring again.
+    
+    Examples:
+        ios-spec-driven restore --list
+        ios-spec-driven restore ~/MyiOSApp
+        ios-spec-driven restore --ide opencode --backup .opencode.backup.20250101_120000
+    """
+    
+    target_path = Path(target_dir).resolve()
+    # No pruning here: the safety backup must not delete the one restored
+    installer = Installer(target_path, ide=ide, keep_backups=None)
+    backups = installer.list_backups()
+    
+    if list_only:
+        if not backups:
+            console.print(f"[yellow]No {ide} backups in:[/yellow] {target_path}")
+            return
+        table = _table(show_header=True, header_style="bold cyan")
+        table.add_column("Backup", style="cyan")
+        table.add_column("Created")
+        for backup in reversed(backups):
+            table.add_row(backup.path.name, backup.created.strftime('%Y-%m-%d %H:%M:%S'))
+        console.print(table)
+        return
+    
+    if backup_name:
+        chosen = [b for b in backups if b.path.name == Path(backup_name).name]
+        if not chosen:
+            raise click.UsageError(f'No backup named {backup_name} (see --list)')
+        source = chosen[0].path
+    elif backups:
+        source = backups[-1].path
+    else:
+        console.print(f"[yellow]No {ide} backups in:[/yellow] {target_path}")
+        sys.exit(1)
+    
+    if not force:
+        console.print(
+            f"[yellow]This will replace[/yellow] {installer.target_config_dir} "
+            f"[yellow]with[/yellow] {source.name}\n"
+        )
+        if not click.confirm('Continue?', default=False):
+            console.print("[yellow]Restore cancelled[/yellow]")
+            return
+    
+    try:
+        if not no_backup and installer.target_config_dir.exists():
+            backup_path = installer.backup()
+            console.print(f"[green]✓[/green] Current files backed up: [dim]{backup_path.name}[/dim]")
+        installer.restore(source)
+        console.print(f"[green]✓[/green] Restored {installer.target_config_dir.name} from [dim]{source.name}[/dim]\n")
+    except Exception as e:
+        console.print(f"\n[bold red]❌ Restore failed:[/bold red] {e}")
+        raise click.Abort()
+
 @main.command()
 @click.argument('target_dir', type=click.Path(), default='.')
 @click.option('--ide', type=click.Choice(['claude', 'opencode']), default='claude', help='Target IDE')
@@ -193,6 +488,7 @@ def status(target_dir, ide):
     
     target_path = Path(target_dir).resolve()
     installer = Installer(target_path, ide=ide)
+    verification = installer.verify()
     
     console.print(f"\n[cyan]Checking installation in:[/cyan] {target_path}")
     console.print(f"[dim]IDE: {ide.title()}[/dim]\n")
@@ -201,12 +497,12 @@ def status(target_dir, ide):
         console.print("[green]✓[/green] Toolkit is installed\n")
         
         # Show components
-        table = Table(show_header=True, header_style="bold cyan")
+        table = _table(show_header=True, header_style="bold cyan")
         table.add_column("Component", style="cyan")
         table.add_column("Status", justify="center")
         table.add_column("Details", style="dim")
         
-        components = installer.get_installed_components()
+        components = installer.get_installed_components(verification)
         details = {
             'Skills': '7 specialized skills',
             'Agents': '7 workflow agents',
@@ -224,15 +520,182 @@ def status(target_dir, ide):
         
         # Version info
         config_dir = '.claude' if ide == 'claude' else '.opencode'
-        console.print(f"\n[dim]Version: {__version__}[/dim]")
+        console.print(f"\n[dim]Version: {verification.version or _version()}[/dim]")
         console.print(f"[dim]IDE: {ide.title()}[/dim]")
         console.print(f"[dim]Location: {target_path / config_dir}[/dim]\n")
         
+        if verification.version is None:
+            console.print("[yellow]No install manifest; re-run install to enable verification[/yellow]\n")
+        elif verification.ok:
+            console.print(
+                f"[green]✓[/green] {verification.checked} files match the manifest "
+                f"[dim](installed by {verification.version})[/dim]\n"
+            )
+        else:
+            for path in verification.missing:
+                console.print(f"[red]✗ missing:[/red] {path}")
+            for path in verification.modified:
+                console.print(f"[yellow]✗ modified:[/yellow] {path}")
+            console.print()
+        
     else:
         console.print("[yellow]✗[/yellow] Toolkit is not installed\n")
         console.print("[cyan]To install, run:[/cyan]")
         console.print(f"  ios-spec-driven install {target_path}\n")
 
+@main.command()
+@click.argument('targets', nargs=-1, type=click.Path())
+@click.option('--from-file', 'targets_file', type=click.File('r'),
+              help='Read target directories from a file, one per line (- for stdin)')
+@click.option('--ide', type=click.Choice(['claude', 'opencode']), default='claude', help='Target IDE')
+@click.option('--full', is_flag=True, help='Hash every file instead of trusting unchanged size and mtime')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_COPY_WORKERS,
+              show_default=True, help='Targets and files checked concurrently')
+def verify(targets, targets_file, ide, full, jobs):
+    """Verify installed files in TARGETS (default: current directory)
+    
+    Compares every file recorded in the install manifest with what is on
+    disk. Files with unchanged size and mtime are trusted without being
+    read; only the others are hashed. Exits with status 1 if any target
+    has missing or modified files, or no manifest.
+    
+    Examples:
+        ios-spec-driven verify
+        ios-spec-driven verify --full ~/MyiOSApp
+        ios-spec-driven verify --from-file repos.txt --ide opencode
+    """
+    
+    target_dirs = _read_targets(targets, targets_file) or ['.']
+    results = verify_many([Path(t) for t in target_dirs], ide=ide, full=full, workers=jobs)
+    
+    table = _table(show_header=True, header_style="bold cyan")
+    table.add_column("Target", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Version")
+    table.add_column("Files", justify="right")
+    table.add_column("Details", style="dim")
+    
+    for result in results:
+        if result.version is None:
+            status_icon = "[red]✗ no manifest[/red]"
+            detail = 'not installed' if result.missing else 're-run install to write a manifest'
+        elif result.ok:
+            status_icon = "[green]✓ ok[/green]"
+            detail = f'{result.hashed} hashed' if result.hashed else ''
+        else:
+            status_icon = "[red]✗ changed[/red]"
+            problems = [f'missing {p}' for p in result.missing]
+            problems += [f'modified {p}' for p in result.modified]
+            detail = ', '.join(problems[:3])
+            if len(problems) > 3:
+                detail += f' (+{len(problems) - 3} more)'
+        table.add_row(str(result.target), status_icon, result.version or '-', str(result.checked), detail)
+    
+    console.print(table)
+    
+    failed = sum(not r.ok for r in results)
+    console.print(f"\n{len(results) - failed} ok, {failed} failed\n")
+    if failed:
+        sys.exit(1)
+
+@main.command()
+@click.argument('root', type=click.Path(exists=True, file_okay=False), default='.')
+@click.option('--max-depth', type=click.IntRange(min=0), default=DEFAULT_SCAN_DEPTH, show_default=True,
+              help='Directory levels below ROOT to search')
+@click.option('--ignore', 'ignore_patterns', multiple=True, metavar='PATTERN',
+              help='Also skip directories matching PATTERN (repeatable)')
+@click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table',
+              show_default=True, help='Output format')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_SCAN_WORKERS, show_default=True,
+              help='Directories listed and installs checked concurrently')
+def scan(root, max_depth, ignore_patterns, output_format, jobs):
+    """Find toolkit installs under ROOT and report their state
+    
+    Detects both .claude/ and .opencode/ installs and shows each one's
+    installed version, drift from this package and component health.
+    Hidden directories and build output (node_modules, Pods, DerivedData,
+    build, ...) are not searched.
+    
+    Examples:
+        ios-spec-driven scan ~/Developer
+        ios-spec-driven scan ~/work --max-depth 2 --ignore 'archive*'
+        ios-spec-driven scan ~/work --format json > fleet.json
+    """
+    import json
+    import time
+    from .scanner import DEFAULT_IGNORE, scan as scan_root
+    
+    started = time.perf_counter()
+    report = scan_root(
+        Path(root),
+        max_depth=max_depth,
+        ignore=DEFAULT_IGNORE + ignore_patterns,
+        workers=jobs,
+    )
+    elapsed = time.perf_counter() - started
+    
+    if output_format == 'json':
+        click.echo(json.dumps({
+            'root': str(report.root),
+            'package_version': _version(),
+            'directories_scanned': report.directories,
+            'installs': [
+                dict(result._asdict(), path=str(result.path))
+                for result in report.installs
+            ],
+        }, indent=2))
+        return
+    
+    table = _table(show_header=True, header_style="bold cyan")
+    table.add_column("Path", style="cyan")
+    table.add_column("IDE")
+    table.add_column("Version")
+    table.add_column("Drift")
+    table.add_column("Health", justify="center")
+    table.add_column("Details", style="dim")
+    
+    drift_styles = {'current': 'green', 'outdated': 'yellow', 'newer': 'cyan', 'unknown': 'dim'}
+    for result in report.installs:
+        try:
+            shown_path = str(result.path.relative_to(report.root))
+        except ValueError:
+            shown_path = str(result.path)
+        if result.health == 'ok':
+            health = "[green]✓ ok[/green]"
+        elif result.health == 'changed':
+            health = "[red]✗ changed[/red]"
+        elif result.health == 'error':
+            health = "[red]✗ error[/red]"
+        else:
+            health = "[yellow]? no manifest[/yellow]"
+        details = [result.error] if result.error else []
+        if result.missing and result.version is not None:
+            details.append(f'{result.missing} missing')
+        if result.modified:
+            details.append(f'{result.modified} modified')
+        if result.broken:
+            details.append('broken: ' + ', '.join(result.broken))
+        drift_style = drift_styles[result.drift]
+        table.add_row(
+            shown_path,
+            result.ide,
+            result.version or '-',
+            f"[{drift_style}]{result.drift}[/{drift_style}]",
+            health,
+            '; '.join(details),
+        )
+    
+    if report.installs:
+        console.print(table)
+    
+    outdated = sum(r.drift == 'outdated' for r in report.installs)
+    unhealthy = sum(r.health != 'ok' for r in report.installs)
+    console.print(
+        f"\n{len(report.installs)} installs in {report.directories} directories "
+        f"({elapsed:.2f}s): {outdated} outdated, {unhealthy} not ok "
+        f"[dim](package version {_version()})[/dim]\n"
+    )
+
 @main.command()
 def info():
     """Show toolkit information and documentation links
@@ -240,9 +703,9 @@ def info():
     Displays version, components, and useful links.
     """
     
-    console.print(Panel.fit(
+    console.print(_panel(
         "[bold blue]iOS Spec-Driven Development Toolkit[/bold blue]\n"
-        f"[dim]Version {__version__}[/dim]",
+        f"[dim]Version {_version()}[/dim]",
         border_style="blue"
     ))
     
@@ -2,28 +2,265 @@
 Installation logic for iOS Spec-Driven Toolkit
 """
 
+import json
+import os
 import shutil
 import re
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Literal
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Literal, NamedTuple, Optional, Tuple, Union
+
+from . import __version__, renderer
+from .backups import (
+    DEFAULT_KEEP_BACKUPS, Backup, list_backups, new_backup_dir, prune_backups,
+    restore_snapshot, snapshot,
+)
+from .renderer import TARGET_VARIABLES, Template, compile_template, template_variables
+from .template_cache import CachedContent, TemplateCache, clone_file, content_hash, fingerprint
 
 IDEType = Literal["claude", "opencode"]
 
+# Concurrent file copies during install. Copies are I/O bound, so more
+# threads than cores helps on slow (network) filesystems; the bound keeps
+# the number of open files and in-flight requests modest.
+DEFAULT_COPY_WORKERS = 8
+
+# (compile, source file, target file); compile maps template text to a Template
+CopyJob = Tuple[Callable[[str], Template], Path, Path]
+
+# Lists the files install() wrote, so re-installs know what the toolkit owns
+MANIFEST_NAME = '.toolkit-manifest.json'
+
+# Agent file: YAML frontmatter between --- lines, then the body
+_FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---\n(.*)$', re.DOTALL)
+
+
+class RenderedContent(NamedTuple):
+    """Toolkit content rendered for one IDE, ready to write to any target
+    
+    Paths are relative to the IDE config directory (.claude/ or .opencode/).
+    Content that uses per-target variables (PROJECT_NAME) is target specific
+    and only valid for the target it was rendered for.
+    """
+    ide: str
+    directories: List[Path]
+    files: List[Tuple[Path, str]]
+    target_specific: bool = False
+
+
+class InstallResult(NamedTuple):
+    """Outcome of installing into one target (see install_many)"""
+    target: Path
+    ide: str
+    status: str  # "installed", "skipped" or "failed"
+    detail: str
+    seconds: float
+
+
+class ManifestEntry(NamedTuple):
+    """An installed file as recorded in the manifest"""
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+class Manifest(NamedTuple):
+    """What the last install wrote into a target"""
+    version: str
+    ide: str
+    files: Dict[str, ManifestEntry]  # keyed by path relative to the target
+
+
+class VerifyResult(NamedTuple):
+    """Outcome of checking one installation against its manifest"""
+    target: Path
+    ide: str
+    version: Optional[str]  # toolkit version that installed it; None without manifest
+    checked: int
+    hashed: int
+    missing: List[str]
+    modified: List[str]
+    
+    @property
+    def ok(self) -> bool:
+        return self.version is not None and not self.missing and not self.modified
+
+
+class SyncResult(NamedTuple):
+    """What install() changed; paths are relative to the target directory"""
+    written: List[str]
+    unchanged: int
+    removed: List[str]
+    kept: List[str]  # no longer shipped but edited locally, so left in place
+
+
+# Content install() can write instead of rendering the templates itself
+Content = Union[RenderedContent, CachedContent]
+
+# (path relative to target dir, content hash, write function, its arguments
+# with the target file last)
+SyncTask = Tuple[str, str, Callable[..., None], tuple]
+
+
+class CopyError(Exception):
+    """Raised when content files fail to copy
+    
+    Attributes:
+        failures: (target file, exception) pairs, in copy order
+    """
+    
+    def __init__(self, failures: List[Tuple[Path, BaseException]]):
+        self.failures = failures
+        details = '\n'.join(f'  {target}: {error}' for target, error in failures)
+        super().__init__(f'{len(failures)} file(s) failed to copy:\n{details}')
+
+
+def _thread_pool(workers: int):
+    """ThreadPoolExecutor, imported on first use to keep CLI startup fast"""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def file_hash(path: Path) -> Optional[str]:
+    """Content hash of a file, or None if it does not exist"""
+    try:
+        return content_hash(path.read_bytes())
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def stat_unchanged(st: os.stat_result, entry: ManifestEntry) -> bool:
+    """Whether a file still has the size and mtime recorded in the manifest
+    
+    Content is then assumed unchanged without hashing (like git's index):
+    an edit that keeps both the size and the nanosecond mtime is not
+    caught, which verify(full=True) covers.
+    """
+    return st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns
+
+
+@lru_cache(maxsize=64)
+def compile_agent(content: str, ide: str) -> Template:
+    """Compile agent content for an IDE
+    
+    Cached by content and IDE, like renderer.compile_template.
+    
+    For Claude Code:
+    - Keep tools format as-is (comma-separated)
+    
+    For OpenCode:
+    - Transform tools to YAML object format
+    
+    Placeholders are rendered in the body only; the frontmatter is
+    literal text. The body takes every placeholder form other content
+    does, including the escaped {{{{IDE_CONFIG_DIR}}}} (the former agent
+    transform only knew {{IDE_CONFIG_DIR}} and left {{.claude/}}).
+    """
+    # Extract frontmatter
+    frontmatter_match = _FRONTMATTER_PATTERN.match(content)
+    
+    if not frontmatter_match:
+        # No frontmatter, just placeholders
+        return compile_template(content)
+    
+    frontmatter = frontmatter_match.group(1)
+    body = frontmatter_match.group(2)
+    
+    # Transform tools field ONLY for OpenCode
+    if ide == 'opencode':
+        tools_pattern = r'^tools:\s*(.+)$'
+        tools_match = re.search(tools_pattern, frontmatter, re.MULTILINE)
+        
+        if tools_match:
+            tools_str = tools_match.group(1).strip()
+            
+            # Map Claude Code tool names to OpenCode tool names
+            tool_mapping = {
+                'Read': None,  # Not needed in OpenCode (automatic)
+                'Write': 'write',
+                'Edit': 'edit',
+                'Grep': 'grepSearch',
+                'Glob': 'fileSearch',
+                'Bash': 'bash',
+                'WebSearch': 'webSearch',
+                'WebFetch': 'webFetch',
+            }
+            
+            # Parse tools
+            tools = [t.strip() for t in tools_str.split(',')]
+            opencode_tools = []
+            
+            for tool in tools:
+                if tool in tool_mapping:
+                    mapped = tool_mapping[tool]
+                    if mapped:  # Skip None (Read)
+                        opencode_tools.append(mapped)
+            
+            # Build OpenCode tools format
+            if opencode_tools:
+                tools_yaml = 'tools:\n' + '\n'.join(f'  {tool}: true' for tool in opencode_tools)
+            else:
+                tools_yaml = 'tools: {}'
+            
+            # Replace in frontmatter
+            frontmatter = re.sub(
+                r'^tools:\s*.+$',
+                tools_yaml,
+                frontmatter,
+                flags=re.MULTILINE
+            )
+    
+    # Reconstruct file
+    return compile_template(body).prepend(f'---\n{frontmatter}\n---\n')
+
+
 class Installer:
     """Handles installation, uninstallation, and validation of the toolkit"""
     
-    def __init__(self, target_dir: Path, ide: IDEType = "claude", backup: bool = True):
+    def __init__(
+        self,
+        target_dir: Path,
+        ide: IDEType = "claude",
+        backup: bool = True,
+        workers: Optional[int] = None,
+        use_cache: bool = True,
+        keep_backups: Optional[int] = DEFAULT_KEEP_BACKUPS,
+        max_backup_age: Optional[timedelta] = None,
+        variables: Optional[Dict[str, str]] = None,
+    ):
         """Initialize installer
         
         Args:
             target_dir: Target directory for installation
             ide: Target IDE ("claude" or "opencode")
             backup: Whether to backup existing files
+            workers: Concurrent file copies (default: DEFAULT_COPY_WORKERS)
+            use_cache: Copy rendered content from the template cache
+            keep_backups: Backups kept after backup() (None: keep all)
+            max_backup_age: backup() deletes older backups (None: no limit)
+            variables: Template variable values overriding the defaults
+                (see renderer.VARIABLES)
+        
+        Raises:
+            ValueError: If variables names an unknown or IDE-derived variable
         """
         self.target_dir = Path(target_dir).resolve()
         self.ide = ide
+        self.variables = template_variables(ide, self.target_dir, variables)
         self.backup_enabled = backup
+        self.keep_backups = keep_backups
+        self.max_backup_age = max_backup_age
+        self.workers = max(1, workers or DEFAULT_COPY_WORKERS)
+        self.use_cache = use_cache
         
         # Get templates directory
         self.templates_dir = Path(__file__).parent / 'templates'
@@ -39,6 +276,8 @@ class Installer:
         else:  # opencode
             self.target_config_dir = self.target_dir / '.opencode'
             self.target_config_file = self.target_dir / 'opencode.json'
+        
+        self.manifest_file = self.target_config_dir / MANIFEST_NAME
     
     def is_installed(self) -> bool:
         """Check if toolkit is already installed
@@ -56,239 +295,529 @@ class Installer:
     def backup(self) -> Path:
         """Backup existing installation
         
+        Files unchanged since the latest backup are hardlinked to it instead
+        of copied (see backups.snapshot). Backups beyond keep_backups or
+        older than max_backup_age are then deleted.
+        
         Returns:
             Path to backup directory
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = self.target_dir / f'.{self.ide}.backup.{timestamp}'
+        backup_dir = new_backup_dir(self.target_dir, self.ide)
         
         if self.target_config_dir.exists():
-            shutil.copytree(self.target_config_dir, backup_dir)
+            backups = self.list_backups()
+            previous = backups[-1].path if backups else None
+            snapshot(self.target_config_dir, backup_dir, previous)
+            prune_backups(self.target_dir, self.ide, self.keep_backups, self.max_backup_age)
         
         return backup_dir
     
-    def install(self):
+    def list_backups(self) -> List[Backup]:
+        """Return backups of the config directory, oldest first"""
+        return list_backups(self.target_dir, self.ide)
+    
+    def restore(self, backup_dir: Optional[Path] = None) -> Path:
+        """Replace the config directory with a backup
+        
+        Args:
+            backup_dir: Backup to restore (default: the latest)
+        
+        Returns:
+            Path of the restored backup
+        
+        Raises:
+            FileNotFoundError: If there is no such backup
+        """
+        if backup_dir is None:
+            backups = self.list_backups()
+            if not backups:
+                raise FileNotFoundError(f'No {self.ide} backups in {self.target_dir}')
+            backup_dir = backups[-1].path
+        
+        restore_snapshot(Path(backup_dir), self.target_config_dir)
+        return Path(backup_dir)
+    
+    def install(self, rendered: Optional[Content] = None, clean: bool = False) -> SyncResult:
         """Install toolkit files
         
-        Copies content and applies IDE-specific format
+        Copies content and applies IDE-specific format. Only files whose
+        content differs from the installed copy are written, so unchanged
+        files keep their mtime. Files a previous install wrote that are no
+        longer shipped are removed; anything else in the config directory
+        (specs/, user files) is left alone.
+        
+        Args:
+            rendered: Content from render_content() or cached_content() to
+                write instead of reading and transforming the templates again
+            clean: Remove the whole config directory first, including
+                specs/ and other user files
+        
+        Returns:
+            SyncResult listing the written and removed files
         """
+        if rendered is not None and rendered.ide != self.ide:
+            raise ValueError(f"content rendered for {rendered.ide}, not {self.ide}")
+        
+        if rendered is None and self.use_cache:
+            rendered = self.cached_content()
+        if rendered is None:
+            rendered = self.render_content()
+        
         # Ensure target directory exists
         self.target_dir.mkdir(parents=True, exist_ok=True)
         
-        # Remove existing if present
-        if self.target_config_dir.exists():
+        # Remove existing if requested
+        if clean and self.target_config_dir.exists():
             shutil.rmtree(self.target_config_dir)
         
         # Create config directory
         self.target_config_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy content (skills, agents, shared, scripts, hooks)
-        self._copy_content()
-        
-        # Apply IDE-specific format
-        self._apply_format()
-    
-    def _transform_content_file(self, source_file: Path, target_file: Path):
-        """Transform content file paths for target IDE
-        
-        Replaces {{IDE_CONFIG_DIR}} placeholder with IDE-specific directory:
-        - Claude Code: .claude/
-        - OpenCode: .opencode/
+        manifest = self.read_manifest()
+        previous = manifest.files if manifest is not None else {}
         
-        Also handles {{{{IDE_CONFIG_DIR}}}} (escaped for Python f-strings)
-        Also handles legacy .claude/ references for backward compatibility
-        """
-        content = source_file.read_text(encoding='utf-8')
+        # Content (skills, agents, shared, scripts, hooks) and IDE format
+        try:
+            entries, written = self._sync_files(rendered, previous)
+        except CopyError as e:
+            if not isinstance(rendered, CachedContent) or not self._cache_damaged(rendered, e):
+                raise
+            # The cache entry was pruned or damaged meanwhile
+            TemplateCache.discard(rendered)
+            entries, written = self._sync_files(self.render_content(), previous)
         
-        # Get IDE-specific directory
-        ide_dir = '.claude/' if self.ide == 'claude' else '.opencode/'
+        removed, kept = self._remove_stale(previous, entries)
+        self._write_manifest(entries)
         
-        # Replace escaped placeholder (for Python f-strings)
-        content = content.replace('{{{{IDE_CONFIG_DIR}}}}', ide_dir)
+        return SyncResult(
+            written=written,
+            unchanged=len(entries) - len(written),
+            removed=removed,
+            kept=kept,
+        )
+    
+    def _plan_content(self) -> Tuple[List[Path], List[CopyJob]]:
+        """List the directories to create and the files to copy
         
-        # Replace normal placeholder
-        content = content.replace('{{IDE_CONFIG_DIR}}', ide_dir)
+        Covers skills, agents, shared guides, scripts and hooks. Sources are
+        sorted so the copy order (and error order) is the same on every run.
         
-        # Legacy: Also replace hardcoded .claude/ for backward compatibility
-        if self.ide == 'opencode':
-            content = content.replace('.claude/', '.opencode/')
+        Returns:
+            (target directories, copy jobs)
+        """
+        directories: List[Path] = []
+        jobs: List[CopyJob] = []
+        transform = compile_template
         
-        target_file.write_text(content, encoding='utf-8')
-
-    def _copy_content(self):
-        """Copy shared content to target directory"""
-        # Copy skills (with path transformation)
+        # Skills (with path transformation)
         if (self.content_dir / 'skills').exists():
             skills_target = self.target_config_dir / 'skills'
-            skills_target.mkdir(parents=True, exist_ok=True)
+            directories.append(skills_target)
             
-            for skill_dir in (self.content_dir / 'skills').iterdir():
+            for skill_dir in sorted((self.content_dir / 'skills').iterdir()):
                 if skill_dir.is_dir():
                     skill_target_dir = skills_target / skill_dir.name
-                    skill_target_dir.mkdir(parents=True, exist_ok=True)
+                    directories.append(skill_target_dir)
                     
-                    for skill_file in skill_dir.glob('*.md'):
-                        self._transform_content_file(skill_file, skill_target_dir / skill_file.name)
+                    for skill_file in sorted(skill_dir.glob('*.md')):
+                        jobs.append((transform, skill_file, skill_target_dir / skill_file.name))
         
-        # Copy agents (with transformation for both IDEs)
+        # Agents (with transformation for both IDEs)
         if (self.content_dir / 'agents').exists():
             agents_target = self.target_config_dir / 'agents'
-            agents_target.mkdir(parents=True, exist_ok=True)
+            directories.append(agents_target)
             
-            for agent_file in (self.content_dir / 'agents').glob('*.md'):
-                # Transform for both Claude Code and OpenCode
-                self._copy_and_transform_agent(agent_file, agents_target / agent_file.name)
+            for agent_file in sorted((self.content_dir / 'agents').glob('*.md')):
+                jobs.append((self._compile_agent, agent_file, agents_target / agent_file.name))
         
-        # Copy shared guides (with path transformation)
+        # Shared guides (with path transformation)
         if (self.content_dir / 'shared').exists():
             shared_target = self.target_config_dir / 'shared'
-            shared_target.mkdir(parents=True, exist_ok=True)
+            directories.append(shared_target)
             
-            for shared_file in (self.content_dir / 'shared').glob('*.md'):
-                self._transform_content_file(shared_file, shared_target / shared_file.name)
+            for shared_file in sorted((self.content_dir / 'shared').glob('*.md')):
+                jobs.append((transform, shared_file, shared_target / shared_file.name))
         
-        # Copy scripts (with path transformation for Python files)
-        if (self.content_dir / 'scripts').exists():
-            scripts_target = self.target_config_dir / 'scripts'
-            scripts_target.mkdir(parents=True, exist_ok=True)
-            
-            for script_file in (self.content_dir / 'scripts').iterdir():
-                if script_file.is_file():
-                    self._transform_content_file(script_file, scripts_target / script_file.name)
-        
-        # Copy hooks (with path transformation for Python files)
-        if (self.content_dir / 'hooks').exists():
-            hooks_target = self.target_config_dir / 'hooks'
-            hooks_target.mkdir(parents=True, exist_ok=True)
-            
-            for hook_file in (self.content_dir / 'hooks').iterdir():
-                if hook_file.is_file():
-                    self._transform_content_file(hook_file, hooks_target / hook_file.name)
-
-    def _copy_and_transform_agent(self, source_file: Path, target_file: Path):
-        """Transform agent content for target IDE
+        # Scripts and hooks (with path transformation for Python files)
+        for folder in ('scripts', 'hooks'):
+            if (self.content_dir / folder).exists():
+                folder_target = self.target_config_dir / folder
+                directories.append(folder_target)
+                
+                for source_file in sorted((self.content_dir / folder).iterdir()):
+                    if source_file.is_file():
+                        jobs.append((transform, source_file, folder_target / source_file.name))
+        
+        return directories, jobs
+    
+    @staticmethod
+    def _make_directory(directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def _write_file(data: bytes, target_file: Path):
+        target_file.write_bytes(data)
+    
+    def render_content(self) -> RenderedContent:
+        """Render every content file for this IDE in memory
+        
+        The result can be passed to install() of any Installer for the
+        same IDE, so templates are read and transformed only once when
+        installing into many targets.
+        
+        Returns:
+            RenderedContent with paths relative to the config directory
+        """
+        directories, jobs = self._plan_content()
+        
+        def render(job: CopyJob) -> Tuple[Path, Template]:
+            compile_job, source, target = job
+            template = compile_job(source.read_text(encoding='utf-8'))
+            return target.relative_to(self.target_config_dir), template
+        
+        workers = max(1, min(self.workers, len(jobs)))
+        with _thread_pool(workers) as pool:
+            templates = list(pool.map(render, jobs))
+        
+        used = frozenset().union(*(template.variables for _, template in templates))
+        return RenderedContent(
+            ide=self.ide,
+            directories=[d.relative_to(self.target_config_dir) for d in directories],
+            files=[(path, template.render(self.variables)) for path, template in templates],
+            target_specific=bool(used & TARGET_VARIABLES),
+        )
+    
+    def cached_content(self) -> Optional[Content]:
+        """Rendered content from the template cache, built on first use
+        
+        The cache key covers the package version, the IDE, the values of
+        the variables shared by all targets and the size and mtime of every
+        template (and of the modules that render them). Content using
+        per-target variables is never cached, since no other target could
+        reuse it.
+        
+        Returns:
+            CachedContent; RenderedContent if the content is target
+            specific; None if the cache directory is not writable
+        """
+        directories, jobs = self._plan_content()
+        shared_values = sorted(
+            f'{name}={value}' for name, value in self.variables.items()
+            if name not in TARGET_VARIABLES
+        )
+        key = fingerprint(
+            [Path(__file__), Path(renderer.__file__)] + [source for _, source, _ in jobs],
+            [str(d.relative_to(self.target_config_dir)) for d in directories] + shared_values,
+        )
         
-        For Claude Code:
-        - Keep tools format as-is (comma-separated)
-        - Replace {{IDE_CONFIG_DIR}} with .claude/
+        cache = TemplateCache()
+        try:
+            cached = cache.get(self.ide, key)
+            if cached is not None:
+                return cached
+            rendered = self.render_content()
+            if rendered.target_specific:
+                return rendered
+            return cache.put(self.ide, key, rendered)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _cache_damaged(content: CachedContent, error: CopyError) -> bool:
+        """Whether a copy failed reading the cache (not writing the target)"""
+        root = str(content.root)
+        return any(
+            isinstance(failure, OSError) and str(failure.filename or '').startswith(root)
+            for _, failure in error.failures
+        )
+    
+    def _sync_tasks(self, rendered: Content) -> Tuple[List[Path], List[SyncTask]]:
+        """List the directories and files (content, then IDE format) to sync"""
+        directories = [self.target_config_dir / d for d in rendered.directories]
+        tasks: List[SyncTask] = []
+        
+        def relative(target: Path) -> str:
+            return target.relative_to(self.target_dir).as_posix()
+        
+        if isinstance(rendered, CachedContent):
+            for path, digest in rendered.files:
+                target = self.target_config_dir / path
+                tasks.append((relative(target), digest, clone_file, (rendered.root / path, target)))
+        else:
+            for path, content in rendered.files:
+                target = self.target_config_dir / path
+                data = content.encode('utf-8')
+                tasks.append((relative(target), content_hash(data), self._write_file, (data, target)))
         
-        For OpenCode:
-        - Transform tools to YAML object format
-        - Replace {{IDE_CONFIG_DIR}} with .opencode/
+        for source, target in self._format_files():
+            digest = content_hash(source.read_bytes())
+            tasks.append((relative(target), digest, shutil.copy2, (source, target)))
+        
+        return directories, tasks
+    
+    @staticmethod
+    def _sync_file(
+        digest: str, write: Callable[..., None], args: tuple
+    ) -> Tuple[bool, ManifestEntry]:
+        """Write a file unless it already has the wanted content
+        
+        Returns:
+            (whether the file was written, its manifest entry)
         """
-        content = source_file.read_text(encoding='utf-8')
-        
-        # Get IDE-specific directory
-        ide_dir = '.claude/' if self.ide == 'claude' else '.opencode/'
-        
-        # Extract frontmatter
-        frontmatter_pattern = r'^---\n(.*?)\n---\n(.*)$'
-        frontmatter_match = re.match(frontmatter_pattern, content, re.DOTALL)
-        
-        if not frontmatter_match:
-            # No frontmatter, just replace placeholders
-            content = content.replace('{{IDE_CONFIG_DIR}}', ide_dir)
-            # Legacy: Also replace hardcoded .claude/ for backward compatibility
-            if self.ide == 'opencode':
-                content = content.replace('.claude/', '.opencode/')
-            target_file.write_text(content, encoding='utf-8')
-            return
-        
-        frontmatter = frontmatter_match.group(1)
-        body = frontmatter_match.group(2)
-        
-        # Transform tools field ONLY for OpenCode
-        if self.ide == 'opencode':
-            tools_pattern = r'^tools:\s*(.+)$'
-            tools_match = re.search(tools_pattern, frontmatter, re.MULTILINE)
+        target = args[-1]
+        st = _stat(target)
+        if st is None or file_hash(target) != digest:
+            write(*args)
+            st = target.stat()
+            return True, ManifestEntry(digest, st.st_size, st.st_mtime_ns)
+        return False, ManifestEntry(digest, st.st_size, st.st_mtime_ns)
+    
+    def _sync_files(
+        self, rendered: Content, previous: Dict[str, ManifestEntry]
+    ) -> Tuple[Dict[str, ManifestEntry], List[str]]:
+        """Bring installed files in line with rendered content
+        
+        Files whose content hash, size and mtime match the previous manifest
+        are skipped after a stat. The rest are hashed and, if different,
+        written on a bounded thread pool (after any missing directories),
+        so per-file latency (network filesystems) overlaps instead of
+        adding up. Every file is attempted even when some fail.
+        
+        Args:
+            rendered: Content to install (see render_content and
+                cached_content)
+            previous: Manifest entries of the last install
+        
+        Returns:
+            (manifest entry per installed file, files written), with paths
+            relative to the target directory
+        
+        Raises:
+            CopyError: listing every failed file, in copy order
+        """
+        directories, tasks = self._sync_tasks(rendered)
+        
+        entries: Dict[str, ManifestEntry] = {}
+        pending: List[SyncTask] = []
+        for task in tasks:
+            path, digest, _, args = task
+            entry = previous.get(path)
+            if entry is not None and entry.sha256 == digest:
+                st = _stat(args[-1])
+                if st is not None and stat_unchanged(st, entry):
+                    entries[path] = entry
+                    continue
+            pending.append(task)
+        
+        missing_directories = [d for d in directories if not d.is_dir()]
+        if not pending and not missing_directories:
+            return entries, []
+        
+        workers = max(1, min(self.workers, len(pending)))
+        with _thread_pool(workers) as pool:
+            # mkdir(parents=True, exist_ok=True) tolerates concurrent creation
+            # of a shared parent (skills/); any failure is raised here, before
+            # files are written.
+            for _ in pool.map(self._make_directory, missing_directories):
+                pass
+            futures = [
+                pool.submit(self._sync_file, digest, write, args)
+                for _, digest, write, args in pending
+            ]
+        
+        # Collected in job order, not completion order, so reports are stable
+        failures = [
+            (args[-1], future.exception())
+            for (_, _, _, args), future in zip(pending, futures)
+            if future.exception() is not None
+        ]
+        if failures:
+            raise CopyError(failures)
+        
+        written: List[str] = []
+        for (path, _, _, _), future in zip(pending, futures):
+            was_written, entries[path] = future.result()
+            if was_written:
+                written.append(path)
+        return entries, written
+    
+    def _remove_stale(
+        self, previous: Dict[str, ManifestEntry], current: Dict[str, ManifestEntry]
+    ) -> Tuple[List[str], List[str]]:
+        """Remove files a previous install wrote that are no longer shipped
+        
+        Files edited since they were installed are kept. Directories left
+        empty are removed, up to the config directory.
+        
+        Returns:
+            (removed files, kept files), relative to the target directory
+        """
+        removed: List[str] = []
+        kept: List[str] = []
+        for relative in sorted(set(previous) - set(current)):
+            parts = Path(relative).parts
+            if Path(relative).is_absolute() or '..' in parts:
+                continue
+            path = self.target_dir / relative
+            entry = previous[relative]
+            st = _stat(path)
+            if st is None:
+                continue
+            if not stat_unchanged(st, entry) and file_hash(path) != entry.sha256:
+                kept.append(relative)
+                continue
             
-            if tools_match:
-                tools_str = tools_match.group(1).strip()
-                
-                # Map Claude Code tool names to OpenCode tool names
-                tool_mapping = {
-                    'Read': None,  # Not needed in OpenCode (automatic)
-                    'Write': 'write',
-                    'Edit': 'edit',
-                    'Grep': 'grepSearch',
-                    'Glob': 'fileSearch',
-                    'Bash': 'bash',
-                    'WebSearch': 'webSearch',
-                    'WebFetch': 'webFetch',
-                }
-                
-                # Parse tools
-                tools = [t.strip() for t in tools_str.split(',')]
-                opencode_tools = []
-                
-                for tool in tools:
-                    if tool in tool_mapping:
-                        mapped = tool_mapping[tool]
-                        if mapped:  # Skip None (Read)
-                            opencode_tools.append(mapped)
-                
-                # Build OpenCode tools format
-                if opencode_tools:
-                    tools_yaml = 'tools:\n' + '\n'.join(f'  {tool}: true' for tool in opencode_tools)
-                else:
-                    tools_yaml = 'tools: {}'
-                
-                # Replace in frontmatter
-                frontmatter = re.sub(
-                    r'^tools:\s*.+$',
-                    tools_yaml,
-                    frontmatter,
-                    flags=re.MULTILINE
+            path.unlink()
+            removed.append(relative)
+            parent = path.parent
+            while parent != self.target_config_dir and self.target_config_dir in parent.parents:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+        
+        return removed, kept
+    
+    def read_manifest(self) -> Optional[Manifest]:
+        """Read the manifest written by the last install
+        
+        Returns:
+            Manifest, or None if there is no (readable) manifest
+        """
+        try:
+            data = json.loads(self.manifest_file.read_text(encoding='utf-8'))
+            files = {
+                # Without size/mtime (older manifests) a file is always hashed
+                path: ManifestEntry(
+                    entry['sha256'], entry.get('size', -1), entry.get('mtime_ns', -1)
                 )
+                for path, entry in data['files'].items()
+            }
+            return Manifest(data['version'], data['ide'], files)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    def _write_manifest(self, entries: Dict[str, ManifestEntry]):
+        """Record the installed files; left untouched if nothing changed"""
+        # One file per line keeps diffs readable; json.dumps(indent=...)
+        # would fall back to the much slower pure-Python encoder.
+        files = ',\n'.join(
+            f'    {json.dumps(path)}: {json.dumps(entry._asdict())}'
+            for path, entry in sorted(entries.items())
+        )
+        text = (
+            f'{{\n  "version": {json.dumps(__version__)},\n  "ide": {json.dumps(self.ide)},\n'
+            f'  "files": {{\n{files}\n  }}\n}}\n'
+        )
+        try:
+            if self.manifest_file.read_text(encoding='utf-8') == text:
+                return
+        except OSError:
+            pass
+        self.manifest_file.write_text(text, encoding='utf-8')
+    
+    def verify(self, full: bool = False) -> VerifyResult:
+        """Check installed files against the manifest
+        
+        Files whose size and mtime match the manifest are trusted without
+        reading them; only the rest (same size, new mtime) are hashed, on
+        the thread pool. A different size means modified without hashing.
         
-        # Replace placeholders in body
-        body = body.replace('{{IDE_CONFIG_DIR}}', ide_dir)
+        Args:
+            full: Hash every file instead of trusting size and mtime
+        
+        Returns:
+            VerifyResult; version is None if there is no manifest
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            return VerifyResult(self.target_dir, self.ide, None, 0, 0, self.missing_files(), [])
         
-        # Legacy: Also replace hardcoded .claude/ for backward compatibility
-        if self.ide == 'opencode':
-            body = body.replace('.claude/', '.opencode/')
+        missing: List[str] = []
+        modified: List[str] = []
+        to_hash: List[str] = []
+        for relative, entry in sorted(manifest.files.items()):
+            st = _stat(self.target_dir / relative)
+            if st is None:
+                missing.append(relative)
+            elif st.st_size != entry.size:
+                modified.append(relative)
+            elif full or st.st_mtime_ns != entry.mtime_ns:
+                to_hash.append(relative)
         
-        # Reconstruct file
-        new_content = f'---\n{frontmatter}\n---\n{body}'
-        target_file.write_text(new_content, encoding='utf-8')
-
-    def _apply_format(self):
-        """Apply IDE-specific format and config files"""
+        if to_hash:
+            workers = max(1, min(self.workers, len(to_hash)))
+            with _thread_pool(workers) as pool:
+                digests = pool.map(file_hash, [self.target_dir / r for r in to_hash])
+                for relative, digest in zip(to_hash, digests):
+                    if digest != manifest.files[relative].sha256:
+                        modified.append(relative)
+            modified.sort()
+        
+        return VerifyResult(
+            target=self.target_dir,
+            ide=self.ide,
+            version=manifest.version,
+            checked=len(manifest.files),
+            hashed=len(to_hash),
+            missing=missing,
+            modified=modified,
+        )
+    
+    def _compile_agent(self, content: str) -> Template:
+        return compile_agent(content, self.ide)
+    
+    def _format_files(self) -> List[Tuple[Path, Path]]:
+        """IDE-specific format and config files, as (source, target) pairs"""
         if self.ide == "claude":
-            # Copy Claude-specific settings
-            if (self.format_dir / 'settings.json').exists():
-                shutil.copy2(
-                    self.format_dir / 'settings.json',
-                    self.target_config_dir / 'settings.json'
-                )
-            
-            if (self.format_dir / 'settings.local.json').exists():
-                shutil.copy2(
+            pairs = [
+                # Claude-specific settings
+                (self.format_dir / 'settings.json', self.target_config_dir / 'settings.json'),
+                (
                     self.format_dir / 'settings.local.json',
-                    self.target_config_dir / 'settings.local.json'
-                )
-            
-            # Copy MCP config
-            mcp_source = self.templates_dir / '.mcp.json'
-            if mcp_source.exists():
-                shutil.copy2(mcp_source, self.target_mcp)
-        
+                    self.target_config_dir / 'settings.local.json',
+                ),
+                # MCP config
+                (self.templates_dir / '.mcp.json', self.target_mcp),
+            ]
         else:  # opencode
-            # Copy OpenCode config
-            if (self.format_dir / 'opencode.json').exists():
-                shutil.copy2(
-                    self.format_dir / 'opencode.json',
-                    self.target_config_file
-                )
+            # OpenCode config
+            pairs = [(self.format_dir / 'opencode.json', self.target_config_file)]
+        
+        return [(source, target) for source, target in pairs if source.exists()]
     
     def validate(self) -> bool:
         """Validate installation
         
-        Checks if all required files are present.
+        Checks if all required files are present and, when the install
+        wrote a manifest, that every installed file still matches it.
         
         Returns:
             True if validation passes, False otherwise
         """
+        missing = self.missing_files()
+        if missing:
+            print(f"Missing: {missing[0]}")
+            return False
+        
+        result = self.verify()
+        if result.version is not None:
+            if result.missing:
+                print(f"Missing: {result.missing[0]}")
+                return False
+            if result.modified:
+                print(f"Modified: {result.modified[0]}")
+                return False
+        
+        return True
+    
+    def missing_files(self) -> List[str]:
+        """List required files that are not installed
+        
+        Returns:
+            Paths relative to the target directory, empty if complete
+        """
         config_prefix = '.claude' if self.ide == "claude" else '.opencode'
         
         required_files = [
@@ -305,6 +834,7 @@ class Installer:
             
             # Scripts
             f'{config_prefix}/scripts/validate_traceability.py',
+            f'{config_prefix}/scripts/spec_parser.py',
             
             # Guides
             f'{config_prefix}/shared/COMPONENT_FORMAT.md',
@@ -318,13 +848,10 @@ class Installer:
         else:
             required_files.append('opencode.json')
         
-        for file_path in required_files:
-            full_path = self.target_dir / file_path
-            if not full_path.exists():
-                print(f"Missing: {file_path}")
-                return False
-        
-        return True
+        return [
+            file_path for file_path in required_files
+            if not (self.target_dir / file_path).exists()
+        ]
     
     def uninstall(self):
         """Remove toolkit files
@@ -343,19 +870,163 @@ class Installer:
         elif self.ide == "opencode" and self.target_config_file.exists():
             self.target_config_file.unlink()
     
-    def get_installed_components(self) -> Dict[str, bool]:
+    def get_installed_components(
+        self, verification: Optional[VerifyResult] = None
+    ) -> Dict[str, bool]:
         """Get status of installed components
         
+        A component counts as installed when it exists and none of its
+        files are missing or modified.
+        
+        Args:
+            verification: Result of verify(), to avoid checking again
+        
         Returns:
             Dictionary mapping component names to installation status
         """
+        if verification is None:
+            verification = self.verify()
+        broken = verification.missing + verification.modified
+        
+        def intact(path: Path) -> bool:
+            prefix = path.relative_to(self.target_dir).as_posix()
+            return path.exists() and not any(
+                b == prefix or b.startswith(prefix + '/') for b in broken
+            )
+        
         return {
-            'Skills': (self.target_config_dir / 'skills').exists(),
-            'Agents': (self.target_config_dir / 'agents').exists(),
-            'Scripts': (self.target_config_dir / 'scripts').exists(),
-            'Guides': (self.target_config_dir / 'shared').exists(),
-            'Config': (
-                self.target_mcp.exists() if self.ide == "claude" 
-                else self.target_config_file.exists()
+            'Skills': intact(self.target_config_dir / 'skills'),
+            'Agents': intact(self.target_config_dir / 'agents'),
+            'Scripts': intact(self.target_config_dir / 'scripts'),
+            'Guides': intact(self.target_config_dir / 'shared'),
+            'Config': intact(
+                self.target_mcp if self.ide == "claude" 
+                else self.target_config_file
             ),
         }
+
+
+def install_many(
+    targets: Iterable[Path],
+    ides: Iterable[IDEType] = ("claude",),
+    backup: bool = True,
+    force: bool = False,
+    workers: int = DEFAULT_COPY_WORKERS,
+    use_cache: bool = True,
+    clean: bool = False,
+    keep_backups: Optional[int] = DEFAULT_KEEP_BACKUPS,
+    max_backup_age: Optional[timedelta] = None,
+    variables: Optional[Dict[str, str]] = None,
+) -> List[InstallResult]:
+    """Install the toolkit into many target directories
+    
+    Templates are rendered once per IDE (or taken from the template
+    cache), then written to the targets concurrently (up to `workers`
+    targets at a time). Templates using per-target variables are rendered
+    for each target instead. A failing target does not stop the others.
+    
+    Args:
+        targets: Target directories (duplicates are installed once)
+        ides: IDEs to install into every target
+        backup: Whether to backup existing installations
+        force: Overwrite existing installations (otherwise they are skipped)
+        workers: Concurrent writes across all targets
+        use_cache: Copy rendered content from the template cache
+        clean: Remove each config directory before installing
+        keep_backups: Backups kept per target and IDE (None: keep all)
+        max_backup_age: Delete older backups (None: no limit)
+        variables: Template variable overrides for every target
+    
+    Returns:
+        One InstallResult per (target, IDE), in input order
+    
+    Raises:
+        ValueError: If variables names an unknown or IDE-derived variable
+    """
+    unique_targets = list(dict.fromkeys(Path(t).resolve() for t in targets))
+    ides = list(dict.fromkeys(ides))
+    if not unique_targets:
+        return []
+    
+    rendered: Dict[str, Optional[Content]] = {}
+    for ide in ides:
+        source = Installer(unique_targets[0], ide=ide, workers=workers, variables=variables)
+        cached = source.cached_content() if use_cache else None
+        content = cached or source.render_content()
+        # Only valid for the first target: let each target render its own
+        target_specific = isinstance(content, RenderedContent) and content.target_specific
+        rendered[ide] = None if target_specific else content
+    
+    # Split the write budget between the targets running at once
+    concurrent_targets = max(1, min(workers, len(unique_targets) * len(ides)))
+    per_target_workers = max(1, workers // concurrent_targets)
+    
+    def install_one(target: Path, ide: IDEType) -> InstallResult:
+        started = time.perf_counter()
+        installer = Installer(
+            target, ide=ide, backup=backup, workers=per_target_workers,
+            keep_backups=keep_backups, max_backup_age=max_backup_age,
+            use_cache=use_cache, variables=variables,
+        )
+        
+        def result(status: str, detail: str) -> InstallResult:
+            return InstallResult(target, ide, status, detail, time.perf_counter() - started)
+        
+        try:
+            details = []
+            reinstall = installer.is_installed()
+            if reinstall:
+                if not force:
+                    return result('skipped', 'already installed (use --force)')
+                if backup:
+                    details.append(f'backup: {installer.backup().name}')
+            sync = installer.install(rendered[ide], clean=clean)
+            if reinstall:
+                details.append(f'{len(sync.written)} updated, {len(sync.removed)} removed')
+            missing = installer.missing_files()
+            if missing:
+                return result('failed', f'missing: {", ".join(missing)}')
+            return result('installed', ', '.join(details))
+        except Exception as e:
+            return result('failed', str(e))
+    
+    # Each (target, IDE) pair writes its own config directory, so pairs
+    # never touch the same files.
+    jobs = [(target, ide) for target in unique_targets for ide in ides]
+    with _thread_pool(concurrent_targets) as pool:
+        futures = [pool.submit(install_one, target, ide) for target, ide in jobs]
+    return [future.result() for future in futures]
+
+
+def verify_many(
+    targets: Iterable[Path],
+    ide: IDEType = "claude",
+    full: bool = False,
+    workers: int = DEFAULT_COPY_WORKERS,
+) -> List[VerifyResult]:
+    """Verify many installations against their manifests
+    
+    Targets are checked concurrently (up to `workers` at a time); see
+    Installer.verify.
+    
+    Args:
+        targets: Target directories (duplicates are checked once)
+        ide: IDE whose installation to check
+        full: Hash every file instead of trusting size and mtime
+        workers: Concurrent checks across all targets
+    
+    Returns:
+        One VerifyResult per target, in input order
+    """
+    unique_targets = list(dict.fromkeys(Path(t).resolve() for t in targets))
+    if not unique_targets:
+        return []
+    
+    concurrent_targets = max(1, min(workers, len(unique_targets)))
+    per_target_workers = max(1, workers // concurrent_targets)
+    
+    def verify_one(target: Path) -> VerifyResult:
+        return Installer(target, ide=ide, workers=per_target_workers).verify(full)
+    
+    with _thread_pool(concurrent_targets) as pool:
+        return list(pool.map(verify_one, unique_targets))
@@ -0,0 +1,129 @@
+"""
+Template rendering for iOS Spec-Driven Toolkit
+
+A template is tokenized once into literal text and variable names; rendering
+is then a single join with the variable values instead of one str.replace
+pass over the whole file per placeholder form.
+
+Placeholders:
+- {{NAME}}: replaced by the value of variable NAME
+- {{{{NAME}}}}: the same, escaped for templates that are Python f-strings
+- .claude/: legacy spelling of {{IDE_CONFIG_DIR}}
+
+Unknown names are left as they are.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, Mapping, NamedTuple, Optional, Tuple
+
+# Variables templates may use
+VARIABLES = ('IDE_CONFIG_DIR', 'PROJECT_NAME', 'SPEC_ROOT', 'PYTHON')
+
+# Variables whose value differs between targets of the same IDE. Content
+# using them is rendered per target instead of shared or cached.
+TARGET_VARIABLES = frozenset({'PROJECT_NAME'})
+
+# Set by the IDE, not by callers
+DERIVED_VARIABLES = frozenset({'IDE_CONFIG_DIR'})
+
+_PLACEHOLDER_PATTERN = re.compile(
+    r'\{\{\{\{([A-Z][A-Z0-9_]*)\}\}\}\}'  # escaped for Python f-strings
+    r'|\{\{([A-Z][A-Z0-9_]*)\}\}'
+)
+
+LEGACY_CONFIG_DIR = '.claude/'
+
+
+class Template(NamedTuple):
+    """A compiled template
+    
+    parts alternates literal text and variable names, starting and ending
+    with text: (text, name, text, ..., text).
+    """
+    parts: Tuple[str, ...]
+    variables: FrozenSet[str]
+    
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render with values for (at least) every variable used
+        
+        Raises:
+            KeyError: If a used variable has no value
+        """
+        parts = list(self.parts)
+        parts[1::2] = [values[name] for name in self.parts[1::2]]
+        return ''.join(parts)
+    
+    def prepend(self, text: str) -> 'Template':
+        """Return this template with literal text in front"""
+        return Template((text + self.parts[0],) + self.parts[1:], self.variables)
+
+
+def _tokens(text: str) -> Iterator[Tuple[int, int, str]]:
+    """Yield (start, end, variable name) of each placeholder in text
+    
+    str.find jumps between candidates, so only the few positions holding
+    '{{' or '.claude/' are looked at more closely.
+    """
+    brace = text.find('{{')
+    legacy = text.find(LEGACY_CONFIG_DIR)
+    while brace >= 0 or legacy >= 0:
+        if legacy >= 0 and (brace < 0 or legacy < brace):
+            end = legacy + len(LEGACY_CONFIG_DIR)
+            yield legacy, end, 'IDE_CONFIG_DIR'
+            legacy = text.find(LEGACY_CONFIG_DIR, end)
+            continue
+        match = _PLACEHOLDER_PATTERN.match(text, brace)
+        if match is None:
+            brace = text.find('{{', brace + 1)
+            continue
+        name = match.group(1) or match.group(2)
+        if name in VARIABLES:
+            yield brace, match.end(), name
+        # Unknown names stay as text
+        brace = text.find('{{', match.end())
+
+
+@lru_cache(maxsize=256)
+def compile_template(text: str) -> Template:
+    """Tokenize template text once
+    
+    Cached by text, so rendering the same templates for another IDE or
+    target does not tokenize them again.
+    """
+    parts = []
+    position = 0
+    for start, end, name in _tokens(text):
+        parts.append(text[position:start])
+        parts.append(name)
+        position = end
+    parts.append(text[position:])
+    return Template(tuple(parts), frozenset(parts[1::2]))
+
+
+def default_variables(ide: str, target_dir: Path) -> Dict[str, str]:
+    """Variable values for installing into target_dir for an IDE"""
+    config_dir = '.claude/' if ide == 'claude' else '.opencode/'
+    return {
+        'IDE_CONFIG_DIR': config_dir,
+        'PROJECT_NAME': Path(target_dir).name,
+        'SPEC_ROOT': f'{config_dir}specs/',
+        'PYTHON': 'python3',
+    }
+
+
+def template_variables(
+    ide: str, target_dir: Path, overrides: Optional[Mapping[str, str]] = None
+) -> Dict[str, str]:
+    """Default variable values with overrides applied
+    
+    Raises:
+        ValueError: If an override names an unknown or IDE-derived variable
+    """
+    values = default_variables(ide, target_dir)
+    for name, value in (overrides or {}).items():
+        if name not in VARIABLES or name in DERIVED_VARIABLES:
+            raise ValueError(f'cannot set template variable {name}')
+        values[name] = value
+    return values
@@ -0,0 +1,201 @@
+"""
+Fleet scan for iOS Spec-Driven Toolkit
+
+Walks a workspace for toolkit installations (.claude/ and .opencode/) and
+reports their version, health and drift from this package. Directories are
+listed concurrently, so a workspace of thousands of repositories is bounded
+by filesystem latency rather than by one directory at a time.
+"""
+
+import fnmatch
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import __version__
+from .installer import Installer
+
+# Levels below the root to search: root/org/repo/app
+DEFAULT_SCAN_DEPTH = 3
+
+# Directory listings are latency bound, so well above the core count
+DEFAULT_SCAN_WORKERS = 16
+
+# Directory names never descended into (fnmatch patterns)
+DEFAULT_IGNORE = (
+    '.*',  # .git, .build, .swiftpm; config dirs are checked by name
+    'node_modules',
+    'Pods',
+    'Carthage',
+    'DerivedData',
+    'build',
+    'venv',
+    '__pycache__',
+)
+
+CONFIG_DIRS = {'.claude': 'claude', '.opencode': 'opencode'}
+
+
+class ScanResult(NamedTuple):
+    """One toolkit installation found by scan()"""
+    path: Path
+    ide: str
+    version: Optional[str]  # None for installs without a manifest
+    drift: str  # "current", "outdated", "newer" or "unknown"
+    health: str  # "ok", "changed", "unverified" (no manifest) or "error"
+    broken: List[str]  # components with missing or modified files
+    missing: int
+    modified: int
+    error: Optional[str] = None  # why the install could not be checked
+
+
+class ScanReport(NamedTuple):
+    """Everything scan() found under a root"""
+    root: Path
+    directories: int
+    installs: List[ScanResult]
+
+
+def _version_key(version: str) -> Optional[Tuple[int, ...]]:
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except ValueError:
+        return None
+
+
+def version_drift(version: Optional[str], current: str = __version__) -> str:
+    """Compare an installed toolkit version with this package's version
+    
+    Returns:
+        "current", "outdated", "newer" or "unknown"
+    """
+    if version is None:
+        return 'unknown'
+    if version == current:
+        return 'current'
+    installed, ours = _version_key(version), _version_key(current)
+    if installed is None or ours is None:
+        return 'unknown'
+    return 'outdated' if installed < ours else 'newer'
+
+
+def _list_directory(directory: Path, ignore: Tuple[str, ...]) -> Tuple[List[Path], List[str]]:
+    """List subdirectories to descend into and the IDE config dirs present
+    
+    Symlinks are not followed, so link cycles cannot trap the walk.
+    Unreadable directories are skipped.
+    """
+    subdirectories: List[Path] = []
+    ides: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                if entry.name in CONFIG_DIRS:
+                    ides.append(CONFIG_DIRS[entry.name])
+                elif not any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in ignore):
+                    subdirectories.append(Path(entry.path))
+    except OSError:
+        pass
+    return subdirectories, sorted(ides)
+
+
+def inspect_install(path: Path, ide: str) -> Optional[ScanResult]:
+    """Check one candidate installation
+    
+    An install that cannot be read (e.g. permission denied) is reported
+    with health "error" instead of aborting the scan.
+    
+    Returns:
+        ScanResult, or None if the config directory is not a toolkit install
+        (e.g. a .claude/ holding only Claude Code settings)
+    """
+    installer = Installer(path, ide=ide, workers=1)
+    try:
+        if not installer.is_installed() and not installer.manifest_file.exists():
+            return None
+        verification = installer.verify()
+        components = installer.get_installed_components(verification)
+    except OSError as e:
+        return ScanResult(
+            path=installer.target_dir,
+            ide=ide,
+            version=None,
+            drift='unknown',
+            health='error',
+            broken=[],
+            missing=0,
+            modified=0,
+            error=str(e),
+        )
+    
+    if verification.version is None:
+        health = 'unverified'
+    else:
+        health = 'ok' if verification.ok else 'changed'
+    
+    return ScanResult(
+        path=installer.target_dir,
+        ide=ide,
+        version=verification.version,
+        drift=version_drift(verification.version),
+        health=health,
+        broken=[name for name, intact in components.items() if not intact],
+        missing=len(verification.missing),
+        modified=len(verification.modified),
+    )
+
+
+def scan(
+    root: Path,
+    max_depth: int = DEFAULT_SCAN_DEPTH,
+    ignore: Iterable[str] = DEFAULT_IGNORE,
+    workers: int = DEFAULT_SCAN_WORKERS,
+) -> ScanReport:
+    """Find and check every toolkit installation under root
+    
+    Each directory listing and each installation check is a separate task
+    on one thread pool, so a slow directory (network home, huge repo) does
+    not hold up the rest of the walk.
+    
+    Args:
+        root: Directory to search (depth 0)
+        max_depth: Deepest level whose directories are listed
+        ignore: fnmatch patterns of directory names not to descend into
+        workers: Concurrent directory listings and checks
+    
+    Returns:
+        ScanReport with installations sorted by path, then IDE
+    """
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+    
+    root = Path(root).resolve()
+    ignore = tuple(ignore)
+    directories = 0
+    checks: List[Future] = []
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        listings: Dict[Future, Tuple[Path, int]] = {
+            pool.submit(_list_directory, root, ignore): (root, 0)
+        }
+        while listings:
+            done, _ = wait(listings, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, depth = listings.pop(future)
+                subdirectories, ides = future.result()
+                directories += 1
+                for ide in ides:
+                    checks.append(pool.submit(inspect_install, directory, ide))
+                if depth < max_depth:
+                    for subdirectory in subdirectories:
+                        listing = pool.submit(_list_directory, subdirectory, ignore)
+                        listings[listing] = (subdirectory, depth + 1)
+        
+        installs = [result for result in (check.result() for check in checks) if result]
+    
+    installs.sort(key=lambda result: (str(result.path), result.ide))
+    return ScanReport(root=root, directories=directories, installs=installs)
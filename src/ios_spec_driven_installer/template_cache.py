@@ -0,0 +1,276 @@
+"""
+Cache of rendered toolkit content for iOS Spec-Driven Toolkit
+
+Rendering only depends on the templates and the IDE, so the rendered tree
+is stored once per (package version, IDE, template fingerprint) in the user
+cache directory. Later installs clone or copy those files instead of
+transforming every template again.
+"""
+
+import errno
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import __version__
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from .installer import RenderedContent
+
+# Bump when the entry layout changes
+CACHE_FORMAT = 2
+
+CACHE_DIR_ENV = 'IOS_SPEC_DRIVEN_CACHE_DIR'
+
+# put() builds entries in .tmp-{ide}-{pid}-{thread} next to them; one this
+# old (seconds) was left by a killed install
+STALE_STAGING_AGE = 60 * 60
+
+# Linux ioctl cloning one file into another (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+_NO_REFLINK = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS)
+
+
+class CachedContent(NamedTuple):
+    """Rendered content stored in the template cache
+    
+    Paths are relative to the IDE config directory; file contents are under
+    root. Files are (path, content_hash of the file) pairs.
+    """
+    ide: str
+    root: Path
+    directories: List[Path]
+    files: List[Tuple[Path, str]]
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for this tool
+    
+    IOS_SPEC_DRIVEN_CACHE_DIR overrides the platform default.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    
+    if sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    elif sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base / 'ios-spec-driven'
+
+
+def content_hash(data: bytes) -> str:
+    """Hash identifying rendered file content (SHA-256, hex)"""
+    import hashlib  # loads OpenSSL; not needed by status or --version
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint(files: Iterable[Path], names: Iterable[str] = ()) -> str:
+    """Fingerprint template files by path, size and modification time
+    
+    Only stats the files, so checking the cache costs far less than
+    rendering. Edited templates (editable installs) get a new fingerprint.
+    
+    Args:
+        files: Source files the rendered content depends on
+        names: Extra strings to include (e.g. directory names)
+    """
+    import hashlib
+    digest = hashlib.sha1(f'{CACHE_FORMAT}\n'.encode())
+    for name in names:
+        digest.update(f'{name}\n'.encode())
+    for path in files:
+        st = path.stat()
+        digest.update(f'{path}\0{st.st_size}\0{st.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()[:16]
+
+
+def _clonefile():
+    """Return macOS clonefile(2), or None"""
+    if sys.platform != 'darwin':
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    return clonefile
+
+
+_CLONEFILE = _clonefile()
+
+
+def clone_file(source: Path, target: Path):
+    """Copy source to a new target file, as a reflink where the filesystem allows
+    
+    A reflink (APFS clonefile, Linux FICLONE) shares the data blocks
+    copy-on-write, so nothing is copied until either side is edited.
+    Never hardlinks: installed files are meant to be edited, and an edit
+    through a hardlink would change the cache and every other install.
+    """
+    if _CLONEFILE is not None:
+        # Fails (e.g. EEXIST, ENOTSUP off APFS) without touching target
+        if _CLONEFILE(os.fsencode(source), os.fsencode(target), 0) == 0:
+            return
+    
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        if fcntl is not None and sys.platform.startswith('linux'):
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return
+            except OSError as e:
+                if e.errno not in _NO_REFLINK:
+                    raise
+        # Reuse the open files: toolkit files are small, so one read and
+        # one write beat a second open of each
+        shutil.copyfileobj(src, dst)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a local process with this pid exists
+    
+    Always True on Windows, where signal 0 is not a liveness check.
+    """
+    if sys.platform == 'win32':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # EPERM: exists, owned by another user
+        pass
+    return True
+
+
+class TemplateCache:
+    """Rendered content per (package version, IDE, fingerprint) on disk
+    
+    Entries are written to a temporary directory and renamed into place, so
+    concurrent installers never see a partial entry.
+    """
+    
+    def __init__(self, root: Optional[Path] = None):
+        """Initialize cache
+        
+        Args:
+            root: Cache directory (default: default_cache_dir())
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.version_dir = self.root / __version__
+    
+    def entry_dir(self, ide: str, key: str) -> Path:
+        return self.version_dir / f'{ide}-{key}'
+    
+    def get(self, ide: str, key: str) -> Optional[CachedContent]:
+        """Return the cached entry, or None if it has not been built"""
+        entry = self.entry_dir(ide, key)
+        try:
+            index = json.loads((entry / 'index.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        return CachedContent(
+            ide=ide,
+            root=entry / 'content',
+            directories=[Path(d) for d in index['directories']],
+            files=[(Path(f), digest) for f, digest in index['files']],
+        )
+    
+    def put(self, ide: str, key: str, rendered: 'RenderedContent') -> CachedContent:
+        """Store rendered content and return the cached entry
+        
+        Older entries for the same IDE and package version are removed.
+        
+        Raises:
+            OSError: If the cache directory cannot be written
+        """
+        entry = self.entry_dir(ide, key)
+        self.version_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.version_dir / f'.tmp-{ide}-{os.getpid()}-{threading.get_ident()}'
+        if staging.exists():
+            shutil.rmtree(staging)
+        
+        try:
+            content = staging / 'content'
+            content.mkdir(parents=True)
+            for directory in rendered.directories:
+                (content / directory).mkdir(parents=True, exist_ok=True)
+            files = []
+            for path, text in rendered.files:
+                data = text.encode('utf-8')
+                (content / path).write_bytes(data)
+                files.append((path, content_hash(data)))
+            
+            # Written last: an entry with an index is complete
+            index = {
+                'directories': [d.as_posix() for d in rendered.directories],
+                'files': [[path.as_posix(), digest] for path, digest in files],
+            }
+            (staging / 'index.json').write_text(json.dumps(index), encoding='utf-8')
+            
+            try:
+                staging.rename(entry)
+            except OSError:
+                # Another installer stored the same entry first
+                if not entry.is_dir():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        
+        for stale in self.version_dir.glob(f'{ide}-*'):
+            if stale != entry:
+                shutil.rmtree(stale, ignore_errors=True)
+        self._remove_stale_staging()
+        
+        return CachedContent(
+            ide=ide,
+            root=entry / 'content',
+            directories=list(rendered.directories),
+            files=files,
+        )
+    
+    def _remove_stale_staging(self):
+        """Remove staging directories left by killed installs
+        
+        A staging directory is stale when the process that created it is
+        gone or it is older than STALE_STAGING_AGE (the only check on
+        Windows). Pids are checked on this host; should a cache shared
+        with another host lose a staging directory still in use, that
+        put() raises OSError and the install renders without the cache.
+        """
+        cutoff = time.time() - STALE_STAGING_AGE
+        for staging in self.version_dir.glob('.tmp-*'):
+            try:
+                pid = int(staging.name.rsplit('-', 2)[1])
+            except (IndexError, ValueError):
+                pid = None
+            try:
+                old = staging.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if old or (pid is not None and not _pid_alive(pid)):
+                shutil.rmtree(staging, ignore_errors=True)
+    
+    @staticmethod
+    def discard(content: CachedContent):
+        """Remove a damaged entry so the next install rebuilds it"""
+        shutil.rmtree(content.root.parent, ignore_errors=True)
+    
+    def clear(self):
+        """Remove every cached entry"""
+        if self.root.exists():
+            shutil.rmtree(self.root)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Thin PostToolUse hook entry point for update_task_status.py.
+
+Forwards the hook payload to the resident daemon when one is running
+(`python3 {{IDE_CONFIG_DIR}}hooks/update_task_status.py --daemon`) and falls
+back to handling it in-process otherwise. Only the modules needed for the
+socket round-trip are imported on the daemon path.
+"""
+
+import hashlib
+import os
+import socket
+import sys
+
+
+# Keep in sync with update_task_status.py.
+def socket_path() -> str:
+    # The daemon socket lives outside the project: a socket in the config
+    # dir breaks toolkit backups. One per user and project root, named
+    # after a hash of both.
+    hooks_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.realpath(os.path.join(hooks_dir, "..", ".."))
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+
+        runtime_dir = tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    digest = hashlib.sha1(f"{uid}:{root}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(runtime_dir, f"ios-spec-task-status-{digest}.sock")
+
+
+SOCKET_PATH = socket_path()
+
+
+def forward(raw_payload: bytes) -> bool:
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        # The runtime dir may be a shared /tmp: only talk to our own daemon.
+        if os.lstat(SOCKET_PATH).st_uid != os.getuid():
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(10)
+            conn.connect(SOCKET_PATH)
+            conn.sendall(raw_payload)
+            conn.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return False
+    sys.stdout.buffer.write(b"".join(chunks))
+    return True
+
+
+def main() -> None:
+    raw_payload = sys.stdin.buffer.read()
+    if forward(raw_payload):
+        return
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import update_task_status
+
+    update_task_status.run(raw_payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,12 @@ Hook script to keep task execution context aligned with changed files.
 
 Behavior (Auto-detect mode):
 - Detect changed Swift file path from tool input.
-- Locate related spec folder.
-- Parse tasks.md Task Registry and find matching tasks by file path.
+- Locate related spec folder: explicit source-directory mapping in
+  specs/spec_map.json first (e.g. {"Features/Login": "login"}), then a path
+  component equal to a spec slug, then a fuzzy slug match.
+- Look up matching tasks by file path in the cached Task Registry index
+  (re-parsed only when tasks.md changes; kept in the spec's gitignored
+  .traceability_cache/ folder).
 - If exactly one matching task is pending, auto-mark it in_progress.
 - Print concise execution hints.
 
@@ -13,189 +17,647 @@ Behavior (Explicit action mode):
 - Agent can explicitly mark task as done/blocked via "action" field.
 - Updates all three locations: Task Registry, Checklist, Traceability Matrix.
 - Required for proper task completion tracking.
+- Batch form: {"spec_name": ..., "updates": [{"task_id": ..., "action": ...,
+  "spec_name": ...}, ...]}; per-entry action/spec_name default to the
+  top-level ones. Each tasks.md is read once and replaced atomically once.
+- Read-modify-write of tasks.md is serialized across concurrent agents by a
+  sidecar lock (.traceability_cache/tasks.md.lock), so parallel updates are
+  never lost.
+
+Daemon mode (optional):
+- `python3 {{IDE_CONFIG_DIR}}hooks/update_task_status.py --daemon [idle_seconds]`
+  serves payloads on a Unix socket in $XDG_RUNTIME_DIR (or the temp dir),
+  named per project, and keeps parsed indexes in memory.
+- The settings.json hook runs task_status_client.py, which forwards to the
+  daemon when it is up and falls back to running this module in-process.
 """
 
+import contextlib
+import hashlib
+import io
 import json
-import re
+import os
+import random
+import signal
+import socket
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to atomic replace without locking
+    fcntl = None
+
+# The spec parser shared with validate_traceability.py lives in scripts/.
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# Cache folder in each spec folder and in specs/ itself, shared with
+# validate_traceability.py (keep in sync with its CACHE_DIRNAME):
+# gitignored, and skipped by --changed-since.
+CACHE_DIRNAME = ".traceability_cache"
+# Parsed Task Registry cache stored in the cache folder beside tasks.md.
+INDEX_FILENAME = "tasks_index.json"
+INDEX_VERSION = 2
+# Source-dir trie key marking the spec a directory maps to; never a path
+# component.
+TRIE_END = ""
+
+# Spec slug / source-directory cache stored in specs/.traceability_cache/:
+# gitignored, and writing inside the folder never changes the specs
+# directory mtime the index is keyed on.
+SPEC_INDEX_FILENAME = "spec_index.json"
+SPEC_INDEX_VERSION = 1
+SPEC_MAP_FILENAME = "spec_map.json"
+
+DAEMON_IDLE_TIMEOUT = 30 * 60
+
+
+# Keep in sync with task_status_client.py.
+def socket_path() -> str:
+    # The daemon socket lives outside the project: a socket in the config
+    # dir breaks toolkit backups. One per user and project root, named
+    # after a hash of both.
+    hooks_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.realpath(os.path.join(hooks_dir, "..", ".."))
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+
+        runtime_dir = tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    digest = hashlib.sha1(f"{uid}:{root}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(runtime_dir, f"ios-spec-task-status-{digest}.sock")
+
+
+SOCKET_PATH = socket_path()
+
+STATUS_ACTIONS = {"mark_done": "done", "mark_blocked": "blocked"}
+
+# tasks.md read-modify-write lock: give up after LOCK_TIMEOUT seconds. Where
+# a blocking wait cannot be interrupted, poll with jittered exponential
+# backoff (1 ms doubling up to 20 ms).
+LOCK_TIMEOUT = 10.0
+LOCK_BACKOFF_MIN = 0.001
+LOCK_BACKOFF_MAX = 0.02
+
+# Indexes already loaded by this process, keyed by index file path. Only
+# long-lived processes (the daemon) get repeat hits.
+_LOADED_INDEXES: Dict[str, Dict] = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _build_spec_index(specs_dir: Path, dirs_mtime: int, map_mtime: Optional[int]) -> Dict:
+    slugs = {}
+    with os.scandir(specs_dir) as entries:
+        for entry in entries:
+            # Hidden folders (the cache folder) are never specs.
+            if entry.is_dir() and not entry.name.startswith("."):
+                slugs[entry.name.lower()] = entry.name
+
+    # Reversed-component trie: source dir components (deepest first) -> spec.
+    dirs: Dict = {}
+    if map_mtime is not None:
+        try:
+            spec_map = json.loads((specs_dir / SPEC_MAP_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            spec_map = {}
+        for source_dir, spec_name in sorted(spec_map.items()):
+            parts = [p.lower() for p in source_dir.replace("\\", "/").split("/") if p]
+            if not parts or spec_name.lower() not in slugs:
+                continue
+            node = dirs
+            for part in reversed(parts):
+                node = node.setdefault(part, {})
+            node[TRIE_END] = slugs[spec_name.lower()]
+
+    return {
+        "version": SPEC_INDEX_VERSION,
+        "dirs_mtime_ns": dirs_mtime,
+        "map_mtime_ns": map_mtime,
+        "slugs": slugs,
+        "dirs": dirs,
+    }
+
+
+def load_spec_index(specs_dir: Path) -> Optional[Dict]:
+    """Return the spec resolution index, rebuilt only when specs/ changes.
+
+    Freshness costs two stats: the specs directory (spec folders added,
+    removed or renamed) and specs/spec_map.json.
+    """
+    # Create the cache folder before taking the specs/ mtime the index is
+    # keyed on; creating it later would make the first index stale.
+    with contextlib.suppress(OSError):
+        cache_dir(specs_dir)
+    dirs_mtime = _mtime_ns(specs_dir)
+    if dirs_mtime is None:
+        return None
+    map_mtime = _mtime_ns(specs_dir / SPEC_MAP_FILENAME)
+
+    def is_fresh(index: Dict) -> bool:
+        return index.get("dirs_mtime_ns") == dirs_mtime and index.get("map_mtime_ns") == map_mtime
+
+    index_file = specs_dir / CACHE_DIRNAME / SPEC_INDEX_FILENAME
+    index = _read_index(index_file, SPEC_INDEX_VERSION, is_fresh)
+    if index is None or not is_fresh(index):
+        index = _build_spec_index(specs_dir, dirs_mtime, map_mtime)
+        _write_index(index_file, index)
+    return index
+
+
+def resolve_spec_name(index: Dict, file_path: str) -> Optional[str]:
+    """Resolve the spec owning file_path; deterministic for a given index.
+
+    1. spec_map.json: the deepest ancestor directory ending with a mapped
+       source directory wins.
+    2. The deepest path component equal to a spec slug.
+    3. Fuzzy fallback: first slug (sorted) contained in, or containing, a
+       path component.
+    """
+    parts = [p.lower() for p in Path(file_path.replace("\\", "/")).parts]
+    dir_parts = parts[:-1]
+
+    dirs = index["dirs"]
+    if dirs:
+        for end in range(len(dir_parts) - 1, -1, -1):
+            node, best = dirs, None
+            for part in reversed(dir_parts[: end + 1]):
+                node = node.get(part)
+                if node is None:
+                    break
+                best = node.get(TRIE_END, best)
+            if best:
+                return best
+
+    slugs = index["slugs"]
+    candidates = [p for p in parts if len(p) > 2]
+    for part in reversed(candidates):
+        if part in slugs:
+            return slugs[part]
+
+    for slug in sorted(slugs):
+        if any(slug in p or p in slug for p in candidates):
+            return slugs[slug]
+    return None
 
 
 def find_related_spec(file_path: str) -> Path | None:
     specs_dir = Path("{{IDE_CONFIG_DIR}}specs")
-    if not specs_dir.exists():
+    index = load_spec_index(specs_dir)
+    if index is None:
         return None
+    spec_name = resolve_spec_name(index, file_path)
+    return specs_dir / spec_name if spec_name else None
 
-    path_parts = [p.lower() for p in Path(file_path).parts]
-    for spec_folder in specs_dir.iterdir():
-        if not spec_folder.is_dir():
-            continue
-        slug = spec_folder.name.lower()
-        if any(slug in p or p in slug for p in path_parts if len(p) > 2):
-            return spec_folder
-    return None
+
+def _spec_parser():
+    # Imported on first use, inside run()'s guard, so a missing or broken
+    # scripts/ folder turns the hook into a no-op instead of a traceback.
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import spec_parser
+
+    return spec_parser
 
 
 def parse_task_registry(tasks_md: str) -> List[Dict[str, str]]:
-    # | ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |
-    pattern = re.compile(
-        r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*"
-        r"([^|]+?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$",
-        re.MULTILINE,
-    )
-
-    rows: List[Dict[str, str]] = []
-    for m in pattern.finditer(tasks_md):
-        rows.append(
-            {
-                "id": m.group(1).strip(),
-                "title": m.group(2).strip(),
-                "type": m.group(3).strip().lower(),
-                "status": m.group(4).strip().lower(),
-                "refs_ac": m.group(5).strip(),
-                "refs_design": m.group(6).strip(),
-                "files": m.group(7).strip(),
-                "checkpoint": m.group(8).strip(),
-            }
-        )
-    return rows
-
-
-def file_matches_row(changed_file: str, files_cell: str) -> bool:
-    targets = [t.strip().strip("`") for t in files_cell.split(",") if t.strip()]
-    if not targets:
-        return False
-    changed = changed_file.replace("\\", "/")
-    for target in targets:
-        normalized = target.replace("\\", "/")
-        if changed.endswith(normalized) or normalized in changed:
-            return True
-    return False
-
-
-def update_registry_status(tasks_md: str, task_id: str, new_status: str) -> str:
-    # Update only the Task Registry row status cell.
-    row_pattern = re.compile(
-        rf"^(\|\s*{re.escape(task_id)}\s*\|\s*[^|]+\|\s*[^|]+\|\s*)([^|]+)(\|.*)$",
-        re.MULTILINE,
-    )
-    return row_pattern.sub(rf"\1 {new_status} \3", tasks_md, count=1)
-
-
-def update_checklist_status(tasks_md: str, task_id: str, mark_done: bool = True) -> str:
-    # Update checklist markdown: - [ ] **TASK_ID** -> - [x] **TASK_ID**
-    if mark_done:
-        # Change from [ ] to [x]
-        pattern = re.compile(
-            rf"^(-\s+\[)\s*(\]\s+\*\*{re.escape(task_id)}\*\*)",
-            re.MULTILINE,
-        )
-        return pattern.sub(rf"\1x\2", tasks_md, count=1)
-    else:
-        # Change from [x] back to [ ] (if needed for rollback)
-        pattern = re.compile(
-            rf"^(-\s+\[)x(\]\s+\*\*{re.escape(task_id)}\*\*)",
-            re.MULTILINE,
-        )
-        return pattern.sub(rf"\1 \2", tasks_md, count=1)
-
-
-def update_traceability_status(tasks_md: str, task_id: str, new_status: str) -> str:
-    # Update Traceability Matrix row status.
-    # Format: | Task ID | AC | Design | Property | Status |
-    pattern = re.compile(
-        rf"^(\|\s*{re.escape(task_id)}\s*\|[^|]+\|[^|]+\|[^|]+\|)([^|]+)(\|.*)$",
-        re.MULTILINE,
-    )
-    return pattern.sub(rf"\1 {new_status} \3", tasks_md, count=1)
+    spec_parser = _spec_parser()
+    return [
+        {
+            "id": row.task_id,
+            "title": row.title,
+            "type": row.task_type,
+            "status": row.status,
+            "refs_ac": row.refs_ac,
+            "refs_design": row.refs_design,
+            "files": row.files,
+            "checkpoint": row.checkpoint,
+        }
+        for row in spec_parser.parse_tasks(tasks_md.splitlines()).registry
+    ]
+
+
+def _read_index(
+    index_file: Path, version: int, is_fresh: Callable[[Dict], bool]
+) -> Optional[Dict]:
+    # This process's copy when still fresh; otherwise the on-disk index,
+    # which another process may have brought up to date.
+    loaded = _LOADED_INDEXES.get(str(index_file))
+    if loaded is not None and loaded.get("version") == version and is_fresh(loaded):
+        return loaded
+    try:
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != version:
+        return None
+    _LOADED_INDEXES[str(index_file)] = index
+    return index
 
 
-def sync_task_completion(tasks_md: str, task_id: str) -> str:
-    # Sync all three locations when marking task as done
-    content = update_registry_status(tasks_md, task_id, "done")
-    content = update_checklist_status(content, task_id, mark_done=True)
-    content = update_traceability_status(content, task_id, "done")
-    return content
+def cache_dir(spec_dir: Path) -> Path:
+    """Return the spec's cache folder, creating it with a catch-all .gitignore."""
+    directory = spec_dir / CACHE_DIRNAME
+    if not directory.is_dir():
+        directory.mkdir(exist_ok=True)
+        (directory / ".gitignore").write_text("*\n", encoding="utf-8")
+    return directory
 
 
-def main() -> None:
+def _atomic_write_text(path: Path, text: str) -> os.stat_result:
+    """Replace path with text; return the stat of the file written."""
+    tmp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
     try:
-        payload = json.load(sys.stdin)
-        action = payload.get("action", "auto")  # "auto", "mark_done", "mark_blocked"
-        task_id = payload.get("task_id", "")
-
-        # Handle explicit mark done/blocked from agent
-        if action in ("mark_done", "mark_blocked") and task_id:
-            spec_name = payload.get("spec_name", "")
-            if not spec_name:
-                return
-
-            specs_dir = Path("{{IDE_CONFIG_DIR}}specs")
-            tasks_file = specs_dir / spec_name / "tasks.md"
-            if not tasks_file.exists():
-                return
-
-            content = tasks_file.read_text()
-            new_status = "done" if action == "mark_done" else "blocked"
-
-            # Update all three locations
-            content = update_registry_status(content, task_id, new_status)
-            if action == "mark_done":
-                content = update_checklist_status(content, task_id, mark_done=True)
-            content = update_traceability_status(content, task_id, new_status)
-
-            tasks_file.write_text(content)
-            print(
-                f"✅ Task {task_id} marked as {new_status} (registry + checklist + traceability)"
-            )
-            return
+        tmp_file.write_text(text, encoding="utf-8")
+        with contextlib.suppress(OSError):
+            os.chmod(tmp_file, path.stat().st_mode & 0o7777)
+        # Taken before the rename, so a later writer cannot slip in between.
+        stat = tmp_file.stat()
+        os.replace(tmp_file, path)
+        return stat
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+        raise
+
+
+def _raise_lock_timeout(signum, frame) -> None:
+    raise TimeoutError("Timed out waiting for tasks.md lock")
+
+
+def _acquire_lock(fd: int) -> None:
+    if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+        # Block in the kernel so waiters are woken as soon as the holder is
+        # done; the interval timer bounds the wait.
+        previous = signal.signal(signal.SIGALRM, _raise_lock_timeout)
+        signal.setitimer(signal.ITIMER_REAL, LOCK_TIMEOUT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        return
 
-        # Auto-detect mode (when files change)
-        changed_path = payload.get("tool_input", {}).get("file_path", "")
-        if not changed_path or not changed_path.endswith(".swift"):
+    # Off the main thread signals are unavailable: poll with jittered backoff.
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    delay = LOCK_BACKOFF_MIN
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             return
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Timed out waiting for tasks.md lock")
+            time.sleep(random.uniform(delay / 2, delay))
+            delay = min(delay * 2, LOCK_BACKOFF_MAX)
+
+
+@contextlib.contextmanager
+def tasks_lock(tasks_file: Path) -> Iterator[None]:
+    """Hold an exclusive lock on tasks_file for a read-modify-write.
+
+    tasks.md itself is replaced on every write, so the lock lives on a
+    sidecar file in the spec's gitignored cache folder. Waiting is bounded
+    by LOCK_TIMEOUT; TimeoutError is raised rather than blocking the edit
+    flow forever.
+    """
+    if fcntl is None:
+        yield
+        return
 
-        if "{{IDE_CONFIG_DIR}}specs" in changed_path:
-            return
+    lock_path = cache_dir(tasks_file.parent) / f"{tasks_file.name}.lock"
+    with open(lock_path, "a") as lock_file:
+        _acquire_lock(lock_file.fileno())
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_index(index_file: Path, index: Dict) -> None:
+    _LOADED_INDEXES[str(index_file)] = index
+    # Indexes are only caches; a read-only config dir must not break the hook.
+    with contextlib.suppress(OSError):
+        if index_file.parent.name == CACHE_DIRNAME:
+            cache_dir(index_file.parent.parent)
+        _atomic_write_text(index_file, json.dumps(index, separators=(",", ":")))
+
+
+def _task_index_file(tasks_file: Path) -> Path:
+    return tasks_file.parent / CACHE_DIRNAME / INDEX_FILENAME
+
+
+def _stamp_index(index: Dict, stat: os.stat_result, data: bytes) -> None:
+    # stat must describe the file data came from: stamping a stale parse
+    # with a newer file's mtime and size would make it look fresh.
+    index["mtime_ns"] = stat.st_mtime_ns
+    index["size"] = stat.st_size
+    index["sha1"] = hashlib.sha1(data).hexdigest()
+
+
+def read_tasks_file(tasks_file: Path) -> Tuple[bytes, os.stat_result]:
+    """Read tasks_file together with the stat of the bytes read.
+
+    tasks.md is replaced, never rewritten in place, so fstat on the handle
+    read from always describes the data returned.
+    """
+    with open(tasks_file, "rb") as f:
+        return f.read(), os.fstat(f.fileno())
+
+
+def decode_tasks(data: bytes) -> str:
+    # Same text Path.read_text() gives: universal newlines.
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def load_task_index(
+    tasks_file: Path, read: Optional[Tuple[bytes, os.stat_result]] = None
+) -> Dict:
+    """Return the parsed Task Registry for tasks_file, re-parsing only on change.
+
+    The cache is trusted while tasks.md keeps the same mtime and size. When
+    those differ but the content hash does not (touch, checkout), only the
+    stat key is refreshed. A read-modify-write passes the read_tasks_file()
+    result it already holds as read, so tasks.md is read once.
+    """
+    stat = read[1] if read is not None else tasks_file.stat()
+
+    def is_fresh(index: Dict) -> bool:
+        return index.get("mtime_ns") == stat.st_mtime_ns and index.get("size") == stat.st_size
+
+    index_file = _task_index_file(tasks_file)
+    index = _read_index(index_file, INDEX_VERSION, is_fresh)
+    if index is not None and is_fresh(index):
+        return index
+
+    data, read_stat = read if read is not None else read_tasks_file(tasks_file)
+    if index is None or index.get("sha1") != hashlib.sha1(data).hexdigest():
+        rows = parse_task_registry(data.decode("utf-8"))
+        trie = _spec_parser().build_path_trie(row["files"] for row in rows)
+        index = {"version": INDEX_VERSION, "rows": rows, "trie": trie}
+    _stamp_index(index, read_stat, data)
+    _write_index(index_file, index)
+    return index
+
+
+def refresh_task_index(
+    tasks_file: Path,
+    index: Dict,
+    content: str,
+    statuses: Dict[str, str],
+    written: os.stat_result,
+) -> None:
+    # Apply status changes the hook just wrote instead of invalidating the
+    # index; written is the stat _atomic_write_text returned for content.
+    for row in index["rows"]:
+        if row["id"] in statuses:
+            row["status"] = statuses[row["id"]]
+    _stamp_index(index, written, content.encode("utf-8"))
+    _write_index(_task_index_file(tasks_file), index)
+
+
+def tasks_for_file(index: Dict, changed_file: str) -> List[Dict[str, str]]:
+    # A task owns the file when one of its Files targets is a substring of the path.
+    rows = index["rows"]
+    matches = _spec_parser().match_path_trie(index["trie"], changed_file)
+    return [rows[pos] for pos in matches]
+
+
+def apply_status_updates(
+    tasks_md: str, statuses: Dict[str, str], sync_matrix: bool = True
+) -> str:
+    """Apply task status changes to tasks.md in a single line-oriented pass.
+
+    statuses maps task ID -> new status and may hold any number of tasks.
+    For each task the first Task Registry row (8 cells) gets the new status,
+    the first Traceability Matrix row (5 cells) too when sync_matrix is set,
+    and a "done" status ticks the first unchecked checklist item.
+    """
+    spec_parser = _spec_parser()
+    registry = dict(statuses)
+    matrix = dict(statuses) if sync_matrix else {}
+    checklist = {task_id for task_id, status in statuses.items() if status == "done"}
+
+    lines = tasks_md.splitlines(keepends=True)
+    for n, line in enumerate(lines):
+        if not (registry or matrix or checklist):
+            break
+        if line.startswith("|"):
+            # Cheap ID probe first; most table rows belong to other tasks.
+            task_id = line[1 : line.find("|", 1)].strip()
+            if task_id not in registry and task_id not in matrix:
+                continue
+            body = line.rstrip("\r\n")
+            cells = body.split("|")
+            if not body.rstrip().endswith("|"):
+                continue
+            # Raw split keeps the empty cells outside the outer pipes.
+            if len(cells) == spec_parser.REGISTRY_COLUMNS + 2 and task_id in registry:
+                cells[4] = f" {registry.pop(task_id)} "
+            elif len(cells) == spec_parser.MATRIX_COLUMNS + 2 and task_id in matrix:
+                cells[5] = f" {matrix.pop(task_id)} "
+            else:
+                continue
+            lines[n] = "|".join(cells) + line[len(body):]
+        elif checklist and line.startswith("-"):
+            m = spec_parser.CHECKLIST_PATTERN.match(line)
+            if m and m.group(1) != "x" and m.group(2) in checklist:
+                checklist.discard(m.group(2))
+                lines[n] = f"{line[:m.start(1)]}x{line[m.end(1):]}"
+    return "".join(lines)
 
-        spec_folder = find_related_spec(changed_path)
-        if not spec_folder:
-            return
 
-        tasks_file = spec_folder / "tasks.md"
-        if not tasks_file.exists():
-            return
+def sync_task_completion(tasks_md: str, task_id: str) -> str:
+    # Sync all three locations when marking task as done
+    return apply_status_updates(tasks_md, {task_id: "done"})
 
-        content = tasks_file.read_text()
-        rows = parse_task_registry(content)
-        if not rows:
-            return
 
-        matched = [r for r in rows if file_matches_row(changed_path, r["files"])]
-        if not matched:
-            return
+def collect_status_updates(payload: Dict) -> Dict[str, Dict[str, str]]:
+    # Explicit updates grouped as spec name -> {task ID: new status}.
+    entries = payload.get("updates")
+    if not isinstance(entries, list):
+        entries = [payload]
+
+    by_spec: Dict[str, Dict[str, str]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        status = STATUS_ACTIONS.get(entry.get("action", payload.get("action")))
+        task_id = entry.get("task_id", "")
+        spec_name = entry.get("spec_name") or payload.get("spec_name", "")
+        if status and task_id and spec_name:
+            by_spec.setdefault(spec_name, {})[task_id] = status
+    return by_spec
+
+
+def apply_spec_updates(spec_name: str, statuses: Dict[str, str]) -> bool:
+    tasks_file = Path("{{IDE_CONFIG_DIR}}specs") / spec_name / "tasks.md"
+    if not tasks_file.exists():
+        return False
+
+    with tasks_lock(tasks_file):
+        read = read_tasks_file(tasks_file)
+        index = load_task_index(tasks_file, read)
+        content = decode_tasks(read[0])
+        updated = apply_status_updates(content, statuses)
+        if updated != content:
+            written = _atomic_write_text(tasks_file, updated)
+            refresh_task_index(tasks_file, index, updated, statuses, written)
+    return True
+
+
+def handle_payload(payload: Dict) -> None:
+    # Handle explicit mark done/blocked from agent (one task or a batch)
+    updates = collect_status_updates(payload)
+    for spec_name, statuses in updates.items():
+        if not apply_spec_updates(spec_name, statuses):
+            continue
+        by_status: Dict[str, List[str]] = {}
+        for task_id, status in statuses.items():
+            by_status.setdefault(status, []).append(task_id)
+        for status, task_ids in by_status.items():
+            label = f"Task {task_ids[0]}" if len(task_ids) == 1 else f"Tasks {', '.join(task_ids)}"
+            print(f"✅ {label} marked as {status} (registry + checklist + traceability)")
+    if updates:
+        return
+
+    # Auto-detect mode (when files change)
+    changed_path = payload.get("tool_input", {}).get("file_path", "")
+    if not changed_path or not changed_path.endswith(".swift"):
+        return
+
+    if "{{IDE_CONFIG_DIR}}specs" in changed_path:
+        return
 
-        print(f"\n📋 Spec: {spec_folder.name}")
-        print(f"📝 File changed: {changed_path}")
-        print("🎯 Matched tasks:")
-        for row in matched[:5]:
-            print(f"   - [{row['id']}] {row['title']} ({row['status']})")
+    spec_folder = find_related_spec(changed_path)
+    if not spec_folder:
+        return
 
-        pending = [r for r in matched if r["status"] == "pending"]
-        if len(pending) == 1:
-            row = pending[0]
-            updated = update_registry_status(content, row["id"], "in_progress")
-            if updated != content:
-                tasks_file.write_text(updated)
-                print(f"\n🔄 Auto-updated task {row['id']} -> in_progress")
+    tasks_file = spec_folder / "tasks.md"
+    if not tasks_file.exists():
+        return
 
-        print("💡 Keep task status and traceability rows in sync after completion.")
+    index = load_task_index(tasks_file)
+    matched = tasks_for_file(index, changed_path)
+    if not matched:
+        return
 
+    print(f"\n📋 Spec: {spec_folder.name}")
+    print(f"📝 File changed: {changed_path}")
+    print("🎯 Matched tasks:")
+    for row in matched[:5]:
+        print(f"   - [{row['id']}] {row['title']} ({row['status']})")
+
+    pending = [r for r in matched if r["status"] == "pending"]
+    if len(pending) == 1:
+        task_id = pending[0]["id"]
+        with tasks_lock(tasks_file):
+            # Another agent may have moved the task on since the lookup.
+            read = read_tasks_file(tasks_file)
+            index = load_task_index(tasks_file, read)
+            if any(r["id"] == task_id and r["status"] == "pending" for r in index["rows"]):
+                content = decode_tasks(read[0])
+                updated = apply_status_updates(content, {task_id: "in_progress"}, sync_matrix=False)
+                if updated != content:
+                    written = _atomic_write_text(tasks_file, updated)
+                    refresh_task_index(
+                        tasks_file, index, updated, {task_id: "in_progress"}, written
+                    )
+                    print(f"\n🔄 Auto-updated task {task_id} -> in_progress")
+
+    print("💡 Keep task status and traceability rows in sync after completion.")
+
+
+def run(raw_payload: bytes) -> None:
+    try:
+        handle_payload(json.loads(raw_payload))
     except Exception:
         # Silent fail by design; never block user editing flow.
         return
 
 
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _daemon_running() -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(SOCKET_PATH)
+        return True
+    except OSError:
+        return False
+
+
+def serve(idle_timeout: float = DAEMON_IDLE_TIMEOUT) -> None:
+    """Serve hook payloads on SOCKET_PATH until idle for idle_timeout seconds.
+
+    Requests are handled one at a time, so updates from concurrent edits are
+    serialized. The daemon also exits when this file is modified (e.g. by a
+    toolkit reinstall) so clients never talk to stale code.
+    """
+    # Hooks resolve {{IDE_CONFIG_DIR}} paths relative to the project root.
+    os.chdir(Path(__file__).resolve().parent.parent.parent)
+    if _daemon_running():
+        print(f"Daemon already running on {SOCKET_PATH}")
+        return
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(SOCKET_PATH)
+    source_mtime = _mtime_ns(Path(__file__))
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket usable by the owner only
+    try:
+        server.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(idle_timeout)
+    print(f"Serving task status hook on {SOCKET_PATH} (idle timeout {idle_timeout:g}s)")
+
+    try:
+        while _mtime_ns(Path(__file__)) == source_mtime:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                conn.settimeout(10)
+                try:
+                    raw_payload = _recv_all(conn)
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        run(raw_payload)
+                    conn.sendall(output.getvalue().encode("utf-8"))
+                except OSError:
+                    continue
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(SOCKET_PATH)
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        serve(float(sys.argv[2]) if len(sys.argv) > 2 else DAEMON_IDLE_TIMEOUT)
+        return
+    run(sys.stdin.buffer.read())
+
+
 if __name__ == "__main__":
     main()
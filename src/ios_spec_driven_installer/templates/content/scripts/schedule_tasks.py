@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Parallel execution schedule for one spec's tasks.
+
+Builds a dependency DAG over the Task Registry in tasks.md and groups the
+tasks into waves: a task only depends on tasks of earlier waves, so every
+wave can run in parallel (shared/PARALLEL_EXECUTION_GUIDE.md).
+
+Edges follow the guide's rules:
+- Phase gates: the first ID component is the phase (2 Shared, 3 Feature,
+  4 Integration); a phase starts once every task of the previous one is done.
+- Tracks: Feature tasks of one feature (3.1.x) run in order while features
+  run in parallel; Shared and Integration tasks run in order. Within a track
+  tasks are ordered by Checkpoint, then ID.
+- Shared files: tasks whose Files overlap (the same file, or a file inside a
+  listed directory) run in that order too.
+- Dependency Matrix: every "Depends On" entry.
+
+The critical path is the longest chain of tasks through the DAG, one step
+per task. Done tasks count as finished unless --include-done is given.
+
+Usage:
+    python schedule_tasks.py <feature-name>
+    python schedule_tasks.py <feature-name> --format json
+    python schedule_tasks.py <feature-name> --include-done
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import spec_parser
+
+SPECS_DIR = Path("{{IDE_CONFIG_DIR}}specs")
+
+# Phase whose features (second ID component) run in parallel.
+FEATURE_PHASE = "3"
+
+
+class ScheduleError(Exception):
+    pass
+
+
+def phase_of(task_id: str) -> str:
+    return task_id.split(".", 1)[0]
+
+
+def track_of(task_id: str) -> str:
+    if phase_of(task_id) == FEATURE_PHASE:
+        return ".".join(task_id.split(".")[:2])
+    return phase_of(task_id)
+
+
+def task_key(task_id: str) -> Tuple[int, ...]:
+    """Numeric order of a registry ID (always dotted integers): 3.1.10 after 3.1.9."""
+    return tuple(map(int, task_id.split(".")))
+
+
+def gate_of(phase: str) -> str:
+    """Node standing for "phase done"; never a valid task ID."""
+    return f"phase-{phase}"
+
+
+class TaskSchedule:
+    def __init__(
+        self,
+        waves: List[List[str]],
+        critical_path: List[str],
+        depends_on: Dict[str, List[str]],
+    ):
+        self.waves = waves
+        self.critical_path = critical_path
+        self.depends_on = depends_on
+
+    @property
+    def task_count(self) -> int:
+        return sum(len(wave) for wave in self.waves)
+
+    @property
+    def max_parallel(self) -> int:
+        return max((len(wave) for wave in self.waves), default=0)
+
+
+class DependencyGraph:
+    def __init__(self) -> None:
+        self.tasks: Dict[str, spec_parser.RegistryRow] = {}
+        # node -> nodes that must finish first; nodes are task IDs and gates.
+        self.preds: Dict[str, Set[str]] = {}
+        self._order: Dict[str, Tuple] = {}
+        self._checkpoint_keys: Dict[str, Tuple] = {}
+        self.warnings: List[str] = []
+
+    @classmethod
+    def from_tasks_file(cls, tasks_file: Path) -> "DependencyGraph":
+        graph = cls()
+        declared: List[spec_parser.DependencyRow] = []
+        with tasks_file.open(encoding="utf-8") as lines:
+            for element in spec_parser.iter_elements(lines):
+                if isinstance(element, spec_parser.RegistryRow):
+                    graph._add_task(element)
+                elif isinstance(element, spec_parser.DependencyRow):
+                    declared.append(element)
+
+        ordered = sorted(graph.tasks, key=graph._order.__getitem__)
+        graph._link_phases(ordered)
+        graph._link_tracks(ordered)
+        graph._link_shared_files(ordered)
+        graph._link_declared(declared)
+        return graph
+
+    def _add_task(self, row: spec_parser.RegistryRow) -> None:
+        task_id = row.task_id
+        self.tasks[task_id] = row
+        self.preds.setdefault(task_id, set())
+        checkpoint = row.checkpoint.strip("-` ") or task_id.rsplit(".", 1)[0]
+        checkpoint_key = self._checkpoint_keys.get(checkpoint)
+        if checkpoint_key is None:
+            checkpoint_key = spec_parser.id_sort_key(checkpoint)
+            self._checkpoint_keys[checkpoint] = checkpoint_key
+        task_order = task_key(task_id)
+        self._order[task_id] = (task_order[0], 0, checkpoint_key, task_order)
+
+    def link(self, before: str, after: str) -> None:
+        if before != after:
+            self.preds[after].add(before)
+
+    def _link_phases(self, ordered: List[str]) -> None:
+        phases: Dict[str, List[str]] = {}
+        for task_id in ordered:
+            phases.setdefault(phase_of(task_id), []).append(task_id)
+        numbers = sorted(phases, key=int)
+        for phase, next_phase in zip(numbers, numbers[1:]):
+            gate = gate_of(phase)
+            self.preds[gate] = set(phases[phase])
+            self._order[gate] = (int(phase), 1)
+            for task_id in phases[next_phase]:
+                self.link(gate, task_id)
+
+    def _link_tracks(self, ordered: List[str]) -> None:
+        last_in_track: Dict[str, str] = {}
+        for task_id in ordered:
+            track = track_of(task_id)
+            previous = last_in_track.get(track)
+            if previous is not None:
+                self.link(previous, task_id)
+            last_in_track[track] = task_id
+
+    def _link_shared_files(self, ordered: List[str]) -> None:
+        """Order tasks touching the same file, or a file inside a listed directory.
+
+        Edges follow the global order, so they never close a cycle with the
+        phase and track edges. Linear in the number of Files targets times
+        their path depth.
+        """
+        last_for_target: Dict[str, str] = {}
+        # Directory target -> last task listing it.
+        last_for_dir: Dict[str, str] = {}
+        # Directory -> tasks listing something inside it since last_for_dir.
+        inside: Dict[str, List[str]] = {}
+        for task_id in ordered:
+            for target in self.tasks[task_id].file_targets:
+                previous = last_for_target.get(target)
+                if previous is not None:
+                    self.link(previous, task_id)
+                parents = [target[: i + 1] for i, c in enumerate(target[:-1]) if c == "/"]
+                for parent in parents:
+                    if parent in last_for_dir:
+                        self.link(last_for_dir[parent], task_id)
+                if target.endswith("/"):
+                    for previous in inside.pop(target, []):
+                        self.link(previous, task_id)
+                    last_for_dir[target] = task_id
+                last_for_target[target] = task_id
+                for parent in parents:
+                    inside.setdefault(parent, []).append(task_id)
+
+    def _link_declared(self, rows: List[spec_parser.DependencyRow]) -> None:
+        for row in rows:
+            if row.task_id not in self.tasks:
+                self.warnings.append(f"Dependency Matrix lists unknown task {row.task_id}")
+                continue
+            for dependency in row.dependency_ids:
+                if dependency in self.tasks:
+                    self.link(dependency, row.task_id)
+                else:
+                    self.warnings.append(
+                        f"Task {row.task_id} depends on unknown task {dependency}"
+                    )
+
+    def schedule(self, include_done: bool = False) -> TaskSchedule:
+        """Kahn's algorithm; each node starts when its last predecessor finishes.
+
+        Raises ScheduleError when the Dependency Matrix introduces a cycle.
+        """
+        # Phase gates and finished tasks take no step.
+        steps = dict.fromkeys(self.preds, 0)
+        for task_id, row in self.tasks.items():
+            if include_done or row.status != "done":
+                steps[task_id] = 1
+
+        key = self._order.__getitem__
+
+        def id_key(task_id: str) -> Tuple[int, ...]:
+            return self._order[task_id][3]
+
+        preds = self.preds
+        succs: Dict[str, List[str]] = {node: [] for node in preds}
+        for node, before in preds.items():
+            for pred in before:
+                succs[pred].append(node)
+        waiting = {node: len(before) for node, before in preds.items()}
+        ready = deque(sorted((n for n, count in waiting.items() if count == 0), key=key))
+
+        finish: Dict[str, int] = {}
+        # Predecessor that finishes last: the critical chain into each node.
+        via: Dict[str, Optional[str]] = {}
+        while ready:
+            node = ready.popleft()
+            start, last = 0, None
+            for pred in preds[node]:
+                # Ties go to the earliest predecessor, for a stable critical path.
+                if finish[pred] > start or (
+                    finish[pred] == start and last is not None and key(pred) < key(last)
+                ):
+                    start, last = finish[pred], pred
+            finish[node] = start + steps[node]
+            via[node] = last
+            for succ in succs[node]:
+                waiting[succ] -= 1
+                if waiting[succ] == 0:
+                    ready.append(succ)
+
+        if len(finish) < len(preds):
+            stuck = self._cycle_nodes({n for n in preds if n not in finish}, succs)
+            cycle = spec_parser.sorted_ids(n for n in stuck if n in self.tasks)
+            raise ScheduleError(f"Dependency cycle among tasks: {', '.join(cycle)}")
+
+        waves: List[List[str]] = [[] for _ in range(max(finish.values(), default=0))]
+        for task_id in self.tasks:
+            if steps[task_id]:
+                waves[finish[task_id] - 1].append(task_id)
+        waves = [sorted(wave, key=id_key) for wave in waves]
+
+        critical_path: List[str] = []
+        node = max(self.tasks, key=lambda n: (finish[n], key(n)), default=None)
+        while node is not None:
+            if steps[node]:
+                critical_path.append(node)
+            node = via[node]
+        critical_path.reverse()
+
+        depends_on = {
+            task_id: sorted((p for p in preds[task_id] if p in self.tasks), key=id_key)
+            for task_id in self.tasks
+        }
+        return TaskSchedule(waves, critical_path, depends_on)
+
+    @staticmethod
+    def _cycle_nodes(unfinished: Set[str], succs: Dict[str, List[str]]) -> Set[str]:
+        """Drop unfinished nodes that are only blocked downstream of a cycle."""
+        remaining = {n: sum(s in unfinished for s in succs[n]) for n in unfinished}
+        sinks = deque(n for n, count in remaining.items() if count == 0)
+        preds_of: Dict[str, List[str]] = {n: [] for n in unfinished}
+        for node in unfinished:
+            for succ in succs[node]:
+                if succ in unfinished:
+                    preds_of[succ].append(node)
+        while sinks:
+            node = sinks.popleft()
+            unfinished.discard(node)
+            for pred in preds_of[node]:
+                remaining[pred] -= 1
+                if remaining[pred] == 0:
+                    sinks.append(pred)
+        return unfinished
+
+
+def print_schedule(
+    graph: DependencyGraph, schedule: TaskSchedule, feature_name: str
+) -> None:
+    count, waves = schedule.task_count, len(schedule.waves)
+    print(f"\n{'=' * 60}")
+    print(f"Task Schedule: {feature_name}")
+    print(f"{'=' * 60}\n")
+    print(f"{count} tasks in {waves} waves (up to {schedule.max_parallel} in parallel)\n")
+
+    for number, wave in enumerate(schedule.waves, 1):
+        print(f"Wave {number} ({len(wave)}):")
+        for task_id in wave:
+            print(f"  - {task_id} {graph.tasks[task_id].title}")
+        print()
+
+    path = schedule.critical_path
+    print(f"Critical path ({len(path)} tasks): {' -> '.join(path)}")
+    if count:
+        saved = 100 * (count - waves) // count
+        print(f"Sequential: {count} steps; parallel: {waves} steps ({saved}% fewer)")
+
+    for warning in graph.warnings:
+        print(f"⚠️  {warning}")
+    print(f"\n{'=' * 60}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compute parallel task waves for a spec.")
+    parser.add_argument("feature_name", help="spec folder under specs/")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument(
+        "--include-done", action="store_true", help="schedule done tasks as well"
+    )
+    args = parser.parse_args()
+
+    tasks_file = SPECS_DIR / args.feature_name / "tasks.md"
+    if not tasks_file.exists():
+        print(f"tasks.md not found: {tasks_file}", file=sys.stderr)
+        sys.exit(1)
+
+    graph = DependencyGraph.from_tasks_file(tasks_file)
+    try:
+        schedule = graph.schedule(args.include_done)
+    except ScheduleError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        record = {
+            "spec": args.feature_name,
+            "tasks": schedule.task_count,
+            "waves": schedule.waves,
+            "max_parallel": schedule.max_parallel,
+            "critical_path": schedule.critical_path,
+            "depends_on": schedule.depends_on,
+            "warnings": graph.warnings,
+        }
+        print(json.dumps(record))
+    else:
+        print_schedule(graph, schedule, args.feature_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Shared line-oriented parser for spec markdown files.
+
+Each line is classified once, with precompiled patterns, as one of:
+- heading:        ## 4. Data Models
+- registry row:   | ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |
+- matrix row:     | Task ID | AC | Design | Property | Status |
+- dependency row: | Task | Depends On | Can Parallel With |
+- property row:   | P1 | ... | AC-001.1 | ...
+- checklist item: - [ ] **3.1.1** Build ViewModel
+
+Patterns never see more than one line, so a malformed table cannot make them
+backtrack across the file. Also provides the reversed path trie that maps a
+changed file to the registry rows listing it. Used by validate_traceability.py,
+traceability_graph.py, schedule_tasks.py and hooks/update_task_status.py.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+REGISTRY_COLUMNS = 8
+MATRIX_COLUMNS = 5
+DEPENDENCY_COLUMNS = 3
+
+# Path trie key marking the end of a Files target; never a path character.
+TRIE_END = ""
+
+TASK_ID_PATTERN = re.compile(r"\d+(?:\.\d+)+")
+PROPERTY_ID_PATTERN = re.compile(r"P\d+")
+AC_REF_PATTERN = re.compile(r"\bAC-\d+\.\d+\b")
+DESIGN_REF_PATTERN = re.compile(r"\b\d+(?:\.\d+)*\b")
+PROPERTY_REF_PATTERN = re.compile(r"\bP\d+\b")
+TASK_REF_PATTERN = re.compile(r"\b\d+(?:\.\d+)+\b")
+_NUMBER_PATTERN = re.compile(r"(\d+)")
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+# Leading section number of a heading: "4. Data Models" -> "4"
+SECTION_NUMBER_PATTERN = re.compile(r"(\d+(?:\.\d+)*)\b")
+
+# - [ ] **3.1.1** Build ViewModel
+# - [x] 3.1.2 Wire navigation
+CHECKLIST_PATTERN = re.compile(
+    r"^-\s+\[([x\s])\]\s+(?:\*\*)?(\d+(?:\.\d+)+)(?:\*\*)?\s+(.+)$"
+)
+
+
+@dataclass
+class Heading:
+    line: int
+    level: int
+    text: str
+    number: Optional[str]
+
+
+@dataclass
+class RegistryRow:
+    line: int
+    task_id: str
+    title: str
+    task_type: str
+    status: str
+    refs_ac: str
+    refs_design: str
+    files: str
+    checkpoint: str
+
+    @property
+    def ac_refs(self) -> List[str]:
+        return AC_REF_PATTERN.findall(self.refs_ac)
+
+    @property
+    def design_refs(self) -> List[str]:
+        return DESIGN_REF_PATTERN.findall(self.refs_design)
+
+    @property
+    def file_targets(self) -> List[str]:
+        return file_targets(self.files)
+
+
+@dataclass
+class MatrixRow:
+    line: int
+    task_id: str
+    refs_ac: str
+    refs_design: str
+    refs_property: str
+    status: str
+
+    @property
+    def ac_refs(self) -> List[str]:
+        return AC_REF_PATTERN.findall(self.refs_ac)
+
+    @property
+    def design_refs(self) -> List[str]:
+        return DESIGN_REF_PATTERN.findall(self.refs_design)
+
+    @property
+    def property_refs(self) -> List[str]:
+        return PROPERTY_REF_PATTERN.findall(self.refs_property)
+
+
+@dataclass
+class DependencyRow:
+    line: int
+    task_id: str
+    depends_on: str
+    parallel_with: str
+
+    @property
+    def dependency_ids(self) -> List[str]:
+        return TASK_REF_PATTERN.findall(self.depends_on)
+
+
+@dataclass
+class PropertyRow:
+    line: int
+    prop_id: str
+    ac_refs: List[str]
+
+
+@dataclass
+class ChecklistItem:
+    line: int
+    task_id: str
+    title: str
+    checked: bool
+
+
+Element = Union[Heading, RegistryRow, MatrixRow, DependencyRow, PropertyRow, ChecklistItem]
+
+
+@dataclass
+class DesignModel:
+    sections: Set[str] = field(default_factory=set)
+    properties: List[PropertyRow] = field(default_factory=list)
+
+
+@dataclass
+class TasksModel:
+    registry: List[RegistryRow] = field(default_factory=list)
+    checklist: List[ChecklistItem] = field(default_factory=list)
+    matrix: List[MatrixRow] = field(default_factory=list)
+    dependencies: List[DependencyRow] = field(default_factory=list)
+
+
+def split_row(line: str) -> Optional[List[str]]:
+    """Return the stripped cells of a markdown table row, or None."""
+    row = line.strip()
+    if len(row) < 2 or row[0] != "|" or row[-1] != "|":
+        return None
+    return [cell.strip() for cell in row[1:-1].split("|")]
+
+
+def _classify_row(line: str, line_no: int) -> Optional[Element]:
+    cells = split_row(line)
+    if not cells:
+        return None
+    first = cells[0]
+    if TASK_ID_PATTERN.fullmatch(first):
+        if len(cells) == REGISTRY_COLUMNS:
+            return RegistryRow(
+                line_no,
+                first,
+                cells[1],
+                cells[2].lower(),
+                cells[3].lower(),
+                cells[4],
+                cells[5],
+                cells[6],
+                cells[7],
+            )
+        if len(cells) == MATRIX_COLUMNS:
+            return MatrixRow(line_no, first, cells[1], cells[2], cells[3], cells[4].lower())
+        if len(cells) == DEPENDENCY_COLUMNS:
+            return DependencyRow(line_no, first, cells[1], cells[2])
+        return None
+    if PROPERTY_ID_PATTERN.fullmatch(first):
+        return PropertyRow(line_no, first, AC_REF_PATTERN.findall(line))
+    return None
+
+
+def classify_line(line: str, line_no: int = 0) -> Optional[Element]:
+    """Classify one line; returns None for prose and unrelated tables."""
+    head = line.lstrip()[:1]
+    if head == "|":
+        return _classify_row(line, line_no)
+    if head == "#":
+        m = HEADING_PATTERN.match(line)
+        if not m:
+            return None
+        text = m.group(2)
+        number = SECTION_NUMBER_PATTERN.match(text)
+        return Heading(line_no, len(m.group(1)), text, number.group(1) if number else None)
+    if head == "-":
+        m = CHECKLIST_PATTERN.match(line)
+        if not m:
+            return None
+        return ChecklistItem(line_no, m.group(2), m.group(3).strip(), m.group(1) == "x")
+    return None
+
+
+def iter_elements(lines: Iterable[str]) -> Iterator[Element]:
+    for line_no, line in enumerate(lines, 1):
+        element = classify_line(line, line_no)
+        if element is not None:
+            yield element
+
+
+def parse_requirements(lines: Iterable[str]) -> Set[str]:
+    """Return every acceptance criterion ID mentioned in requirements.md."""
+    acceptance_criteria: Set[str] = set()
+    for line in lines:
+        if "AC-" in line:
+            acceptance_criteria.update(AC_REF_PATTERN.findall(line))
+    return acceptance_criteria
+
+
+def parse_design(lines: Iterable[str]) -> DesignModel:
+    model = DesignModel()
+    for element in iter_elements(lines):
+        if isinstance(element, Heading):
+            if element.number and 2 <= element.level <= 3:
+                model.sections.add(element.number)
+        elif isinstance(element, PropertyRow):
+            model.properties.append(element)
+    return model
+
+
+def parse_tasks(lines: Iterable[str]) -> TasksModel:
+    model = TasksModel()
+    for element in iter_elements(lines):
+        if isinstance(element, RegistryRow):
+            model.registry.append(element)
+        elif isinstance(element, ChecklistItem):
+            model.checklist.append(element)
+        elif isinstance(element, MatrixRow):
+            model.matrix.append(element)
+        elif isinstance(element, DependencyRow):
+            model.dependencies.append(element)
+    return model
+
+
+def id_sort_key(node_id: str) -> Tuple:
+    """Natural order: 3.2.10 after 3.2.9, AC-010.1 after AC-009.4."""
+    return tuple(int(part) if part.isdigit() else part for part in _NUMBER_PATTERN.split(node_id))
+
+
+def sorted_ids(node_ids: Iterable[str]) -> List[str]:
+    return sorted(node_ids, key=id_sort_key)
+
+
+def file_targets(files: str) -> List[str]:
+    """Split a Files cell into normalized targets: `A.swift`, B/ -> A.swift, B/"""
+    targets = []
+    for target in files.split(","):
+        normalized = target.strip().strip("`").replace("\\", "/")
+        if normalized:
+            targets.append(normalized)
+    return targets
+
+
+def _trie_insert(trie: Dict, key: str, pos: int) -> None:
+    node = trie
+    while key:
+        edge = node.get(key[0])
+        if edge is None:
+            node[key[0]] = [key, {TRIE_END: [pos]}]
+            return
+        label = edge[0]
+        common = len(os.path.commonprefix([label, key]))
+        if common < len(label):
+            # Split the edge so the shared part leads to a new branch node.
+            edge[0], edge[1] = label[:common], {label[common]: [label[common:], edge[1]]}
+        node = edge[1]
+        key = key[common:]
+    owners = node.setdefault(TRIE_END, [])
+    if not owners or owners[-1] != pos:
+        owners.append(pos)
+
+
+def build_path_trie(files_cells: Iterable[str]) -> Dict:
+    """Build a reversed radix trie over every normalized Files target.
+
+    files_cells holds one Files cell per owner (e.g. registry row); owners are
+    identified by their position. Nodes map the first character of an edge
+    label to ``[label, child]``, where labels are reversed path fragments;
+    TRIE_END holds the positions owning the target that ends at that node.
+    The trie is plain lists and dicts, so it can be stored as JSON.
+    """
+    trie: Dict = {}
+    for pos, files in enumerate(files_cells):
+        for target in file_targets(files):
+            _trie_insert(trie, target[::-1], pos)
+    return trie
+
+
+def match_path_trie(trie: Dict, changed_file: str) -> List[int]:
+    """Return owner positions whose Files target occurs in changed_file.
+
+    The walk from the end of the path resolves the usual suffix match in
+    O(len(path)); walks from earlier positions keep the substring semantics
+    (e.g. directory targets) and stop at the first character with no edge.
+    """
+    reversed_path = changed_file.replace("\\", "/")[::-1]
+    positions = set()
+    for start in range(len(reversed_path)):
+        node, i = trie, start
+        while i < len(reversed_path):
+            edge = node.get(reversed_path[i])
+            if edge is None or not reversed_path.startswith(edge[0], i):
+                break
+            node = edge[1]
+            i += len(edge[0])
+            owners = node.get(TRIE_END)
+            if owners:
+                positions.update(owners)
+    return sorted(positions)
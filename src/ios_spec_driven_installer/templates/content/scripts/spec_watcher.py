@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Change notifications for the files of one spec directory.
+
+watch_files() yields the set of watched file names that changed, one set per
+burst of writes: a change is reported once the directory has been quiet for
+the debounce interval, so an editor's save (temp file + rename) or a batch of
+hook updates produces a single notification.
+
+Uses inotify through ctypes on Linux and falls back to polling os.stat
+elsewhere (or when inotify is unavailable). When the directory itself is
+deleted or moved away (e.g. by a git checkout), every watched name is
+reported changed once the path exists again and is watched anew.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.5
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000  # watch removed (directory deleted, or rm_watch)
+IN_WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+_libc = None
+
+
+def _inotify_fd(directory: Path) -> Optional[Tuple[int, int]]:
+    """Return an inotify descriptor and the watch on directory, or None."""
+    global _libc
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    _libc = libc
+    wd = _add_watch(fd, directory)
+    if wd < 0:
+        os.close(fd)
+        return None
+    return fd, wd
+
+
+def _add_watch(fd: int, directory: Path) -> int:
+    return _libc.inotify_add_watch(fd, os.fsencode(directory), IN_WATCH_MASK)
+
+
+def _read_events(fd: int) -> Iterator[Tuple[int, int, str]]:
+    try:
+        buf = os.read(fd, 64 * 1024)
+    except BlockingIOError:
+        return
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(buf):
+        wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+        offset += _EVENT_HEADER.size
+        name = buf[offset : offset + length].rstrip(b"\0").decode("utf-8", "replace")
+        offset += length
+        yield wd, mask, name
+
+
+def _watch_inotify(
+    fd: int, wd: int, directory: Path, names: Set[str], debounce: float, interval: float
+) -> Iterator[Set[str]]:
+    try:
+        while True:
+            changed: Set[str] = set()
+            lost = False
+            timeout = None
+            # Block until the first event, then drain until quiet.
+            while select.select([fd], [], [], timeout)[0]:
+                for event_wd, mask, name in _read_events(fd):
+                    if event_wd != wd:
+                        continue  # left over from a replaced watch
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                        lost = True
+                    elif name in names:
+                        changed.add(name)
+                timeout = debounce
+            if lost:
+                # A deleted directory's watch is gone and a moved one's follows
+                # it elsewhere: watch the path again once it exists.
+                _libc.inotify_rm_watch(fd, wd)
+                wd = _add_watch(fd, directory)
+                while wd < 0:
+                    time.sleep(interval)
+                    wd = _add_watch(fd, directory)
+                changed.update(names)
+            if changed:
+                yield changed
+    finally:
+        os.close(fd)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _watch_polling(
+    directory: Path, names: Set[str], debounce: float, interval: float
+) -> Iterator[Set[str]]:
+    stamps: Dict[str, Optional[Tuple[int, int]]] = {
+        name: _stamp(directory / name) for name in names
+    }
+    while True:
+        time.sleep(interval)
+        changed: Set[str] = set()
+        while True:
+            current = {name: _stamp(directory / name) for name in names}
+            burst = {name for name in names if current[name] != stamps[name]}
+            stamps = current
+            if not burst:
+                break
+            changed |= burst
+            time.sleep(debounce)
+        if changed:
+            yield changed
+
+
+def watch_files(
+    directory: Path,
+    names: Iterable[str],
+    debounce: float = DEBOUNCE_SECONDS,
+    poll_interval: float = POLL_INTERVAL,
+) -> Iterator[Set[str]]:
+    """Yield the names (among names) changed in directory, one set per burst."""
+    watched = set(names)
+    inotify = _inotify_fd(directory)
+    if inotify is not None:
+        fd, wd = inotify
+        return _watch_inotify(fd, wd, directory, watched, debounce, poll_interval)
+    return _watch_polling(directory, watched, debounce, poll_interval)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+In-memory traceability graph for one spec.
+
+Chain: US -> AC -> Design -> Property -> Task -> File
+
+The graph is built once from requirements.md, design.md and tasks.md (one
+streamed pass each, via spec_parser) into adjacency sets stored in both
+directions, so coverage and impact questions are lookups instead of markdown
+re-scans:
+- US-XXX owns every AC-XXX.Y.
+- Property table rows link a property to the ACs it validates.
+- Task Registry rows link a task to its ACs, design sections and Files.
+- Traceability Matrix rows link a task to its ACs, design sections and
+  properties.
+
+Usage:
+    python traceability_graph.py <feature-name> tasks-for-ac AC-003.2
+    python traceability_graph.py <feature-name> acs-for-file Features/Login/LoginView.swift
+    python traceability_graph.py <feature-name> tasks-for-file Features/Login/LoginView.swift
+    python traceability_graph.py <feature-name> properties-without-pbt
+    python traceability_graph.py <feature-name> trace task 3.1.1
+    Add --format json for machine-readable output.
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import spec_parser
+
+SPECS_DIR = Path("{{IDE_CONFIG_DIR}}specs")
+
+US = "us"
+AC = "ac"
+DESIGN = "design"
+PROPERTY = "property"
+TASK = "task"
+FILE = "file"
+CHAIN = (US, AC, DESIGN, PROPERTY, TASK, FILE)
+RANK = {kind: rank for rank, kind in enumerate(CHAIN)}
+
+AC_OWNER_PATTERN = re.compile(r"AC-(\d+)\.")
+
+
+class TraceabilityGraph:
+    def __init__(self) -> None:
+        # Nodes defined by the spec itself (referenced-only IDs appear in
+        # edges but not here).
+        self.nodes: Dict[str, Set[str]] = {kind: set() for kind in CHAIN}
+        # (from kind, to kind) -> node ID -> linked node IDs.
+        self.edges: Dict[Tuple[str, str], Dict[str, Set[str]]] = {}
+        self.pbt_tasks: Set[str] = set()
+        # Files targets in registry order, matched through a reversed path trie.
+        self._files: List[str] = []
+        self._path_trie: Dict = {}
+
+    @classmethod
+    def from_spec_dir(cls, spec_dir: Path) -> "TraceabilityGraph":
+        graph = cls()
+        req_file = spec_dir / "requirements.md"
+        if req_file.exists():
+            with req_file.open(encoding="utf-8") as lines:
+                for ac in spec_parser.parse_requirements(lines):
+                    graph.nodes[AC].add(ac)
+
+        design_file = spec_dir / "design.md"
+        if design_file.exists():
+            with design_file.open(encoding="utf-8") as lines:
+                design = spec_parser.parse_design(lines)
+            graph.nodes[DESIGN].update(design.sections)
+            for row in design.properties:
+                graph.nodes[PROPERTY].add(row.prop_id)
+                for ac in row.ac_refs:
+                    graph.link(PROPERTY, row.prop_id, AC, ac)
+
+        tasks_file = spec_dir / "tasks.md"
+        if tasks_file.exists():
+            with tasks_file.open(encoding="utf-8") as lines:
+                for element in spec_parser.iter_elements(lines):
+                    graph._add_task_element(element)
+
+        graph._link_user_stories()
+        graph._path_trie = spec_parser.build_path_trie(graph._files)
+        return graph
+
+    def _add_task_element(self, element: spec_parser.Element) -> None:
+        if isinstance(element, spec_parser.RegistryRow):
+            task_id = element.task_id
+            self.nodes[TASK].add(task_id)
+            if element.task_type == "pbt" or "[pbt]" in element.title.lower():
+                self.pbt_tasks.add(task_id)
+            for ac in element.ac_refs:
+                self.link(TASK, task_id, AC, ac)
+            for dref in element.design_refs:
+                self.link(TASK, task_id, DESIGN, dref)
+            for target in element.file_targets:
+                self.nodes[FILE].add(target)
+                self.link(TASK, task_id, FILE, target)
+            if element.files:
+                self._files.append(element.files)
+        elif isinstance(element, spec_parser.ChecklistItem):
+            self.nodes[TASK].add(element.task_id)
+            if "[pbt]" in element.title.lower():
+                self.pbt_tasks.add(element.task_id)
+        elif isinstance(element, spec_parser.MatrixRow):
+            task_id = element.task_id
+            for ac in element.ac_refs:
+                self.link(TASK, task_id, AC, ac)
+            for dref in element.design_refs:
+                self.link(TASK, task_id, DESIGN, dref)
+            for prop in element.property_refs:
+                self.link(TASK, task_id, PROPERTY, prop)
+
+    def _link_user_stories(self) -> None:
+        acs = set(self.nodes[AC])
+        for (kind, _), adjacency in self.edges.items():
+            if kind == AC:
+                acs.update(adjacency)
+        for ac in acs:
+            m = AC_OWNER_PATTERN.match(ac)
+            if m:
+                us = f"US-{m.group(1)}"
+                self.nodes[US].add(us)
+                self.link(US, us, AC, ac)
+
+    def link(self, kind_a: str, a: str, kind_b: str, b: str) -> None:
+        """Add an undirected edge between two nodes."""
+        self.edges.setdefault((kind_a, kind_b), {}).setdefault(a, set()).add(b)
+        self.edges.setdefault((kind_b, kind_a), {}).setdefault(b, set()).add(a)
+
+    def linked(self, kind: str, node_id: str, to_kind: str) -> Set[str]:
+        """Nodes of to_kind directly linked to node_id; O(1)."""
+        return self.edges.get((kind, to_kind), {}).get(node_id, set())
+
+    def trace(self, kind: str, node_id: str) -> Dict[str, Set[str]]:
+        """Everything reachable from a node along the chain.
+
+        Upstream kinds (earlier in CHAIN) are reached only by moving up the
+        chain and downstream kinds only by moving down, so a task traces to
+        its ACs and files without fanning out to sibling tasks. Linear in the
+        size of the reached subgraph.
+        """
+        reached: Dict[str, Set[str]] = {k: set() for k in CHAIN}
+        for step in (-1, 1):
+            queue = deque([(kind, node_id)])
+            seen = {(kind, node_id)}
+            while queue:
+                current_kind, current = queue.popleft()
+                for to_kind in CHAIN:
+                    if (RANK[to_kind] - RANK[current_kind]) * step <= 0:
+                        continue
+                    for neighbor in self.linked(current_kind, current, to_kind):
+                        if (to_kind, neighbor) not in seen:
+                            seen.add((to_kind, neighbor))
+                            reached[to_kind].add(neighbor)
+                            queue.append((to_kind, neighbor))
+        reached[kind].discard(node_id)
+        return reached
+
+    def files_for_path(self, path: str) -> List[str]:
+        """Files targets (registry order) that occur in path; O(len(path))."""
+        path = path.replace("\\", "/")
+        targets: List[str] = []
+        for pos in spec_parser.match_path_trie(self._path_trie, path):
+            for target in spec_parser.file_targets(self._files[pos]):
+                if target in path and target not in targets:
+                    targets.append(target)
+        return targets
+
+    def tasks_for_ac(self, ac: str) -> List[str]:
+        return spec_parser.sorted_ids(self.linked(AC, ac, TASK))
+
+    def tasks_for_file(self, path: str) -> List[str]:
+        tasks: Set[str] = set()
+        for target in self.files_for_path(path):
+            tasks.update(self.linked(FILE, target, TASK))
+        return spec_parser.sorted_ids(tasks)
+
+    def acs_for_file(self, path: str) -> List[str]:
+        """ACs affected by editing path: every AC upstream of its Files targets."""
+        acs: Set[str] = set()
+        for target in self.files_for_path(path):
+            acs.update(self.trace(FILE, target)[AC])
+        return spec_parser.sorted_ids(acs)
+
+    def properties_without_pbt(self) -> List[str]:
+        return spec_parser.sorted_ids(
+            prop
+            for prop in self.nodes[PROPERTY]
+            if self.linked(PROPERTY, prop, TASK).isdisjoint(self.pbt_tasks)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query a spec's traceability graph.")
+    parser.add_argument("feature_name", help="spec folder under specs/")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    queries = parser.add_subparsers(dest="query", required=True)
+    queries.add_parser("tasks-for-ac", help="tasks covering an AC").add_argument("ac")
+    queries.add_parser("acs-for-file", help="ACs affected by a file").add_argument("path")
+    queries.add_parser("tasks-for-file", help="tasks listing a file").add_argument("path")
+    queries.add_parser("properties-without-pbt", help="properties no PBT task covers")
+    trace = queries.add_parser("trace", help="everything linked to a node along the chain")
+    trace.add_argument("kind", choices=CHAIN)
+    trace.add_argument("node_id")
+    args = parser.parse_args()
+
+    spec_dir = SPECS_DIR / args.feature_name
+    if not spec_dir.is_dir():
+        print(f"Spec directory not found: {spec_dir}", file=sys.stderr)
+        sys.exit(1)
+    graph = TraceabilityGraph.from_spec_dir(spec_dir)
+
+    if args.query == "tasks-for-ac":
+        answer = graph.tasks_for_ac(args.ac)
+    elif args.query == "acs-for-file":
+        answer = graph.acs_for_file(args.path)
+    elif args.query == "tasks-for-file":
+        answer = graph.tasks_for_file(args.path)
+    elif args.query == "properties-without-pbt":
+        answer = graph.properties_without_pbt()
+    else:
+        reached = graph.trace(args.kind, args.node_id)
+        answer = {kind: spec_parser.sorted_ids(ids) for kind, ids in reached.items() if ids}
+
+    if args.format == "json":
+        print(json.dumps({"spec": args.feature_name, "query": args.query, "result": answer}))
+    elif isinstance(answer, dict):
+        for kind, ids in answer.items():
+            print(f"{kind}: {', '.join(ids)}")
+    else:
+        for node_id in answer:
+            print(node_id)
+
+
+if __name__ == "__main__":
+    main()
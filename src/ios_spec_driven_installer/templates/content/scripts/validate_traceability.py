@@ -6,22 +6,139 @@ Validates references across:
 - requirements.md (AC IDs)
 - design.md (design sections + properties)
 - tasks.md (task registry + checklist tasks + traceability matrix)
+
+Usage:
+    python validate_traceability.py <feature-name>
+    python validate_traceability.py --all [--jobs N]
+    python validate_traceability.py --changed-since <git-ref> [--jobs N]
+    python validate_traceability.py <feature-name> --watch
+    Add --format json|ndjson for machine-readable output.
+
+--all validates every folder under specs/ in a process pool, printing each
+report as soon as it finishes; the exit code is non-zero if any spec fails.
+--changed-since does the same for specs with files changed since <git-ref>
+(committed, staged, unstaged or untracked).
+
+--format json prints one document ({"spec", "valid", "counts", "issues"},
+or {"specs": [...], "total": {...}} for several specs). --format ndjson
+streams one {"type": "issue", ...} record per issue as it is found, then a
+{"type": "result"} record per spec and, for several specs, {"type": "total"}.
+
+Spec files are streamed line by line in a single pass (bounded memory even
+for generated specs of tens of MB). Parse results are cached per file in
+<spec>/.traceability_cache/, keyed by content hash, so only edited files are
+re-parsed (--no-cache disables).
+
+--watch keeps the validator resident: after the first report it waits for
+changes to the spec files (inotify on Linux, polling elsewhere), re-parses
+only the files that changed and prints the issues each change introduced and
+resolved (one {"type": "diff"} record per change for json/ndjson).
 """
 
-import re
+import argparse
+import hashlib
+import json
+import os
+import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from collections import Counter
+from itertools import chain
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import spec_parser
+
+SPECS_DIR = Path("{{IDE_CONFIG_DIR}}specs")
+
+# Per-file parse cache inside each spec folder: <file>.json holds a header
+# line (stat stamp and content hash of one spec file) and a data line (its
+# parse result).
+CACHE_DIRNAME = ".traceability_cache"
+CACHE_VERSION = 3
+
+# Sidecars older update_task_status.py hooks wrote beside tasks.md (they now
+# live in CACHE_DIRNAME); never counted as spec changes.
+LEGACY_HOOK_FILES = frozenset({".tasks_index.json", ".tasks.md.lock"})
+
+HASH_CHUNK_SIZE = 1 << 20
+
+SPEC_FILES = ("requirements.md", "design.md", "tasks.md")
+
+
+def _iter_lines(path: Path, update: Callable[[bytes], None]) -> Iterator[str]:
+    """Yield the decoded lines of a file, feeding its raw bytes to update."""
+    with path.open("rb") as f:
+        for raw in f:
+            update(raw)
+            yield raw.decode("utf-8")
+
+
+def _file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Issue categories, the ValidationResult list each one is reported in, and
+# its severity. Errors fail validation.
+BROKEN_REFERENCE = "broken_reference"
+MISSING_REFERENCE = "missing_reference"
+ORPHANED_ITEM = "orphaned_item"
+WARNING = "warning"
+CATEGORY_FIELDS = {
+    BROKEN_REFERENCE: "broken_references",
+    MISSING_REFERENCE: "missing_references",
+    ORPHANED_ITEM: "orphaned_items",
+    WARNING: "warnings",
+}
+CATEGORY_SEVERITY = {
+    BROKEN_REFERENCE: "error",
+    MISSING_REFERENCE: "error",
+    ORPHANED_ITEM: "warning",
+    WARNING: "warning",
+}
+
+OUTPUT_FORMATS = ("text", "json", "ndjson")
+
+
+@dataclass
+class Issue:
+    category: str
+    severity: str = field(init=False)
+    message: str
+    task_id: Optional[str] = None
+    ac: Optional[str] = None
+    design_ref: Optional[str] = None
+    property: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.severity = CATEGORY_SEVERITY[self.category]
+
+    def to_record(self) -> Dict[str, Optional[str]]:
+        return asdict(self)
 
 
 @dataclass
 class ValidationResult:
-    is_valid: bool
-    broken_references: List[str]
-    orphaned_items: List[str]
-    missing_references: List[str]
-    warnings: List[str]
+    is_valid: bool = True
+    broken_references: List[str] = field(default_factory=list)
+    orphaned_items: List[str] = field(default_factory=list)
+    missing_references: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    issues: List[Issue] = field(default_factory=list)
+
+    def add(self, issue: Issue) -> None:
+        self.issues.append(issue)
+        getattr(self, CATEGORY_FIELDS[issue.category]).append(issue.message)
+        if issue.severity == "error":
+            self.is_valid = False
+
+    def counts(self) -> Dict[str, int]:
+        return {name: len(getattr(self, name)) for name in CATEGORY_FIELDS.values()}
 
 
 @dataclass
@@ -34,10 +151,29 @@ class TaskMeta:
     design_refs: List[str]
 
 
+@dataclass
+class MatrixMeta:
+    task_id: str
+    ac_refs: List[str]
+    design_refs: List[str]
+    property_refs: List[str]
+    status: str
+
+
+def _interned(ids: List[str]) -> List[str]:
+    # IDs repeat across thousands of rows; share one string per ID.
+    return [sys.intern(i) for i in ids]
+
+
 class TraceabilityValidator:
-    def __init__(self, feature_name: str):
+    def __init__(self, feature_name: str, use_cache: bool = True):
         self.feature_name = feature_name
-        self.spec_dir = Path(f"{{{{IDE_CONFIG_DIR}}}}specs/{feature_name}")
+        self.spec_dir = SPECS_DIR / feature_name
+        self.use_cache = use_cache
+        # When set, cache entries are queued until flush_cache() so a resident
+        # caller (--watch) can report before paying for the writes.
+        self.defer_cache_writes = False
+        self._pending_cache_writes: List[Tuple[Path, Dict, Dict]] = []
 
         self.acceptance_criteria: Set[str] = set()
         self.design_sections: Set[str] = set()
@@ -45,214 +181,349 @@ class TraceabilityValidator:
         self.property_ac_refs: Dict[str, List[str]] = {}
 
         self.tasks: Dict[str, TaskMeta] = {}
-        self.traceability_rows: Dict[str, Dict[str, str]] = {}
-
-    def validate(self) -> ValidationResult:
+        # Checklist-only tasks, added after the Task Registry rows.
+        self._checklist_tasks: Dict[str, TaskMeta] = {}
+        self.traceability_rows: Dict[str, MatrixMeta] = {}
+
+        # Every ID referenced from each source, filled by _index_references.
+        self.task_acs: Set[str] = set()
+        self.task_design_refs: Set[str] = set()
+        self.property_acs: Set[str] = set()
+        self.matrix_acs: Set[str] = set()
+
+    def validate(
+        self,
+        on_issue: Optional[Callable[[Issue], None]] = None,
+        changed: Optional[Set[str]] = None,
+    ) -> ValidationResult:
+        """Validate the spec; on_issue is called with each issue as it is found.
+
+        changed limits re-parsing to those SPEC_FILES names; the others keep
+        the state of the previous validate() call (used by --watch).
+        """
+        result = ValidationResult()
+        for issue in self._iter_issues(changed):
+            result.add(issue)
+            if on_issue is not None:
+                on_issue(issue)
+        return result
+
+    def _iter_issues(self, changed: Optional[Set[str]] = None) -> Iterator[Issue]:
         if not self.spec_dir.exists():
-            return ValidationResult(
-                is_valid=False,
-                broken_references=[f"Spec directory not found: {self.spec_dir}"],
-                orphaned_items=[],
-                missing_references=[],
-                warnings=[],
-            )
+            yield Issue(BROKEN_REFERENCE, f"Spec directory not found: {self.spec_dir}")
+            return
 
-        self._parse_requirements()
-        self._parse_design()
-        self._parse_tasks()
-
-        broken = self._find_broken_references()
-        orphaned = self._find_orphaned_items()
-        missing = self._find_missing_references()
-        warnings = self._find_warnings()
-
-        return ValidationResult(
-            is_valid=(len(broken) == 0 and len(missing) == 0),
-            broken_references=broken,
-            orphaned_items=orphaned,
-            missing_references=missing,
-            warnings=warnings,
-        )
+        parsers = {
+            "requirements.md": self._parse_requirements,
+            "design.md": self._parse_design,
+            "tasks.md": self._parse_tasks,
+        }
+        for filename in SPEC_FILES:
+            if changed is None or filename in changed:
+                parsers[filename]()
+        self._index_references()
+
+        yield from self._find_broken_references()
+        yield from self._find_missing_references()
+        yield from self._find_orphaned_items()
+        yield from self._find_warnings()
+
+    def _read_cache_header(self, cache_file: Path) -> Optional[Dict]:
+        try:
+            with cache_file.open(encoding="utf-8") as f:
+                header = json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+            return None
+        return header
+
+    def _read_cache_data(self, cache_file: Path) -> Optional[Dict]:
+        try:
+            with cache_file.open(encoding="utf-8") as f:
+                f.readline()
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache_entry(self, cache_file: Path, header: Dict, data: Dict) -> None:
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            if not cache_file.parent.is_dir():
+                cache_file.parent.mkdir()
+                # Keep the cache out of git (and out of --changed-since).
+                (cache_file.parent / ".gitignore").write_text("*\n", encoding="utf-8")
+            # json.dumps runs the C encoder; json.dump(f) streams through the
+            # pure-Python one and is several times slower on large entries.
+            text = "\n".join(json.dumps(part, separators=(",", ":")) for part in (header, data))
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+
+    def flush_cache(self) -> None:
+        for cache_file, header, data in self._pending_cache_writes:
+            self._write_cache_entry(cache_file, header, data)
+        self._pending_cache_writes.clear()
+
+    def _load_parsed(
+        self, filename: str, parse: Callable[[Iterable[str]], Dict]
+    ) -> Optional[Dict]:
+        """Return parse(lines) for a spec file, reusing the cached result.
+
+        The cached entry is trusted when mtime and size are unchanged, and
+        otherwise when the content hash still matches; its header line is
+        checked first so the data line is only decoded on a hit. The file is
+        never held in memory whole: parse consumes a line stream that is
+        hashed on the way through.
+        """
+        path = self.spec_dir / filename
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+
+        cache_file = self.spec_dir / CACHE_DIRNAME / f"{filename}.json"
+        header = self._read_cache_header(cache_file) if self.use_cache else None
+        data = None
+        if header and header["mtime_ns"] == st.st_mtime_ns and header["size"] == st.st_size:
+            data = self._read_cache_data(cache_file)
+            if data is not None:
+                return data
+
+        if header and _file_sha1(path) == header["sha1"]:
+            digest, data = header["sha1"], self._read_cache_data(cache_file)
+        if data is None:
+            sha1 = hashlib.sha1()
+            lines = _iter_lines(path, sha1.update)
+            data = parse(lines)
+            for _ in lines:  # hash any tail the parser did not read
+                pass
+            digest = sha1.hexdigest()
+        if self.use_cache:
+            header = {
+                "version": CACHE_VERSION,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha1": digest,
+            }
+            if self.defer_cache_writes:
+                self._pending_cache_writes.append((cache_file, header, data))
+            else:
+                self._write_cache_entry(cache_file, header, data)
+        return data
 
     def _parse_requirements(self) -> None:
-        req_file = self.spec_dir / "requirements.md"
-        if not req_file.exists():
-            return
+        def parse(lines: Iterable[str]) -> Dict:
+            acs = spec_parser.parse_requirements(lines)
+            return {"acceptance_criteria": sorted(acs)}
 
-        content = req_file.read_text()
-        ac_pattern = r"\b(AC-\d+\.\d+)\b"
-        self.acceptance_criteria = set(re.findall(ac_pattern, content))
+        self.acceptance_criteria = set()
+        data = self._load_parsed("requirements.md", parse)
+        if data is not None:
+            self.acceptance_criteria = set(_interned(data["acceptance_criteria"]))
 
     def _parse_design(self) -> None:
-        design_file = self.spec_dir / "design.md"
-        if not design_file.exists():
-            return
-
-        content = design_file.read_text()
-
-        # Markdown heading sections like "## 4. Data Models" or "### 3.1 Feature"
-        section_pattern = r"^#{2,3}\s+(\d+(?:\.\d+)*)\b"
-        self.design_sections = set(re.findall(section_pattern, content, re.MULTILINE))
+        def parse(lines: Iterable[str]) -> Dict:
+            design = spec_parser.parse_design(lines)
+            property_ac_refs: Dict[str, List[str]] = {}
+            for row in design.properties:
+                if row.ac_refs:
+                    property_ac_refs[row.prop_id] = row.ac_refs
+            return {
+                "design_sections": sorted(design.sections),
+                "properties": sorted({row.prop_id for row in design.properties}),
+                "property_ac_refs": property_ac_refs,
+            }
 
-        # Property rows in markdown tables
-        for line in content.splitlines():
-            m = re.match(r"^\|\s*(P\d+)\s*\|", line)
-            if m:
-                prop = m.group(1)
-                self.properties.add(prop)
-                acs = re.findall(r"\bAC-\d+\.\d+\b", line)
-                if acs:
-                    self.property_ac_refs[prop] = acs
+        self.design_sections = set()
+        self.properties = set()
+        self.property_ac_refs = {}
+        data = self._load_parsed("design.md", parse)
+        if data is not None:
+            self.design_sections = set(_interned(data["design_sections"]))
+            self.properties = set(data["properties"])
+            self.property_ac_refs = {
+                prop: _interned(acs) for prop, acs in data["property_ac_refs"].items()
+            }
 
     def _parse_tasks(self) -> None:
-        tasks_file = self.spec_dir / "tasks.md"
-        if not tasks_file.exists():
-            return
-
-        content = tasks_file.read_text()
-        self._parse_task_registry(content)
-        self._parse_checklist_tasks(content)
-        self._parse_traceability_matrix(content)
-
-    def _parse_task_registry(self, content: str) -> None:
-        # Expected row:
-        # | 2.1.1 | Create model | normal | pending | AC-001.1 | 4 | file.swift | 2.1 |
-        row_pattern = re.compile(
-            r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*"
-            r"([^|]+?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$"
-        )
-
-        for line in content.splitlines():
-            m = row_pattern.match(line.strip())
-            if not m:
-                continue
-            task_id, title, ttype, status, ac_refs, design_refs, _, _ = m.groups()
-            ac_list = re.findall(r"\bAC-\d+\.\d+\b", ac_refs)
-            design_list = re.findall(r"\b\d+(?:\.\d+)*\b", design_refs)
-            self.tasks[task_id] = TaskMeta(
-                task_id=task_id,
-                title=title.strip(),
-                task_type=ttype.strip().lower(),
-                status=status.strip().lower(),
-                ac_refs=ac_list,
-                design_refs=design_list,
-            )
-
-    def _parse_checklist_tasks(self, content: str) -> None:
-        # Supports:
-        # - [ ] **3.1.1** Build ViewModel
-        # - [x] 3.1.2 Wire navigation
-        pattern = re.compile(
-            r"^-\s+\[[x\s]\]\s+(?:\*\*)?(\d+(?:\.\d+)+)(?:\*\*)?\s+(.+)$",
-            re.MULTILINE,
-        )
+        self.tasks = {}
+        self._checklist_tasks = {}
+        self.traceability_rows = {}
+        parsed = False
+
+        def parse(lines: Iterable[str]) -> Dict:
+            nonlocal parsed
+            parsed = True
+            # One pass; each line goes straight to its handler.
+            for element in spec_parser.iter_elements(lines):
+                if isinstance(element, spec_parser.RegistryRow):
+                    self._add_registry_row(element)
+                elif isinstance(element, spec_parser.ChecklistItem):
+                    self._add_checklist_item(element)
+                elif isinstance(element, spec_parser.MatrixRow):
+                    self._add_matrix_row(element)
+            for task_id, task in self._checklist_tasks.items():
+                self.tasks.setdefault(task_id, task)
+            self._checklist_tasks.clear()
+
+            # Rows as plain lists keep the cache small and quick to load.
+            return {
+                "tasks": [
+                    [t.task_id, t.title, t.task_type, t.status, t.ac_refs, t.design_refs]
+                    for t in self.tasks.values()
+                ],
+                "traceability_rows": [
+                    [r.task_id, r.ac_refs, r.design_refs, r.property_refs, r.status]
+                    for r in self.traceability_rows.values()
+                ],
+            }
 
-        for m in pattern.finditer(content):
-            task_id = m.group(1)
-            title = m.group(2).strip()
-            if task_id not in self.tasks:
-                inferred_type = "pbt" if "[pbt]" in title.lower() else "normal"
+        data = self._load_parsed("tasks.md", parse)
+        if data is not None and not parsed:
+            for task_id, title, ttype, status, acs, drefs in data["tasks"]:
                 self.tasks[task_id] = TaskMeta(
-                    task_id=task_id,
-                    title=title,
-                    task_type=inferred_type,
-                    status="unknown",
-                    ac_refs=[],
-                    design_refs=[],
+                    task_id, title, ttype, status, _interned(acs), _interned(drefs)
+                )
+            for task_id, acs, drefs, props, status in data["traceability_rows"]:
+                self.traceability_rows[task_id] = MatrixMeta(
+                    task_id, _interned(acs), _interned(drefs), props, status
                 )
 
-    def _parse_traceability_matrix(self, content: str) -> None:
-        # Expected row:
-        # | 2.1.1 | AC-001.1 | 4 | P1 | pending |
-        row_pattern = re.compile(
-            r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$"
+    def _add_registry_row(self, row: spec_parser.RegistryRow) -> None:
+        self.tasks[row.task_id] = TaskMeta(
+            task_id=row.task_id,
+            title=row.title,
+            task_type=row.task_type,
+            status=row.status,
+            ac_refs=_interned(row.ac_refs),
+            design_refs=_interned(row.design_refs),
         )
 
-        for line in content.splitlines():
-            m = row_pattern.match(line.strip())
-            if not m:
-                continue
-            task_id, acs, design_ref, prop, status = m.groups()
-            if task_id.lower() == "task id":
-                continue
-            self.traceability_rows[task_id] = {
-                "acs": ", ".join(re.findall(r"\bAC-\d+\.\d+\b", acs)),
-                "design": ", ".join(re.findall(r"\b\d+(?:\.\d+)*\b", design_ref)),
-                "property": ", ".join(re.findall(r"\bP\d+\b", prop)),
-                "status": status.strip().lower(),
-            }
-
-    def _find_broken_references(self) -> List[str]:
-        broken: List[str] = []
+    def _add_checklist_item(self, item: spec_parser.ChecklistItem) -> None:
+        if item.task_id in self.tasks or item.task_id in self._checklist_tasks:
+            return
+        inferred_type = "pbt" if "[pbt]" in item.title.lower() else "normal"
+        self._checklist_tasks[item.task_id] = TaskMeta(
+            task_id=item.task_id,
+            title=item.title,
+            task_type=inferred_type,
+            status="unknown",
+            ac_refs=[],
+            design_refs=[],
+        )
 
-        for task in self.tasks.values():
-            for ac in task.ac_refs:
-                if ac not in self.acceptance_criteria:
-                    broken.append(f"Task {task.task_id} references {ac} (NOT FOUND)")
-            for dref in task.design_refs:
-                if dref not in self.design_sections:
-                    broken.append(
-                        f"Task {task.task_id} references Design {dref} (NOT FOUND)"
-                    )
-
-        for prop, acs in self.property_ac_refs.items():
-            for ac in acs:
-                if ac not in self.acceptance_criteria:
-                    broken.append(f"Property {prop} validates {ac} (NOT FOUND)")
-
-        for task_id, row in self.traceability_rows.items():
-            for ac in re.findall(r"\bAC-\d+\.\d+\b", row["acs"]):
-                if ac not in self.acceptance_criteria:
-                    broken.append(
-                        f"Traceability row {task_id} references {ac} (NOT FOUND)"
-                    )
-
-        return broken
-
-    def _find_orphaned_items(self) -> List[str]:
-        orphaned: List[str] = []
-
-        referenced_acs: Set[str] = set()
-        for task in self.tasks.values():
-            referenced_acs.update(task.ac_refs)
-        for prop_acs in self.property_ac_refs.values():
-            referenced_acs.update(prop_acs)
-        for row in self.traceability_rows.values():
-            referenced_acs.update(re.findall(r"\bAC-\d+\.\d+\b", row["acs"]))
+    def _add_matrix_row(self, row: spec_parser.MatrixRow) -> None:
+        self.traceability_rows[row.task_id] = MatrixMeta(
+            task_id=row.task_id,
+            ac_refs=_interned(row.ac_refs),
+            design_refs=_interned(row.design_refs),
+            property_refs=row.property_refs,
+            status=row.status,
+        )
 
-        for ac in sorted(self.acceptance_criteria):
-            if ac not in referenced_acs:
-                orphaned.append(f"{ac} not referenced by any task/property/matrix row")
+    def _index_references(self) -> None:
+        tasks = self.tasks.values()
+        self.task_acs = set(chain.from_iterable(t.ac_refs for t in tasks))
+        self.task_design_refs = set(chain.from_iterable(t.design_refs for t in tasks))
+        self.property_acs = set(chain.from_iterable(self.property_ac_refs.values()))
+        self.matrix_acs = set(
+            chain.from_iterable(r.ac_refs for r in self.traceability_rows.values())
+        )
 
-        return orphaned
+    def _find_broken_references(self) -> Iterator[Issue]:
+        # Set differences find the unknown IDs; only sources that contain one
+        # are walked again, in file order, to report each occurrence.
+        bad_acs = self.task_acs - self.acceptance_criteria
+        bad_design = self.task_design_refs - self.design_sections
+        if bad_acs or bad_design:
+            for task in self.tasks.values():
+                if bad_acs.isdisjoint(task.ac_refs) and bad_design.isdisjoint(
+                    task.design_refs
+                ):
+                    continue
+                for ac in task.ac_refs:
+                    if ac in bad_acs:
+                        yield Issue(
+                            BROKEN_REFERENCE,
+                            f"Task {task.task_id} references {ac} (NOT FOUND)",
+                            task_id=task.task_id,
+                            ac=ac,
+                        )
+                for dref in task.design_refs:
+                    if dref in bad_design:
+                        yield Issue(
+                            BROKEN_REFERENCE,
+                            f"Task {task.task_id} references Design {dref} (NOT FOUND)",
+                            task_id=task.task_id,
+                            design_ref=dref,
+                        )
+
+        bad_acs = self.property_acs - self.acceptance_criteria
+        if bad_acs:
+            for prop, acs in self.property_ac_refs.items():
+                for ac in acs:
+                    if ac in bad_acs:
+                        yield Issue(
+                            BROKEN_REFERENCE,
+                            f"Property {prop} validates {ac} (NOT FOUND)",
+                            ac=ac,
+                            property=prop,
+                        )
+
+        bad_acs = self.matrix_acs - self.acceptance_criteria
+        if bad_acs:
+            for row in self.traceability_rows.values():
+                if bad_acs.isdisjoint(row.ac_refs):
+                    continue
+                for ac in row.ac_refs:
+                    if ac in bad_acs:
+                        yield Issue(
+                            BROKEN_REFERENCE,
+                            f"Traceability row {row.task_id} references {ac} (NOT FOUND)",
+                            task_id=row.task_id,
+                            ac=ac,
+                        )
+
+    def _find_orphaned_items(self) -> Iterator[Issue]:
+        referenced_acs = self.task_acs | self.property_acs | self.matrix_acs
+        for ac in sorted(self.acceptance_criteria - referenced_acs):
+            yield Issue(
+                ORPHANED_ITEM,
+                f"{ac} not referenced by any task/property/matrix row",
+                ac=ac,
+            )
 
-    def _find_missing_references(self) -> List[str]:
-        missing: List[str] = []
+    def _find_missing_references(self) -> Iterator[Issue]:
         for task in self.tasks.values():
+            if task.ac_refs and task.design_refs:
+                continue
             if not task.ac_refs:
-                missing.append(f"Task {task.task_id} has no AC reference")
+                yield Issue(
+                    MISSING_REFERENCE,
+                    f"Task {task.task_id} has no AC reference",
+                    task_id=task.task_id,
+                )
             if not task.design_refs:
-                missing.append(f"Task {task.task_id} has no Design reference")
-        return missing
-
-    def _find_warnings(self) -> List[str]:
-        warnings: List[str] = []
+                yield Issue(
+                    MISSING_REFERENCE,
+                    f"Task {task.task_id} has no Design reference",
+                    task_id=task.task_id,
+                )
 
+    def _find_warnings(self) -> Iterator[Issue]:
         if len(self.properties) == 0:
-            warnings.append("No correctness properties defined")
+            yield Issue(WARNING, "No correctness properties defined")
 
-        pbt_tasks = [
-            t
-            for t in self.tasks.values()
-            if t.task_type == "pbt" or "[pbt]" in t.title.lower()
-        ]
-        if len(pbt_tasks) == 0:
-            warnings.append("No PBT tasks found")
+        has_pbt = any(
+            t.task_type == "pbt" or "[pbt]" in t.title.lower() for t in self.tasks.values()
+        )
+        if not has_pbt:
+            yield Issue(WARNING, "No PBT tasks found")
 
         if len(self.traceability_rows) == 0:
-            warnings.append("No Traceability Matrix rows found")
-
-        return warnings
+            yield Issue(WARNING, "No Traceability Matrix rows found")
 
 
 def print_result(result: ValidationResult, feature_name: str) -> None:
@@ -299,15 +570,300 @@ def print_result(result: ValidationResult, feature_name: str) -> None:
     print(f"{'=' * 60}\n")
 
 
-def main() -> None:
-    if len(sys.argv) != 2:
-        print("Usage: python validate_traceability.py <feature-name>")
-        sys.exit(1)
+def write_record(record: Dict) -> None:
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def issue_record(issue: Issue, feature_name: str) -> Dict:
+    return {"type": "issue", "spec": feature_name, **issue.to_record()}
+
+
+def result_record(
+    result: ValidationResult, feature_name: str, with_issues: bool = False
+) -> Dict:
+    record = {"spec": feature_name, "valid": result.is_valid, "counts": result.counts()}
+    if with_issues:
+        record["issues"] = [issue.to_record() for issue in result.issues]
+    return record
+
+
+def report_result(
+    result: ValidationResult, feature_name: str, fmt: str, streamed: bool = False
+) -> None:
+    """Print one spec's result; streamed means its ndjson issues were already written."""
+    if fmt == "text":
+        print_result(result, feature_name)
+    elif fmt == "json":
+        write_record(result_record(result, feature_name, with_issues=True))
+    else:
+        if not streamed:
+            for issue in result.issues:
+                write_record(issue_record(issue, feature_name))
+        write_record({"type": "result", **result_record(result, feature_name)})
+    sys.stdout.flush()
+
+
+def report_total(fmt: str, count: int, failed: List[str], records: List[Dict]) -> None:
+    failed = sorted(failed)
+    if fmt == "text":
+        print(f"Validated {count} specs: {count - len(failed)} passed, {len(failed)} failed")
+        if failed:
+            print(f"Failed: {', '.join(failed)}")
+        return
+    total = {"specs": count, "passed": count - len(failed), "failed": failed}
+    if fmt == "json":
+        records = sorted(records, key=lambda record: record["spec"])
+        write_record({"specs": records, "total": total})
+    else:
+        write_record({"type": "total", **total})
+
+
+def discover_specs() -> List[str]:
+    if not SPECS_DIR.is_dir():
+        return []
+    return sorted(
+        entry.name
+        for entry in os.scandir(SPECS_DIR)
+        if entry.is_dir() and not entry.name.startswith(".")
+    )
+
+
+def changed_specs(ref: str) -> List[str]:
+    """Return spec folders with files changed since a git ref.
+
+    Covers committed, staged and unstaged changes plus untracked files.
+    Raises RuntimeError when git fails (not a repository, unknown ref).
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--relative", ref, "--", str(SPECS_DIR)],
+        ["git", "ls-files", "--others", "--exclude-standard", "--", str(SPECS_DIR)],
+    ]
+    changed: Set[str] = set()
+    for command in commands:
+        try:
+            proc = subprocess.run(command, capture_output=True, text=True)
+        except OSError as e:
+            raise RuntimeError(f"cannot run git: {e}") from e
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"{' '.join(command)} failed")
+        for line in proc.stdout.splitlines():
+            parts = Path(line).parts[len(SPECS_DIR.parts) :]
+            # Files directly under specs/ (e.g. spec_map.json) belong to no spec.
+            if (
+                len(parts) > 1
+                and CACHE_DIRNAME not in parts
+                and parts[-1] not in LEGACY_HOOK_FILES
+            ):
+                changed.add(parts[0])
+
+    existing = set(discover_specs())
+    return sorted(changed & existing)
+
+
+def validate_feature(
+    feature_name: str, use_cache: bool = True
+) -> Tuple[str, ValidationResult]:
+    return feature_name, TraceabilityValidator(feature_name, use_cache).validate()
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def validate_all(
+    jobs: Optional[int] = None,
+    features: Optional[List[str]] = None,
+    use_cache: bool = True,
+    fmt: str = "text",
+) -> int:
+    """Validate spec folders (default: all) and return the aggregate exit code."""
+    if features is None:
+        features = discover_specs()
+    if not features:
+        # Nothing to validate is not a failure (same as --changed-since).
+        if fmt == "text":
+            print(f"No specs found under {SPECS_DIR}")
+        else:
+            report_total(fmt, 0, [], [])
+        return 0
+
+    workers = min(jobs or available_cpus(), len(features))
+    failed: List[str] = []
+    # --format json prints one document once every spec is done.
+    records: List[Dict] = []
+
+    def report(feature_name: str, result: ValidationResult) -> None:
+        if fmt == "json":
+            records.append(result_record(result, feature_name, with_issues=True))
+        else:
+            report_result(result, feature_name, fmt)
+        if not result.is_valid:
+            failed.append(feature_name)
+
+    if workers <= 1:
+        for feature_name in features:
+            report(*validate_feature(feature_name, use_cache))
+    else:
+        # Imported here so single-spec runs skip the multiprocessing import cost.
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(validate_feature, name, use_cache) for name in features]
+            for future in as_completed(futures):
+                report(*future.result())
+
+    report_total(fmt, len(features), failed, records)
+    return 0 if not failed else 1
+
+
+def diff_issues(
+    before: List[Issue], after: List[Issue]
+) -> Tuple[List[Issue], List[Issue]]:
+    """Return (new, resolved) issues, matching them by category and message."""
+    before_keys = Counter((i.category, i.message) for i in before)
+    after_keys = Counter((i.category, i.message) for i in after)
+    added, removed = after_keys - before_keys, before_keys - after_keys
+    new = [i for i in after if added[(i.category, i.message)] > 0]
+    resolved = [i for i in before if removed[(i.category, i.message)] > 0]
+    return new, resolved
+
+
+def report_diff(
+    feature_name: str,
+    changed: Set[str],
+    new: List[Issue],
+    resolved: List[Issue],
+    result: ValidationResult,
+    elapsed_ms: float,
+    fmt: str,
+) -> None:
+    if fmt == "text":
+        status = "PASSED" if result.is_valid else "FAILED"
+        print(
+            f"[{time.strftime('%H:%M:%S')}] {', '.join(sorted(changed))}: "
+            f"{len(new)} new, {len(resolved)} resolved "
+            f"({elapsed_ms:.0f} ms) - {status}"
+        )
+        for issue in new:
+            print(f"  + {issue.message}")
+        for issue in resolved:
+            print(f"  - {issue.message}")
+    else:
+        write_record(
+            {
+                "type": "diff",
+                "spec": feature_name,
+                "changed": sorted(changed),
+                "new": [issue.to_record() for issue in new],
+                "resolved": [issue.to_record() for issue in resolved],
+                "valid": result.is_valid,
+                "elapsed_ms": round(elapsed_ms, 1),
+            }
+        )
+    sys.stdout.flush()
+
+
+def watch_feature(feature_name: str, use_cache: bool = True, fmt: str = "text") -> int:
+    """Validate once, then re-validate on every change until interrupted.
 
-    feature_name = sys.argv[1]
-    validator = TraceabilityValidator(feature_name)
+    Only the spec files that changed are re-parsed; each change prints the
+    issues it introduced and resolved.
+    """
+    # Imported here so one-shot runs skip the ctypes import cost.
+    from spec_watcher import watch_files
+
+    validator = TraceabilityValidator(feature_name, use_cache)
+    validator.defer_cache_writes = True
     result = validator.validate()
-    print_result(result, feature_name)
+    report_result(result, feature_name, fmt)
+    validator.flush_cache()
+    if fmt == "text":
+        print(f"Watching {validator.spec_dir} (Ctrl+C to stop)")
+        sys.stdout.flush()
+
+    try:
+        for changed in watch_files(validator.spec_dir, SPEC_FILES):
+            started = time.perf_counter()
+            previous = result
+            result = validator.validate(changed=changed)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            new, resolved = diff_issues(previous.issues, result.issues)
+            report_diff(feature_name, changed, new, resolved, result, elapsed_ms, fmt)
+            validator.flush_cache()
+    except KeyboardInterrupt:
+        validator.flush_cache()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate spec traceability.")
+    parser.add_argument("feature_name", nargs="?", help="spec folder under specs/")
+    parser.add_argument("--all", action="store_true", help="validate every spec folder")
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="validate spec folders with files changed since a git ref",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="worker processes for --all and --changed-since (default: available cores)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and report new/resolved issues on every change",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="ignore and do not write parse caches"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="output format (default: text)",
+    )
+    args = parser.parse_args()
+    modes = [bool(args.feature_name), args.all, args.changed_since is not None]
+    if sum(modes) != 1:
+        parser.error("give exactly one of: a feature name, --all, --changed-since")
+    if args.watch and not args.feature_name:
+        parser.error("--watch needs a feature name")
+    use_cache = not args.no_cache
+
+    if args.all:
+        sys.exit(validate_all(args.jobs, use_cache=use_cache, fmt=args.format))
+
+    if args.changed_since is not None:
+        try:
+            features = changed_specs(args.changed_since)
+        except RuntimeError as e:
+            print(f"--changed-since {args.changed_since}: {e}", file=sys.stderr)
+            sys.exit(2)
+        if not features:
+            if args.format == "text":
+                print(f"No spec changes since {args.changed_since}")
+            else:
+                report_total(args.format, 0, [], [])
+            sys.exit(0)
+        sys.exit(validate_all(args.jobs, features, use_cache, args.format))
+
+    if args.watch:
+        sys.exit(watch_feature(args.feature_name, use_cache, args.format))
+
+    validator = TraceabilityValidator(args.feature_name, use_cache)
+    if args.format == "ndjson":
+        result = validator.validate(
+            on_issue=lambda issue: write_record(issue_record(issue, args.feature_name))
+        )
+        report_result(result, args.feature_name, args.format, streamed=True)
+    else:
+        result = validator.validate()
+        report_result(result, args.feature_name, args.format)
 
     sys.exit(0 if result.is_valid else 1)
 
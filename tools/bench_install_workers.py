@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the installer's bounded copy pool.
+
+Renders the toolkit once, then times Installer.install() into the same
+target with workers=1 against larger pools. The config directory (and its
+manifest) is removed before every run, so each install writes every file.
+--latency-ms adds a sleep to every file write and directory creation to
+mimic a slow (network) mount; with no latency the pool should cost
+nothing, with latency it should overlap the round trips. Fails when an
+install with more workers leaves different files than workers=1.
+
+Usage (from the repository root):
+    python tools/bench_install_workers.py
+    python tools/bench_install_workers.py --workers 1 4 16 --latency-ms 0 5 20 --runs 5
+"""
+
+import argparse
+import hashlib
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+IDE = "opencode"
+
+
+def tree_digest(directory: Path, skip: str) -> Dict[str, str]:
+    """sha256 of every file under directory but skip, by relative path"""
+    return {
+        path.relative_to(directory).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(directory.rglob("*"))
+        if path.is_file() and path.name != skip
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time serial against parallel installs.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 5],
+                        help="sleep added to every file write and mkdir")
+    parser.add_argument("--runs", type=int, default=5, help="installs per timing (median)")
+    args = parser.parse_args()
+    workers = sorted(set(args.workers) | {1})
+
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import MANIFEST_NAME, Installer
+
+    make_directory = Installer._make_directory
+    write_file = Installer._write_file
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "app"
+        # Rendering reads the templates once, outside the timed copy
+        rendered = Installer(target, ide=IDE, use_cache=False).render_content()
+
+        print(f"{len(rendered.files)} content files, median of {args.runs} installs")
+        print(f"{'latency':>8s} " + " ".join(f"{f'workers={w}':>11s}" for w in workers))
+        reference = None
+        for latency in args.latency_ms:
+            delay = latency / 1000
+
+            def slow_make_directory(directory: Path):
+                time.sleep(delay)
+                make_directory(directory)
+
+            def slow_write_file(data: bytes, target_file: Path):
+                time.sleep(delay)
+                write_file(data, target_file)
+
+            Installer._make_directory = staticmethod(slow_make_directory)
+            Installer._write_file = staticmethod(slow_write_file)
+
+            row = []
+            for count in workers:
+                installer = Installer(target, ide=IDE, backup=False, workers=count, use_cache=False)
+                times = []
+                for _ in range(args.runs):
+                    shutil.rmtree(installer.target_config_dir, ignore_errors=True)
+                    started = time.perf_counter()
+                    installer.install(rendered)
+                    times.append(time.perf_counter() - started)
+                row.append(statistics.median(times) * 1000)
+
+                # The manifest records mtimes, which differ on every run
+                installed = tree_digest(installer.target_config_dir, MANIFEST_NAME)
+                if reference is None:
+                    reference = installed
+                elif installed != reference:
+                    failures.append(f"workers={count}, {latency:g} ms: installed files differ")
+            print(f"{latency:6g}ms " + " ".join(f"{ms:8.1f} ms" for ms in row))
+
+        Installer._make_directory = staticmethod(make_directory)
+        Installer._write_file = staticmethod(write_file)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the status hook's changed-file lookup.
+
+Builds a synthetic Task Registry (10k rows by default) and times
+spec_parser.build_path_trie / match_path_trie against the linear
+file_matches_row scan the hook used before the trie. Fails when the two
+disagree on any query.
+
+Usage (from the repository root):
+    python tools/bench_path_trie.py
+    python tools/bench_path_trie.py --rows 20000 --queries 500
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+
+def install_scripts(directory: Path) -> Path:
+    """Install the toolkit into directory; return its rendered scripts/"""
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+    return directory / ".opencode" / "scripts"
+
+
+def file_matches_row(changed_file: str, files_cell: str) -> bool:
+    # The hook's lookup before the trie, kept verbatim as the reference.
+    targets = [t.strip().strip("`") for t in files_cell.split(",") if t.strip()]
+    if not targets:
+        return False
+    changed = changed_file.replace("\\", "/")
+    for target in targets:
+        normalized = target.replace("\\", "/")
+        if changed.endswith(normalized) or normalized in changed:
+            return True
+    return False
+
+
+def synthetic_files_cells(rows: int, rng: random.Random) -> List[str]:
+    cells = []
+    for n in range(rows):
+        feature = f"Sources/Feature{n % 200}"
+        targets = [f"`{feature}/Views/Screen{n}View.swift`", f"{feature}/Models/Model{n}.swift"]
+        if n % 25 == 0:
+            targets.append(f"{feature}/Shared/")  # directory target
+        rng.shuffle(targets)
+        cells.append(", ".join(targets))
+    return cells
+
+
+def synthetic_queries(rows: int, count: int, rng: random.Random) -> List[str]:
+    queries = []
+    for _ in range(count):
+        n = rng.randrange(rows)
+        feature = f"Sources/Feature{n % 200}"
+        queries.append(
+            rng.choice(
+                [
+                    f"/Users/dev/App/{feature}/Views/Screen{n}View.swift",
+                    f"{feature}\\Models\\Model{n}.swift",
+                    f"/Users/dev/App/{feature}/Shared/Helpers.swift",
+                    f"/Users/dev/App/Tests/Unmatched{n}Tests.swift",
+                ]
+            )
+        )
+    return queries
+
+
+def per_query_us(seconds: float, queries: int) -> float:
+    return seconds / queries * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the registry path trie.")
+    parser.add_argument("--rows", type=int, default=10_000, help="registry rows")
+    parser.add_argument("--queries", type=int, default=250, help="changed paths looked up")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cells = synthetic_files_cells(args.rows, rng)
+    queries = synthetic_queries(args.rows, args.queries, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, str(install_scripts(Path(tmp) / "app")))
+        import spec_parser
+
+        started = time.perf_counter()
+        trie = spec_parser.build_path_trie(cells)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        linear = [
+            [pos for pos, cell in enumerate(cells) if file_matches_row(query, cell)]
+            for query in queries
+        ]
+        linear_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matched = [spec_parser.match_path_trie(trie, query) for query in queries]
+        trie_s = time.perf_counter() - started
+
+    print(f"{args.rows} rows, {args.queries} queries")
+    print(f"linear scan   {per_query_us(linear_s, args.queries):10.1f} us/query")
+    print(f"trie lookup   {per_query_us(trie_s, args.queries):10.1f} us/query")
+    print(f"trie build    {build_s * 1000:10.1f} ms (once per tasks.md change)")
+    print(f"speedup       {linear_s / max(trie_s, 1e-9):10.0f}x")
+
+    mismatches = [query for query, a, b in zip(queries, linear, matched) if a != b]
+    for query in mismatches[:5]:
+        print(f"FAIL {query}: trie and linear scan disagree")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
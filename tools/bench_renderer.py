@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the one-pass template renderer.
+
+Reads every shipped content template (agents, skills, shared guides,
+scripts, hooks) and renders it for both IDEs with the precompiled
+renderer (renderer.compile_template, installer.compile_agent) and with the
+str.replace chains it replaced (reproduced below). Fails when the two
+disagree on any shipped file. Also shows the one intended difference: the
+escaped {{{{IDE_CONFIG_DIR}}}} in an agent body, which the old agent
+transform rendered as {{.claude/}}.
+
+Usage (from the repository root):
+    python tools/bench_renderer.py
+    python tools/bench_renderer.py --runs 500
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+IDES = ("claude", "opencode")
+
+ESCAPED_AGENT = "---\nname: demo\ntools: Read, Bash\n---\nRun {{{{IDE_CONFIG_DIR}}}}scripts/x.py\n"
+
+TOOL_MAPPING = {
+    "Read": None,
+    "Write": "write",
+    "Edit": "edit",
+    "Grep": "grepSearch",
+    "Glob": "fileSearch",
+    "Bash": "bash",
+    "WebSearch": "webSearch",
+    "WebFetch": "webFetch",
+}
+
+
+def legacy_transform_content(content: str, ide: str) -> str:
+    """Installer._transform_content before the renderer"""
+    ide_dir = ".claude/" if ide == "claude" else ".opencode/"
+    content = content.replace("{{{{IDE_CONFIG_DIR}}}}", ide_dir)
+    content = content.replace("{{IDE_CONFIG_DIR}}", ide_dir)
+    if ide == "opencode":
+        content = content.replace(".claude/", ".opencode/")
+    return content
+
+
+def legacy_transform_agent(content: str, ide: str) -> str:
+    """Installer._transform_agent before the renderer"""
+    ide_dir = ".claude/" if ide == "claude" else ".opencode/"
+    frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+    if not frontmatter_match:
+        content = content.replace("{{IDE_CONFIG_DIR}}", ide_dir)
+        if ide == "opencode":
+            content = content.replace(".claude/", ".opencode/")
+        return content
+
+    frontmatter = frontmatter_match.group(1)
+    body = frontmatter_match.group(2)
+    if ide == "opencode":
+        tools_match = re.search(r"^tools:\s*(.+)$", frontmatter, re.MULTILINE)
+        if tools_match:
+            tools = [t.strip() for t in tools_match.group(1).strip().split(",")]
+            opencode_tools = [TOOL_MAPPING[t] for t in tools if TOOL_MAPPING.get(t)]
+            if opencode_tools:
+                tools_yaml = "tools:\n" + "\n".join(f"  {tool}: true" for tool in opencode_tools)
+            else:
+                tools_yaml = "tools: {}"
+            frontmatter = re.sub(r"^tools:\s*.+$", tools_yaml, frontmatter, flags=re.MULTILINE)
+
+    body = body.replace("{{IDE_CONFIG_DIR}}", ide_dir)
+    if ide == "opencode":
+        body = body.replace(".claude/", ".opencode/")
+    return f"---\n{frontmatter}\n---\n{body}"
+
+
+def median_ms(runs: int, func: Callable[[], object]) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the renderer against str.replace.")
+    parser.add_argument("--runs", type=int, default=200, help="runs per timing (median)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer import renderer
+    from ios_spec_driven_installer.installer import Installer, compile_agent
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        installers = [Installer(Path(tmp) / "app", ide=ide, use_cache=False) for ide in IDES]
+
+        # (installer, is agent, relative target, template text) per file and IDE
+        sources: List[Tuple[Installer, bool, Path, str]] = []
+        for installer in installers:
+            _, jobs = installer._plan_content()
+            for _, source, target in jobs:
+                sources.append((
+                    installer,
+                    source.parent.name == "agents",
+                    target.relative_to(installer.target_config_dir),
+                    source.read_text(encoding="utf-8"),
+                ))
+
+        def render_legacy() -> List[str]:
+            return [
+                (legacy_transform_agent if agent else legacy_transform_content)(text, i.ide)
+                for i, agent, _, text in sources
+            ]
+
+        def render_new() -> List[str]:
+            return [
+                (compile_agent(text, i.ide) if agent else renderer.compile_template(text))
+                .render(i.variables)
+                for i, agent, _, text in sources
+            ]
+
+        def render_new_cold() -> List[str]:
+            renderer.compile_template.cache_clear()
+            compile_agent.cache_clear()
+            return render_new()
+
+        # Equivalence on every shipped file, through the installer's own path
+        legacy = render_legacy()
+        rendered = {}
+        for installer in installers:
+            for path, text in installer.render_content().files:
+                rendered[installer.ide, path] = text
+        for (installer, _, path, _), old in zip(sources, legacy):
+            if rendered.get((installer.ide, path)) != old:
+                failures.append(f"{installer.ide} {path.as_posix()}: output differs")
+
+        size = sum(len(text.encode("utf-8")) for _, _, _, text in sources) // len(IDES)
+        print(f"{len(sources) // len(IDES)} templates ({size / 1024:.0f} KiB), both IDEs, "
+              f"median of {args.runs} runs")
+        print(f"{'old replace chain':28s} {median_ms(args.runs, render_legacy):8.2f} ms")
+        print(f"{'new, precompiled':28s} {median_ms(args.runs, render_new):8.2f} ms")
+        print(f"{'new, tokenizing included':28s} {median_ms(args.runs, render_new_cold):8.2f} ms")
+
+        for installer in installers:
+            old = legacy_transform_agent(ESCAPED_AGENT, installer.ide).splitlines()[-1]
+            new = compile_agent(ESCAPED_AGENT, installer.ide).render(installer.variables)
+            new = new.splitlines()[-1]
+            print(f"escaped agent placeholder, {installer.ide}: old {old!r}, new {new!r}")
+            if new != f"Run {installer.variables['IDE_CONFIG_DIR']}scripts/x.py":
+                failures.append(f"{installer.ide}: escaped agent placeholder not rendered")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
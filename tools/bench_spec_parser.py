@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the shared line-oriented spec parser.
+
+Generates synthetic tasks.md files and times spec_parser.parse_tasks (one
+classify_line pass) against the regex-per-pass parsing it replaced: the
+validator's separate registry, checklist and matrix passes, and the status
+hook's MULTILINE registry regex (which backtracks across matrix rows, so it
+only runs up to --legacy-hook-max-tasks). Fails when the old and new parses
+disagree.
+
+Usage (from the repository root):
+    python tools/bench_spec_parser.py
+    python tools/bench_spec_parser.py --tasks 500 5000 50000 --runs 5
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+# The patterns the validator and the hook used before spec_parser, verbatim
+AC_REF = r"\bAC-\d+\.\d+\b"
+DESIGN_REF = r"\b\d+(?:\.\d+)*\b"
+PROPERTY_REF = r"\bP\d+\b"
+LEGACY_REGISTRY_ROW = re.compile(
+    r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*"
+    r"([^|]+?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$"
+)
+LEGACY_CHECKLIST = re.compile(
+    r"^-\s+\[[x\s]\]\s+(?:\*\*)?(\d+(?:\.\d+)+)(?:\*\*)?\s+(.+)$",
+    re.MULTILINE,
+)
+LEGACY_MATRIX_ROW = re.compile(
+    r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$"
+)
+LEGACY_HOOK_REGISTRY = re.compile(
+    r"^\|\s*(\d+(?:\.\d+)+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*"
+    r"([^|]+?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|$",
+    re.MULTILINE,
+)
+
+
+def install_scripts(directory: Path) -> Path:
+    """Install the toolkit into directory; return its rendered scripts/"""
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+    return directory / ".opencode" / "scripts"
+
+
+def synthetic_tasks_md(count: int) -> str:
+    ids = [f"{n // 400 + 1}.{n // 20 % 20 + 1}.{n % 20 + 1}" for n in range(count)]
+    lines = [
+        "# Tasks",
+        "",
+        "## Task Registry",
+        "",
+        "| ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |",
+        "|----|-------|------|--------|---------|-------------|-------|------------|",
+    ]
+    for n, task_id in enumerate(ids):
+        lines.append(
+            f"| {task_id} | Build part {n} | {'pbt' if n % 7 == 0 else 'normal'} | pending "
+            f"| AC-{n % 40 + 1:03d}.{n % 5 + 1}, AC-001.1 | 4.{n % 9 + 1} "
+            f"| `Sources/Part{n}.swift` | {ids[n - n % 10]} |"
+        )
+    lines += ["", "## Checklist", ""]
+    for n, task_id in enumerate(ids):
+        lines.append(f"- [{'x' if n % 3 == 0 else ' '}] **{task_id}** Build part {n}")
+        if n % 10 == 0:
+            lines.append("  Notes: keep the view model free of UIKit.")
+    lines += [
+        "",
+        "## Dependencies",
+        "",
+        "| Task | Depends On | Can Parallel With |",
+        "|------|------------|-------------------|",
+    ]
+    for n, task_id in enumerate(ids[1:], 1):
+        lines.append(f"| {task_id} | {ids[n - 1]} | - |")
+    lines += [
+        "",
+        "## Traceability Matrix",
+        "",
+        "| Task ID | AC | Design | Property | Status |",
+        "|---------|----|--------|----------|--------|",
+    ]
+    for n, task_id in enumerate(ids):
+        ac = f"AC-{n % 40 + 1:03d}.{n % 5 + 1}"
+        lines.append(f"| {task_id} | {ac} | 4.{n % 9 + 1} | P{n % 12 + 1} | pending |")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_validator_parse(content: str) -> Tuple[List, List, List]:
+    """The validator's three regex passes over tasks.md"""
+    registry = []
+    for line in content.splitlines():
+        m = LEGACY_REGISTRY_ROW.match(line.strip())
+        if m:
+            task_id, title, ttype, status, acs, design, _, _ = m.groups()
+            registry.append(
+                (task_id, title.strip(), ttype.strip().lower(), status.strip().lower(),
+                 re.findall(AC_REF, acs), re.findall(DESIGN_REF, design))
+            )
+    checklist = [(m.group(1), m.group(2).strip()) for m in LEGACY_CHECKLIST.finditer(content)]
+    matrix = []
+    for line in content.splitlines():
+        m = LEGACY_MATRIX_ROW.match(line.strip())
+        if m:
+            task_id, acs, design, prop, status = m.groups()
+            matrix.append(
+                (task_id, re.findall(AC_REF, acs), re.findall(DESIGN_REF, design),
+                 re.findall(PROPERTY_REF, prop), status.strip().lower())
+            )
+    return registry, checklist, matrix
+
+
+def shared_validator_parse(spec_parser, content: str) -> Tuple[List, List, List]:
+    """The same data from one spec_parser.parse_tasks pass"""
+    model = spec_parser.parse_tasks(content.splitlines())
+    registry = [
+        (r.task_id, r.title, r.task_type, r.status, r.ac_refs, r.design_refs)
+        for r in model.registry
+    ]
+    checklist = [(c.task_id, c.title) for c in model.checklist]
+    matrix = [
+        (m.task_id, m.ac_refs, m.design_refs, m.property_refs, m.status) for m in model.matrix
+    ]
+    return registry, checklist, matrix
+
+
+def legacy_hook_parse(content: str) -> List[Tuple[str, ...]]:
+    """The hook's MULTILINE registry regex over the whole file"""
+    return [
+        tuple(group.strip() for group in m.groups()) for m in LEGACY_HOOK_REGISTRY.finditer(content)
+    ]
+
+
+def shared_hook_parse(spec_parser, content: str) -> List[Tuple[str, ...]]:
+    return [
+        (r.task_id, r.title, r.task_type, r.status, r.refs_ac, r.refs_design, r.files, r.checkpoint)
+        for r in spec_parser.parse_tasks(content.splitlines()).registry
+    ]
+
+
+def median_ms(runs: int, func: Callable[[], object]) -> Tuple[float, object]:
+    times = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark spec_parser against per-pass regexes.")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 2000, 20000])
+    parser.add_argument("--runs", type=int, default=3, help="runs per timing (median)")
+    parser.add_argument("--legacy-hook-max-tasks", type=int, default=1000,
+                        help="largest spec the backtracking hook regex is timed on")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, str(install_scripts(Path(tmp) / "app")))
+        import spec_parser
+
+        print(f"{'tasks':>7s} {'parser':28s} {'legacy ms':>10s} {'shared ms':>10s}")
+        for count in args.tasks:
+            content = synthetic_tasks_md(count)
+
+            old_ms, old = median_ms(args.runs, lambda: legacy_validator_parse(content))
+            new_ms, new = median_ms(
+                args.runs, lambda: shared_validator_parse(spec_parser, content)
+            )
+            print(f"{count:7d} {'validator registry+list+matrix':28s} {old_ms:10.1f} {new_ms:10.1f}")
+            if old != new:
+                failures.append(f"{count} tasks: validator parses differ")
+
+            new_ms, new = median_ms(args.runs, lambda: shared_hook_parse(spec_parser, content))
+            if count <= args.legacy_hook_max_tasks:
+                old_ms, old = median_ms(1, lambda: legacy_hook_parse(content))
+                print(f"{count:7d} {'hook registry':28s} {old_ms:10.1f} {new_ms:10.1f}")
+                if old != new:
+                    failures.append(f"{count} tasks: hook registry parses differ")
+            else:
+                print(f"{count:7d} {'hook registry':28s} {'skipped':>10s} {new_ms:10.1f}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
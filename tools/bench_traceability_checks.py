@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the traceability cross-reference checks.
+
+Generates specs with as many ACs as tasks (up to 50k by default), seeded
+with broken, missing and orphaned references, and times the check phase of
+validate_traceability.py (reference index plus every _find_* pass, files
+already parsed). Fails when:
+- the time per 1k tasks at the largest size grows more than --max-growth
+  times over the smallest size (the checks should scale linearly), or
+- the issues are not reported in category order (broken, missing,
+  orphaned, warnings), or differ between runs with different hash seeds.
+
+Usage (from the repository root):
+    python tools/bench_traceability_checks.py
+    python tools/bench_traceability_checks.py --sizes 10000 100000 --runs 3
+"""
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+# Report order of issue categories
+CATEGORY_ORDER = ("broken_reference", "missing_reference", "orphaned_item", "warning")
+
+# Time per 1k tasks may grow this much from the smallest to the largest size:
+# room for CPU cache effects, well below the 10x a quadratic pass shows
+MAX_GROWTH = 3.0
+
+# Prints a digest of the issues of one spec, run under a given hash seed
+DIGEST_CHILD = (
+    "import hashlib, sys; sys.path.insert(0, sys.argv[1]); "
+    "import validate_traceability as vt; "
+    "issues = vt.TraceabilityValidator(sys.argv[2], False).validate().issues; "
+    "print(hashlib.sha1(repr([tuple(vars(i).items()) for i in issues]).encode()).hexdigest())"
+)
+
+
+def make_install(directory: Path) -> Path:
+    """Install the toolkit into directory; return its config dir"""
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+    return directory / ".opencode"
+
+
+def write_spec(spec_dir: Path, count: int) -> None:
+    """A spec with count tasks and count ACs, about 1% of each issue kind"""
+    ids = [f"{n // 10000 + 1}.{n // 100 % 100 + 1}.{n % 100 + 1}" for n in range(count)]
+    acs = [f"AC-{n // 5 + 1:05d}.{n % 5 + 1}" for n in range(count)]
+    spec_dir.mkdir(parents=True)
+
+    lines = ["# Requirements", ""]
+    lines += [f"- {ac}: The app keeps working offline." for ac in acs]
+    (spec_dir / "requirements.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    lines = ["# Design", "", "## 4. Data Models", ""]
+    lines += [f"### 4.{section} Model {section}" for section in range(1, 10)]
+    lines += ["", "## 5. Properties", "", "| ID | Property | Refs |", "|----|----|----|"]
+    for prop in range(1, 101):
+        ac = "AC-99999.9" if prop % 25 == 0 else acs[prop * 7 % count]
+        lines.append(f"| P{prop} | Round-trips through storage | {ac} |")
+    (spec_dir / "design.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    registry, checklist, matrix = [], [], []
+    for n, task_id in enumerate(ids):
+        # Every 100th AC is never referenced (orphaned)
+        ac = acs[n] if n % 100 else acs[n - 1]
+        if n % 97 == 0:
+            ac = f"AC-99999.{n % 9 + 1}"  # broken
+        elif n % 53 == 0:
+            ac = ""  # missing
+        design = "9.9" if n % 89 == 0 else ("" if n % 59 == 0 else f"4.{n % 9 + 1}")
+        registry.append(
+            f"| {task_id} | Build part {n} | normal | pending | {ac} | {design} "
+            f"| `Sources/Part{n}.swift` | - |"
+        )
+        checklist.append(f"- [ ] **{task_id}** Build part {n}")
+        matrix_ac = "AC-88888.1" if n % 101 == 0 else ac
+        matrix.append(f"| {task_id} | {matrix_ac} | {design} | P{n % 100 + 1} | pending |")
+    lines = ["# Tasks", "", "## Task Registry", ""]
+    lines += ["| ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |"]
+    lines += ["|----|----|----|----|----|----|----|----|"] + registry
+    lines += ["", "## Checklist", ""] + checklist
+    lines += ["", "## Traceability Matrix", ""]
+    lines += ["| Task ID | AC | Design | Property | Status |", "|----|----|----|----|----|"]
+    lines += matrix
+    (spec_dir / "tasks.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def issue_digest(project: Path, scripts_dir: Path, spec_name: str, hash_seed: str) -> str:
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-c", DIGEST_CHILD, str(scripts_dir), spec_name],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that traceability checks scale linearly.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 10000, 25000, 50000],
+                        help="ACs and tasks per spec")
+    parser.add_argument("--runs", type=int, default=5, help="runs per size (best of)")
+    parser.add_argument("--max-growth", type=float, default=MAX_GROWTH)
+    args = parser.parse_args()
+    sizes = sorted(args.sizes)
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp) / "app"
+        config_dir = make_install(project)
+        scripts_dir = config_dir / "scripts"
+        for size in sizes:
+            write_spec(config_dir / "specs" / f"spec{size}", size)
+
+        os.chdir(project)  # the validator resolves specs/ relative to the project
+        sys.path.insert(0, str(scripts_dir))
+        import validate_traceability
+
+        print(f"{'ACs/tasks':>9s} {'checks ms':>10s} {'ms per 1k':>10s} {'issues':>7s}")
+        per_1k = []
+        for size in sizes:
+            validator = validate_traceability.TraceabilityValidator(f"spec{size}", False)
+            issues = validator.validate().issues  # parses the files
+            best = float("inf")
+            # Like timeit: the collector's passes over the parsed model are
+            # not part of the checks
+            gc.disable()
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                # No file changed: index and check only
+                rerun = list(validator._iter_issues(changed=set()))
+                best = min(best, time.perf_counter() - started)
+            gc.enable()
+            per_1k.append(best * 1000 / (size / 1000))
+            print(f"{size:9d} {best * 1000:10.1f} {per_1k[-1]:10.2f} {len(issues):7d}")
+
+            categories = [CATEGORY_ORDER.index(issue.category) for issue in issues]
+            if categories != sorted(categories):
+                failures.append(f"{size}: issues are not in category order")
+            if set(categories) != set(range(len(CATEGORY_ORDER))):
+                failures.append(f"{size}: spec does not produce every issue category")
+            if [vars(i) for i in rerun] != [vars(i) for i in issues]:
+                failures.append(f"{size}: a re-run reported different issues")
+        os.chdir(ROOT)
+
+        # Sets must not leak into the report order: vary the string hash seed
+        digests = {
+            issue_digest(project, scripts_dir, f"spec{sizes[0]}", seed)
+            for seed in ("1", "2", "3")
+        }
+        if len(digests) != 1:
+            failures.append(f"spec{sizes[0]}: issue order depends on the hash seed")
+
+    growth = per_1k[-1] / per_1k[0]
+    print(f"growth per 1k tasks {sizes[0]} -> {sizes[-1]}: {growth:.2f}x "
+          f"(max {args.max_growth:g}x)")
+    if growth > args.max_growth:
+        failures.append(f"checks grew {growth:.2f}x per 1k tasks; expected linear scaling")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
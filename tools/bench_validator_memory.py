@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for validate_traceability.py on a large spec.
+
+Generates a synthetic spec (100k tasks by default) in a temp install and
+reports tracemalloc's peak and retained memory for TraceabilityValidator:
+cold without the parse cache, cold while writing it, and warm from it. The
+retained figure is the validator's model of the spec. The run fails when
+the streaming parse (cold, no cache) peaks more than --max-overhead-mib
+above it; the cache runs are reported for comparison only, since a cache
+hit loads each file's parse as one JSON document.
+
+Usage (from the repository root):
+    python tools/bench_validator_memory.py
+    python tools/bench_validator_memory.py --tasks 200000 --max-overhead-mib 96
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+SPEC_NAME = "large"
+
+# Peak above the retained model allowed for the streaming parse
+MAX_OVERHEAD_MIB = 64
+
+MIB = 1024 * 1024
+
+
+def make_install(directory: Path) -> Path:
+    """Install the toolkit into directory; return its config dir"""
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+    return directory / ".opencode"
+
+
+def write_spec(spec_dir: Path, count: int) -> None:
+    ids = [f"{n // 10000 + 1}.{n // 100 % 100 + 1}.{n % 100 + 1}" for n in range(count)]
+    acs = [f"AC-{n // 5 + 1:05d}.{n % 5 + 1}" for n in range(count // 2)]
+    spec_dir.mkdir(parents=True)
+
+    with open(spec_dir / "requirements.md", "w", encoding="utf-8") as f:
+        f.write("# Requirements\n\n")
+        for ac in acs:
+            f.write(f"- {ac}: The app shows the item list within one second.\n")
+
+    with open(spec_dir / "design.md", "w", encoding="utf-8") as f:
+        f.write("# Design\n\n## 4. Data Models\n\n")
+        for section in range(1, 10):
+            f.write(f"### 4.{section} Model {section}\n\nStored in SwiftData.\n\n")
+        f.write("## 5. Properties\n\n| ID | Property | Refs |\n|----|----------|------|\n")
+        for prop in range(1, 51):
+            f.write(f"| P{prop} | Round-trips through storage | {acs[prop]} |\n")
+
+    with open(spec_dir / "tasks.md", "w", encoding="utf-8") as f:
+        f.write("# Tasks\n\n## Task Registry\n\n")
+        f.write("| ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |\n")
+        f.write("|----|-------|------|--------|---------|-------------|-------|------------|\n")
+        for n, task_id in enumerate(ids):
+            f.write(
+                f"| {task_id} | Build part {n} | normal | pending | {acs[n % len(acs)]} "
+                f"| 4.{n % 9 + 1} | `Sources/Part{n}.swift` | - |\n"
+            )
+        f.write("\n## Checklist\n\n")
+        for n, task_id in enumerate(ids):
+            f.write(f"- [ ] **{task_id}** Build part {n}\n")
+        f.write("\n## Traceability Matrix\n\n")
+        f.write("| Task ID | AC | Design | Property | Status |\n")
+        f.write("|---------|----|--------|----------|--------|\n")
+        for n, task_id in enumerate(ids):
+            ac = acs[n % len(acs)]
+            f.write(f"| {task_id} | {ac} | 4.{n % 9 + 1} | P{n % 50 + 1} | pending |\n")
+
+
+def measure(validate_traceability, use_cache: bool) -> Tuple[int, int]:
+    """Validate once; return (peak, retained) bytes"""
+    gc.collect()
+    tracemalloc.start()
+    validator = validate_traceability.TraceabilityValidator(SPEC_NAME, use_cache)
+    result = validator.validate()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del validator, result
+    return peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure validator memory on a large spec.")
+    parser.add_argument("--tasks", type=int, default=100_000, help="tasks in the spec")
+    parser.add_argument("--max-overhead-mib", type=float, default=MAX_OVERHEAD_MIB)
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp) / "app"
+        config_dir = make_install(project)
+        spec_dir = config_dir / "specs" / SPEC_NAME
+        write_spec(spec_dir, args.tasks)
+        sizes = ", ".join(
+            f"{path.name} {path.stat().st_size / MIB:.1f} MiB"
+            for path in sorted(spec_dir.glob("*.md"))
+        )
+        print(f"{args.tasks} tasks: {sizes}")
+
+        os.chdir(project)  # the validator resolves specs/ relative to the project
+        sys.path.insert(0, str(config_dir / "scripts"))
+        import validate_traceability
+
+        print(f"{'run':24s} {'peak MiB':>9s} {'retained MiB':>13s} {'overhead MiB':>13s}")
+        runs = [
+            ("cold, no cache", False, True),
+            ("cold, writing cache", True, False),
+            ("warm, from cache", True, False),
+        ]
+        for label, use_cache, gated in runs:
+            peak, retained = measure(validate_traceability, use_cache)
+            overhead = (peak - retained) / MIB
+            print(f"{label:24s} {peak / MIB:9.1f} {retained / MIB:13.1f} {overhead:13.1f}")
+            if gated and overhead > args.max_overhead_mib:
+                failures.append(f"{label}: peak {overhead:.1f} MiB above the retained model")
+        os.chdir(ROOT)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
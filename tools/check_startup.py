@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Startup budget for the ios-spec-driven CLI.
+
+Runs CLI commands under `python -X importtime` and fails when:
+- importing ios_spec_driven_installer.cli takes longer than the budget
+  (median over several runs), or
+- a command imports a module it is not supposed to need (rich for plain
+  output, importlib.metadata, the thread pool or OpenSSL for status).
+
+Usage (from the repository root):
+    python tools/check_startup.py
+    python tools/check_startup.py --runs 9 --budget-ms 150
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+CLI_MODULE = "ios_spec_driven_installer.cli"
+
+# Cumulative import time of CLI_MODULE, measured on a 1-CPU CI runner
+# (click alone is about half of it). Raise deliberately, not casually.
+IMPORT_BUDGET_MS = 120
+
+# Heavy modules and the commands that must not import them
+LAZY_MODULES = ("rich", "importlib.metadata", "concurrent.futures", "hashlib")
+
+RUN_CLI = (
+    "import sys; sys.argv[0] = 'ios-spec-driven'; "
+    "from ios_spec_driven_installer.cli import main; main()"
+)
+
+
+def import_times(args: List[str]) -> Dict[str, int]:
+    """Run the CLI with args; return module -> cumulative import time (us)"""
+    env = dict(os.environ, PYTHONPATH=str(SRC), PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_CLI, *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def make_install(directory: Path) -> None:
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check CLI import time against a budget.")
+    parser.add_argument("--runs", type=int, default=7, help="runs per command (median)")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "app"
+        make_install(target)
+        commands: List[Tuple[str, List[str]]] = [
+            ("--version", ["--version"]),
+            ("--help", ["--help"]),
+            ("--plain status", ["--plain", "status", str(target), "--ide", "opencode"]),
+        ]
+
+        for label, cli_args in commands:
+            runs = [import_times(cli_args) for _ in range(args.runs)]
+            if any(CLI_MODULE not in run for run in runs):
+                failures.append(f"{label}: could not import {CLI_MODULE}")
+                continue
+            median_ms = statistics.median(run[CLI_MODULE] for run in runs) / 1000
+            loaded = [
+                lazy for lazy in LAZY_MODULES
+                if any(name == lazy or name.startswith(lazy + ".") for name in runs[0])
+            ]
+            print(f"{label:16s} import {median_ms:6.1f} ms  (budget {args.budget_ms:.0f} ms)")
+            if median_ms > args.budget_ms:
+                failures.append(f"{label}: import took {median_ms:.1f} ms")
+            for lazy in loaded:
+                failures.append(f"{label}: imported {lazy}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
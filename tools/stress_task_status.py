@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Stress test for concurrent tasks.md updates by the status hook.
+
+Installs the toolkit into a temp project with one spec, then starts many
+task_status_client.py processes at once, each marking a different task
+done. Fails unless every Task Registry row, checklist item and Traceability
+Matrix row flipped exactly once and nothing else in tasks.md changed, i.e.
+no update was lost to a concurrent read-modify-write.
+
+Usage (from the repository root):
+    python tools/stress_task_status.py
+    python tools/stress_task_status.py --processes 120 --tasks 2000
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+SPEC_NAME = "stress"
+
+
+def make_install(directory: Path) -> Path:
+    """Install the toolkit into directory; return its config dir"""
+    sys.path.insert(0, str(SRC))
+    from ios_spec_driven_installer.installer import Installer
+
+    Installer(directory, ide="opencode", use_cache=False).install()
+    return directory / ".opencode"
+
+
+def task_ids(count: int) -> List[str]:
+    return [f"{n // 100 + 1}.{n % 100 + 1}" for n in range(count)]
+
+
+def render_tasks(ids: List[str], done: Set[str]) -> str:
+    """tasks.md with the tasks in done marked done in all three places"""
+    lines = [
+        "# Tasks",
+        "",
+        "## Task Registry",
+        "",
+        "| ID | Title | Type | Status | Refs AC | Refs Design | Files | Checkpoint |",
+        "|----|-------|------|--------|---------|-------------|-------|------------|",
+    ]
+    for n, task_id in enumerate(ids):
+        status = "done" if task_id in done else "pending"
+        lines.append(
+            f"| {task_id} | Task {task_id} | impl | {status} | AC-001.{n % 9 + 1} | 4.1 "
+            f"| Sources/Stress/Task{n}.swift | - |"
+        )
+    lines += ["", "## Checklist", ""]
+    for task_id in ids:
+        mark = "x" if task_id in done else " "
+        lines.append(f"- [{mark}] **{task_id}** Task {task_id}")
+    lines += [
+        "",
+        "## Traceability Matrix",
+        "",
+        "| Task ID | AC | Design | Property | Status |",
+        "|---------|----|--------|----------|--------|",
+    ]
+    for n, task_id in enumerate(ids):
+        status = "done" if task_id in done else "pending"
+        lines.append(f"| {task_id} | AC-001.{n % 9 + 1} | 4.1 | P1 | {status} |")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hammer one tasks.md from many hook processes.")
+    parser.add_argument("--processes", type=int, default=60, help="concurrent hook processes")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks in tasks.md")
+    args = parser.parse_args()
+    if args.processes > args.tasks:
+        parser.error("--processes must not exceed --tasks")
+
+    ids = task_ids(args.tasks)
+    # Spread the updated rows over the whole file
+    targets = ids[:: args.tasks // args.processes][: args.processes]
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp) / "app"
+        config_dir = make_install(project)
+        tasks_file = config_dir / "specs" / SPEC_NAME / "tasks.md"
+        tasks_file.parent.mkdir(parents=True)
+        tasks_file.write_text(render_tasks(ids, set()), encoding="utf-8")
+
+        client = config_dir / "hooks" / "task_status_client.py"
+        started = time.perf_counter()
+        procs = []
+        for task_id in targets:
+            proc = subprocess.Popen(
+                [sys.executable, str(client)],
+                cwd=project,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            payload = {"action": "mark_done", "task_id": task_id, "spec_name": SPEC_NAME}
+            proc.stdin.write(json.dumps(payload).encode("utf-8"))
+            proc.stdin.close()
+            procs.append((task_id, proc))
+
+        durations = []
+        for task_id, proc in procs:
+            stdout = proc.stdout.read().decode("utf-8", "replace")
+            stderr = proc.stderr.read().decode("utf-8", "replace")
+            proc.wait()
+            durations.append(time.perf_counter() - started)
+            if proc.returncode != 0 or f"Task {task_id} marked as done" not in stdout:
+                failures.append(f"{task_id}: exit {proc.returncode} {stderr.strip()[-200:]}")
+
+        expected = render_tasks(ids, set(targets)).splitlines()
+        actual = tasks_file.read_text(encoding="utf-8").splitlines()
+
+    if len(actual) != len(expected):
+        failures.append(f"tasks.md has {len(actual)} lines, expected {len(expected)}")
+    for line_no, (got, want) in enumerate(zip(actual, expected), 1):
+        if got != want:
+            failures.append(f"line {line_no}: {got!r}, expected {want!r}")
+
+    print(f"{len(targets)} processes, {args.tasks} tasks")
+    print(f"finished p50 {statistics.median(durations) * 1000:7.0f} ms")
+    print(f"finished max {max(durations) * 1000:7.0f} ms")
+    for failure in failures[:20]:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()